@@ -0,0 +1,25 @@
+"""add (updated_at, id) indexes for delta sync
+
+Revision ID: 5e1a7c9d3b24
+Revises: 3c7d9f5b2a11
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '5e1a7c9d3b24'
+down_revision = '3c7d9f5b2a11'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_issues_updated_at_id', 'issues', ['updated_at', 'id'])
+    op.create_index('ix_comments_updated_at_id', 'comments', ['updated_at', 'id'])
+
+
+def downgrade():
+    op.drop_index('ix_comments_updated_at_id', table_name='comments')
+    op.drop_index('ix_issues_updated_at_id', table_name='issues')
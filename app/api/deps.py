@@ -5,6 +5,9 @@ from jose import JWTError
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.session import get_db
 from app.core.config import settings
+from app.core.request_timing import timed
+from app.core.logging import bind_request_context
+from app.middlewares.metrics import route_template
 
 from app.models.user import User, UserRole
 from app.repositories.user import UserRepository
@@ -13,20 +16,29 @@ from app.core.token_service import decode_and_validate, logout_all_devices
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_STR}/auth/login")
 
+
+async def bind_route(request: Request) -> None:
+    """App-wide dependency: tag the request's log lines with the matched route template."""
+    bind_request_context(route=route_template(request.scope))
+
 async def get_current_user(
     db: AsyncSession = Depends(get_db),
     token: str = Depends(oauth2_scheme)
 ) -> User:
-    payload = await decode_and_validate(token, expected_type="access")
-    user_id = int(payload["sub"])
+    with timed("auth"):
+        payload = await decode_and_validate(token, expected_type="access")
+        user_id = int(payload["sub"])
 
-    user_repo = UserRepository(db)
-    user = await user_repo.get_by_id(user_id)
+        user_repo = UserRepository(db)
+        # Always read from the database: a cached row could still show a user
+        # another worker has just deactivated or demoted.
+        user = await user_repo.get_by_id(user_id, cached=False)
     if not user:
         raise EntityNotFoundException("User", identifier=user_id)
 
     if not user.is_active:
         raise AuthenticationFailedException("Inactive user")
+    bind_request_context(user_id=user.id)
 
     # Align legacy flag with role enum for downstream permission checks
     try:
@@ -1,5 +1,5 @@
 from fastapi import APIRouter
-from app.api.v1.endpoints import auth, projects, issues, comments, users
+from app.api.v1.endpoints import auth, projects, issues, comments, users, admin, events
 
 api_router = APIRouter()
 api_router.include_router(auth.router, prefix="/auth", tags=["auth"])
@@ -7,3 +7,5 @@ api_router.include_router(projects.router, prefix="/projects", tags=["projects"]
 api_router.include_router(issues.router, prefix="/issues", tags=["issues"])
 api_router.include_router(comments.router, prefix="/comments", tags=["comments"])
 api_router.include_router(users.router, prefix="/users", tags=["users"])
+api_router.include_router(admin.router, prefix="/admin", tags=["admin"])
+api_router.include_router(events.router, prefix="/events", tags=["events"])
@@ -0,0 +1,82 @@
+import asyncio
+import threading
+from typing import Any
+from fastapi import APIRouter, Depends, Path, Query
+from fastapi.responses import PlainTextResponse
+from app.api import deps
+from app.core.config import settings
+from app.core.exceptions import EntityNotFoundException
+from app.core.profiler import PROFILE_TOKEN_HEADER, Sampler, issue_profile_token, load_profile, save_profile, to_speedscope
+from app.core.serialization import FastJSONResponse
+from app.core.cache import entity_cache, issue_list_cache
+from app.core.singleflight import issue_list_flight, project_flight
+from app.models.user import User
+
+router = APIRouter()
+
+@router.get("/cache")
+async def read_cache_stats(
+    current_user: User = Depends(deps.get_current_active_admin),
+) -> Any:
+    """
+    Hit-ratio and invalidation counters for the caches of this worker.
+    """
+    return {
+        "entity_cache": entity_cache.stats(),
+        "issue_list_cache": issue_list_cache.stats(),
+    }
+
+@router.get("/singleflight")
+async def read_single_flight_stats(
+    current_user: User = Depends(deps.get_current_active_admin),
+) -> Any:
+    """
+    Reads executed vs. collapsed onto an identical in-flight read, per worker.
+    """
+    return {flight.namespace: flight.stats() for flight in (issue_list_flight, project_flight)}
+
+@router.post("/profiles")
+async def capture_profile(
+    seconds: float = Query(10, gt=0, le=settings.PROFILE_MAX_WINDOW_SECONDS),
+    interval_ms: float = Query(settings.PROFILE_INTERVAL_MS, ge=1, le=100),
+    current_user: User = Depends(deps.get_current_active_admin),
+) -> Any:
+    """
+    Sample everything this worker's event loop runs for ``seconds`` and store
+    it as a profile. Idle time shows up as the loop's selector wait.
+    """
+    sampler = Sampler(threading.get_ident(), interval=interval_ms / 1000).start()
+    try:
+        await asyncio.sleep(seconds)
+    finally:
+        await asyncio.to_thread(sampler.stop)
+    return await save_profile(sampler, f"window {seconds:g}s")
+
+@router.post("/profiles/token")
+async def create_profile_token(
+    current_user: User = Depends(deps.get_current_active_admin),
+) -> Any:
+    """
+    Short-lived token: requests sent with it in ``X-Profile-Token`` are
+    profiled individually and answer with ``X-Profile-Id``.
+    """
+    token, expires = issue_profile_token()
+    return {"token": token, "expires_at": expires, "header": PROFILE_TOKEN_HEADER.decode().title()}
+
+@router.get("/profiles/{profile_id}")
+async def read_profile(
+    profile_id: str = Path(..., pattern="^[0-9a-f]{32}$"),
+    format: str = Query("collapsed", pattern="^(collapsed|speedscope)$"),
+    current_user: User = Depends(deps.get_current_active_admin),
+) -> Any:
+    """
+    A stored profile as collapsed stacks (flamegraph.pl, speedscope) or as a
+    speedscope JSON document.
+    """
+    stored = await load_profile(profile_id)
+    if stored is None:
+        raise EntityNotFoundException("Profile", identifier=profile_id)
+    meta, collapsed = stored
+    if format == "speedscope":
+        return FastJSONResponse(to_speedscope(collapsed, meta["label"], meta["interval_ms"] / 1000))
+    return PlainTextResponse(collapsed)
@@ -6,12 +6,13 @@ from app.api import deps
 from app.services.auth_service import AuthService
 from app.schemas.user import UserCreate, UserResponse, Token
 from app.core.rate_limit import RateLimiter
+from app.core.config import settings
 
 router = APIRouter()
 
-# Rate limit login: 5 per minute
-login_limiter = RateLimiter(times=5, seconds=60)
-refresh_limiter = RateLimiter(times=10, seconds=60)
+# Rate limit login: 5 per minute by default
+login_limiter = RateLimiter(times=settings.LOGIN_RATE_LIMIT_PER_MINUTE, seconds=60, name="login")
+refresh_limiter = RateLimiter(times=settings.REFRESH_RATE_LIMIT_PER_MINUTE, seconds=60, name="refresh")
 
 @router.post("/login", response_model=Token, dependencies=[Depends(login_limiter)])
 async def login_access_token(
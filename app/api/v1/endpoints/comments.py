@@ -2,8 +2,13 @@ from typing import Any, List
 from fastapi import APIRouter, Depends, Path, Query, Body
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.api import deps
-from app.schemas.comment import CommentCreate, CommentResponse
+from app.core.config import settings
+from app.core.exceptions import InvalidOperationException
+from app.core.serialization import FastJSONResponse, dump_rows, fast_json_response
+from app.schemas.comment import CommentCreate, CommentResponse, IssueComments
+from app.schemas.sync import CommentChanges
 from app.services.comment_service import CommentService
+from app.services.sync_service import SyncService
 from app.models.user import User
 
 router = APIRouter()
@@ -17,7 +22,55 @@ async def read_comments(
     current_user: User = Depends(deps.get_current_user),
 ) -> Any:
     service = CommentService(db)
-    return await service.get_comments(issue_id, skip=skip, limit=limit)
+    comments = await service.get_comments(issue_id, skip=skip, limit=limit)
+    if settings.FAST_JSON_RESPONSES:
+        return fast_json_response(comments, CommentResponse)
+    return comments
+
+MAX_BATCH_ISSUES = 100
+
+
+def _parse_issue_ids(raw: str) -> List[int]:
+    try:
+        ids = list(dict.fromkeys(int(part) for part in raw.split(",") if part.strip()))
+    except ValueError:
+        raise InvalidOperationException("issue_ids must be a comma-separated list of integers")
+    if not ids or any(issue_id <= 0 for issue_id in ids):
+        raise InvalidOperationException("issue_ids must contain positive integers")
+    if len(ids) > MAX_BATCH_ISSUES:
+        raise InvalidOperationException(f"At most {MAX_BATCH_ISSUES} issue ids per request")
+    return ids
+
+@router.get("/batch", response_model=List[IssueComments])
+async def read_comments_batch(
+    issue_ids: str = Query(..., description="Comma-separated issue ids", examples=["10,11,12"]),
+    limit: int = Query(3, gt=0, le=20, description="Latest comments returned per issue"),
+    db: AsyncSession = Depends(deps.get_db),
+    current_user: User = Depends(deps.get_current_user),
+) -> Any:
+    """
+    Latest ``limit`` comments for each of many issues, newest first, in the
+    order the ids were given. Replaces one ``GET /comments`` per list row.
+    """
+    ids = _parse_issue_ids(issue_ids)
+    service = CommentService(db)
+    latest = await service.get_latest_comments(ids, limit)
+    return FastJSONResponse(
+        [{"issue_id": issue_id, "comments": dump_rows(latest.get(issue_id, []), CommentResponse)} for issue_id in ids]
+    )
+
+@router.get("/changes", response_model=CommentChanges)
+async def read_comment_changes(
+    since: str | None = Query(None, description="Cursor returned by the previous call; omit to start from the beginning"),
+    limit: int = Query(500, gt=0, le=1000),
+    db: AsyncSession = Depends(deps.get_db),
+    current_user: User = Depends(deps.get_current_user),
+) -> Any:
+    """
+    Comments created or edited after ``since``, oldest first, plus tombstones
+    for archived projects. Omit ``since`` for the initial full sync.
+    """
+    return await SyncService(db).comment_changes(since, limit)
 
 @router.post("/", response_model=CommentResponse)
 async def create_comment(
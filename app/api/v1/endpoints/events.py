@@ -0,0 +1,53 @@
+from typing import Any, List
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.api import deps
+from app.core.config import settings
+from app.core.events import event_broker
+from app.core.exceptions import EntityNotFoundException, InvalidOperationException
+from app.repositories.project import ProjectRepository
+from app.models.user import User
+
+router = APIRouter()
+
+MAX_STREAM_PROJECTS = 50
+
+
+def _parse_project_ids(raw: str | None) -> List[int]:
+    if raw is None:
+        return []
+    try:
+        ids = list(dict.fromkeys(int(part) for part in raw.split(",") if part.strip()))
+    except ValueError:
+        raise InvalidOperationException("project_ids must be a comma-separated list of integers")
+    if len(ids) > MAX_STREAM_PROJECTS:
+        raise InvalidOperationException(f"At most {MAX_STREAM_PROJECTS} projects per stream")
+    return ids
+
+@router.get("/", response_class=StreamingResponse)
+async def stream_events(
+    project_ids: str | None = Query(None, description="Comma-separated project ids; omit for every project", examples=["1,2"]),
+    db: AsyncSession = Depends(deps.get_db),
+    current_user: User = Depends(deps.get_current_user),
+) -> Any:
+    """
+    Server-Sent Events stream of ``issue.created``, ``issue.updated``,
+    ``comment.created`` and ``comment.updated``. A ``resync`` event means the
+    client fell behind: catch up from ``/changes`` and reconnect.
+    """
+    ids = _parse_project_ids(project_ids)
+    if ids:
+        active = await ProjectRepository(db).get_active_ids(ids)
+        missing = sorted(set(ids) - active)
+        if missing:
+            raise EntityNotFoundException(entity_name="Project", identifier=", ".join(map(str, missing)))
+    # The stream never touches the database again; hand the connection back
+    # to the pool instead of holding it for the life of the stream.
+    await db.close()
+
+    return StreamingResponse(
+        event_broker.stream(ids or None, settings.EVENTS_HEARTBEAT_SECONDS),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
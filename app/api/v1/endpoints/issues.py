@@ -1,14 +1,79 @@
-from typing import Any, List
-from fastapi import APIRouter, Depends, Path, Query
+from typing import Any, Dict, List, Sequence
+from fastapi import APIRouter, Depends, Path, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.api import deps
-from app.schemas.issue import IssueCreate, IssueUpdate, IssueResponse
-from app.services.issue_service import IssueService
+from app.core.config import settings
+from app.core.exceptions import InvalidOperationException
+from app.core.serialization import (
+    FastJSONResponse,
+    dump_row,
+    dump_rows,
+    fast_json_item,
+    fast_json_response,
+    parse_fields,
+    response_fields,
+)
+from app.schemas.comment import CommentResponse
+from app.schemas.issue import (
+    IssueBatchResponse,
+    IssueBatchUpdate,
+    IssueCreate,
+    IssueImportReport,
+    IssueResponse,
+    IssueUpdate,
+)
+from app.schemas.project import ProjectResponse
+from app.schemas.sync import IssueChanges
+from app.schemas.user import UserSummary
+from app.services.issue_service import IssueService, ISSUE_INCLUDES
+from app.services.import_service import IssueImportService
+from app.services.sync_service import SyncService
 from app.models.user import User
 from app.models.issue import IssueStatus
 
 router = APIRouter()
 
+FIELDS_DESCRIPTION = "Comma-separated subset of response fields; only these columns are loaded"
+SINCE_DESCRIPTION = "Cursor returned by the previous call; omit to start from the beginning"
+INCLUDE_DESCRIPTION = "Comma-separated related resources to embed: comments,reporter,assignee,project"
+
+INCLUDE_SCHEMAS = {
+    "comments": CommentResponse,
+    "reporter": UserSummary,
+    "assignee": UserSummary,
+    "project": ProjectResponse,
+}
+
+
+def _parse_include(raw: str | None) -> tuple[str, ...]:
+    if raw is None:
+        return ()
+    requested = {name.strip() for name in raw.split(",") if name.strip()}
+    unknown = requested - set(ISSUE_INCLUDES)
+    if unknown:
+        raise InvalidOperationException(f"Unknown include: {', '.join(sorted(unknown))}")
+    return tuple(name for name in ISSUE_INCLUDES if name in requested)
+
+
+def _load_fields(selected: Sequence[str] | None, include: Sequence[str]) -> tuple[str, ...] | None:
+    # Sparse fieldsets still need the columns the includes are resolved from.
+    if selected is None:
+        return None
+    return tuple(dict.fromkeys([*selected, *(ISSUE_INCLUDES[name] for name in include)]))
+
+
+def _render_issues(issues, selected, loaded: Dict[str, Dict[int, Any]]) -> List[Dict[str, Any]]:
+    rows = dump_rows(issues, IssueResponse, selected)
+    for row, issue in zip(rows, issues):
+        for name, related in loaded.items():
+            schema = INCLUDE_SCHEMAS[name]
+            value = related.get(getattr(issue, ISSUE_INCLUDES[name]))
+            if name == "comments":
+                row[name] = dump_rows(value or [], schema)
+            else:
+                row[name] = dump_row(value, response_fields(schema)) if value is not None else None
+    return rows
+
 @router.get("/", response_model=List[IssueResponse])
 async def read_issues(
     db: AsyncSession = Depends(deps.get_db),
@@ -20,12 +85,17 @@ async def read_issues(
     sort: str = Query("created_at", description="created_at,-created_at,severity,-severity,title,-title", examples=["-created_at"]),
     page: int = Query(1, ge=1),
     limit: int = Query(20, gt=0, le=100),
+    fields: str | None = Query(None, description=FIELDS_DESCRIPTION, examples=["id,title,status,severity"]),
+    include: str | None = Query(None, description=INCLUDE_DESCRIPTION, examples=["comments,assignee"]),
+    comments_limit: int = Query(3, gt=0, le=20, description="Latest comments embedded per issue"),
     current_user: User = Depends(deps.get_current_user),
 ) -> Any:
+    selected = parse_fields(fields, IssueResponse)
+    included = _parse_include(include)
     service = IssueService(db)
     skip = (page - 1) * limit
     safe_sort = sort if sort in {"created_at", "-created_at", "severity", "-severity", "title", "-title"} else "created_at"
-    return await service.get_issues(
+    issues = await service.get_issues(
         project_id=project_id,
         status=status,
         severity=severity,
@@ -34,7 +104,14 @@ async def read_issues(
         skip=skip,
         limit=limit,
         sort=safe_sort,
+        fields=_load_fields(selected, included),
     )
+    if included:
+        loaded = await service.load_includes(issues, included, comments_limit)
+        return FastJSONResponse(_render_issues(issues, selected, loaded))
+    if selected or settings.FAST_JSON_RESPONSES:
+        return fast_json_response(issues, IssueResponse, selected)
+    return issues
 
 @router.post("/", response_model=IssueResponse)
 async def create_issue(
@@ -47,14 +124,70 @@ async def create_issue(
     service = IssueService(db)
     return await service.create_issue(issue_in, current_user)
 
+@router.post("/import", response_model=IssueImportReport)
+async def import_issues(
+    request: Request,
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$", description="ndjson or csv"),
+    batch_size: int = Query(1000, ge=1, le=10000),
+    db: AsyncSession = Depends(deps.get_db),
+    current_user: User = Depends(deps.get_current_user),
+) -> Any:
+    """
+    Bulk-create issues from an NDJSON or CSV request body. The body is parsed
+    as it streams in; rows that fail validation are reported by line number.
+    """
+    service = IssueImportService(db, batch_size=batch_size)
+    return await service.import_stream(request.stream(), format, current_user)
+
+@router.get("/changes", response_model=IssueChanges)
+async def read_issue_changes(
+    since: str | None = Query(None, description=SINCE_DESCRIPTION),
+    limit: int = Query(500, gt=0, le=1000),
+    db: AsyncSession = Depends(deps.get_db),
+    current_user: User = Depends(deps.get_current_user),
+) -> Any:
+    """
+    Issues created or updated after ``since``, oldest first, plus tombstones
+    for archived projects. Omit ``since`` for the initial full sync.
+    """
+    return await SyncService(db).issue_changes(since, limit)
+
+@router.patch("/batch", response_model=IssueBatchResponse)
+async def batch_update_issues(
+    *,
+    db: AsyncSession = Depends(deps.get_db),
+    batch_in: IssueBatchUpdate,
+    current_user: User = Depends(deps.get_current_user),
+) -> Any:
+    """
+    Apply ``IssueUpdate`` operations to many issues in one transaction.
+    Each operation is validated independently and reported with its own
+    status code; the valid ones are committed together.
+    """
+    service = IssueService(db)
+    results = await service.batch_update_issues(batch_in.operations, current_user)
+    updated = sum(1 for result in results if result.issue is not None)
+    return IssueBatchResponse(updated=updated, failed=len(results) - updated, results=results)
+
 @router.get("/{issue_id}", response_model=IssueResponse)
 async def read_issue(
     issue_id: int = Path(..., gt=0, title="The ID of the issue to get", examples=[10]),
     db: AsyncSession = Depends(deps.get_db),
+    fields: str | None = Query(None, description=FIELDS_DESCRIPTION, examples=["id,title,status,severity"]),
+    include: str | None = Query(None, description=INCLUDE_DESCRIPTION, examples=["comments,assignee"]),
+    comments_limit: int = Query(3, gt=0, le=20, description="Latest comments embedded"),
     current_user: User = Depends(deps.get_current_user),
 ) -> Any:
+    selected = parse_fields(fields, IssueResponse)
+    included = _parse_include(include)
     service = IssueService(db)
-    return await service.get_issue(issue_id)
+    issue = await service.get_issue(issue_id, fields=_load_fields(selected, included))
+    if included:
+        loaded = await service.load_includes([issue], included, comments_limit)
+        return FastJSONResponse(_render_issues([issue], selected, loaded)[0])
+    if selected:
+        return fast_json_item(issue, IssueResponse, selected)
+    return issue
 
 @router.put("/{issue_id}", response_model=IssueResponse)
 async def update_issue(
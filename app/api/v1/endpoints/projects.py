@@ -1,9 +1,15 @@
 from typing import Any, List
-from fastapi import APIRouter, Depends, Path, Query
+from fastapi import APIRouter, Depends, Path, Query, Request
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.api import deps
+from app.core.config import settings
+from app.core.serialization import fast_json_response, gzip_stream
 from app.schemas.project import ProjectCreate, ProjectUpdate, ProjectResponse
 from app.services.project_service import ProjectService
+from app.services.export_service import IssueExportService, EXPORT_FORMATS
+from app.services.webhook_service import WebhookService
+from app.schemas.webhook import WebhookCreate, WebhookCreated, WebhookResponse
 from app.models.user import User
 
 router = APIRouter()
@@ -20,13 +26,16 @@ async def read_projects(
 ) -> Any:
     service = ProjectService(db)
     skip = (page - 1) * limit
-    return await service.get_projects(
+    projects = await service.get_projects(
         skip=skip,
         limit=limit,
         search=search,
         include_archived=is_archived,
         sort=sort if sort in {"name", "-name", "created_at", "-created_at"} else "created_at",
     )
+    if settings.FAST_JSON_RESPONSES:
+        return fast_json_response(projects, ProjectResponse)
+    return projects
 
 @router.post("/", response_model=ProjectResponse)
 async def create_project(
@@ -47,6 +56,26 @@ async def read_project(
     service = ProjectService(db)
     return await service.get_project(project_id)
 
+@router.get("/{project_id}/issues/export", response_class=StreamingResponse)
+async def export_project_issues(
+    request: Request,
+    project_id: int = Path(..., gt=0, title="The ID of the project to export", examples=[1]),
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$", description="ndjson or csv"),
+    db: AsyncSession = Depends(deps.get_db),
+    current_user: User = Depends(deps.get_current_user),
+) -> Any:
+    """
+    Stream every issue of a project. Gzip-encoded when the client accepts it.
+    """
+    project = await ProjectService(db).get_project(project_id)
+    body = IssueExportService(db).stream(project.id, format)
+    headers = {"Content-Disposition": f'attachment; filename="project-{project.id}-issues.{format}"'}
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        body = gzip_stream(body)
+        headers["Content-Encoding"] = "gzip"
+        headers["Vary"] = "Accept-Encoding"
+    return StreamingResponse(body, media_type=EXPORT_FORMATS[format], headers=headers)
+
 @router.put("/{project_id}", response_model=ProjectResponse)
 async def update_project(
     *,
@@ -67,3 +96,38 @@ async def archive_project(
 ) -> Any:
     service = ProjectService(db)
     return await service.archive_project(project_id, current_user)
+
+@router.post("/{project_id}/webhooks", response_model=WebhookCreated)
+async def create_project_webhook(
+    *,
+    db: AsyncSession = Depends(deps.get_db),
+    project_id: int = Path(..., gt=0, examples=[1]),
+    webhook_in: WebhookCreate,
+    current_user: User = Depends(deps.get_current_user),
+) -> Any:
+    """
+    Subscribe a URL to this project's issue and comment events. Deliveries are
+    signed with the returned secret, which is not shown again.
+    """
+    service = WebhookService(db)
+    return await service.create_webhook(project_id, webhook_in, current_user)
+
+@router.get("/{project_id}/webhooks", response_model=List[WebhookResponse])
+async def read_project_webhooks(
+    project_id: int = Path(..., gt=0, examples=[1]),
+    db: AsyncSession = Depends(deps.get_db),
+    current_user: User = Depends(deps.get_current_user),
+) -> Any:
+    service = WebhookService(db)
+    return await service.get_webhooks(project_id, current_user)
+
+@router.delete("/{project_id}/webhooks/{webhook_id}", response_model=WebhookResponse)
+async def delete_project_webhook(
+    *,
+    db: AsyncSession = Depends(deps.get_db),
+    project_id: int = Path(..., gt=0, examples=[1]),
+    webhook_id: int = Path(..., gt=0, examples=[1]),
+    current_user: User = Depends(deps.get_current_user),
+) -> Any:
+    service = WebhookService(db)
+    return await service.delete_webhook(project_id, webhook_id, current_user)
@@ -101,8 +101,8 @@ async def update_user(
     update_data = user_in.model_dump(exclude_unset=True)
     
     if "password" in update_data and update_data["password"]:
-        from app.core.security import get_password_hash
-        hashed_password = get_password_hash(update_data["password"])
+        from app.core.security import get_password_hash_async
+        hashed_password = await get_password_hash_async(update_data["password"])
         del update_data["password"]
         update_data["hashed_password"] = hashed_password
 
@@ -0,0 +1,62 @@
+"""
+Bulk-import issues from an NDJSON or CSV file.
+
+    python -m app.cli.import_issues issues.ndjson --reporter-id 1
+    python -m app.cli.import_issues export.csv --reporter-id 1 --format csv --batch-size 5000
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+from typing import AsyncIterator
+
+from app.db.session import AsyncSessionLocal
+from app.repositories.user import UserRepository
+from app.services.import_service import IMPORT_FORMATS, IssueImportService
+
+
+async def _read_chunks(path: Path, chunk_size: int = 1 << 20) -> AsyncIterator[bytes]:
+    with path.open("rb") as handle:
+        while True:
+            chunk = await asyncio.to_thread(handle.read, chunk_size)
+            if not chunk:
+                break
+            yield chunk
+
+
+async def run(path: Path, reporter_id: int, fmt: str, batch_size: int) -> int:
+    async with AsyncSessionLocal() as session:
+        reporter = await UserRepository(session).get_by_id(reporter_id)
+        if reporter is None or not reporter.is_active:
+            print(f"Reporter {reporter_id} not found or inactive", file=sys.stderr)
+            return 1
+        report = await IssueImportService(session, batch_size=batch_size).import_stream(
+            _read_chunks(path), fmt, reporter
+        )
+
+    print(
+        f"imported {report.imported}/{report.total} rows, {report.failed} failed "
+        f"in {report.elapsed_seconds:.1f}s ({report.rows_per_second:.0f} rows/s)"
+    )
+    for error in report.errors:
+        print(f"  line {error.line}: {error.error}", file=sys.stderr)
+    if report.errors_truncated:
+        print("  ... more errors omitted", file=sys.stderr)
+    return 0 if report.failed == 0 else 2
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Bulk-import issues from NDJSON or CSV.")
+    parser.add_argument("path", type=Path)
+    parser.add_argument("--reporter-id", type=int, required=True, help="user recorded as reporter")
+    parser.add_argument("--format", choices=IMPORT_FORMATS, help="defaults to the file extension")
+    parser.add_argument("--batch-size", type=int, default=5000)
+    args = parser.parse_args()
+
+    fmt = args.format or ("csv" if args.path.suffix.lower() == ".csv" else "ndjson")
+    sys.exit(asyncio.run(run(args.path, args.reporter_id, fmt, args.batch_size)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,319 @@
+import enum
+import json
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, Hashable, List, Mapping, Optional, Tuple
+
+import sqlalchemy as sa
+
+from app.core.config import settings
+from app.core.rate_limit import redis_client
+
+
+# -------------------------------------------------------------------
+# Row snapshots
+# -------------------------------------------------------------------
+# Cached rows are stored as JSON-safe column snapshots rather than ORM
+# instances, so they can live in Redis and be re-attached to any session.
+# Columns a model lists in ``__snapshot_exclude__`` (secrets) are never
+# captured; they stay unloaded on restored rows.
+
+_column_types: Dict[type, List[Tuple[str, type]]] = {}
+
+
+def _columns(model: type) -> List[Tuple[str, type]]:
+    columns = _column_types.get(model)
+    if columns is None:
+        columns = []
+        excluded = getattr(model, "__snapshot_exclude__", ())
+        for attr in sa.inspect(model).column_attrs:
+            if attr.key in excluded:
+                continue
+            try:
+                python_type = attr.columns[0].type.python_type
+            except NotImplementedError:
+                python_type = object
+            columns.append((attr.key, python_type))
+        _column_types[model] = columns
+    return columns
+
+
+def snapshot_row(obj: Any) -> Dict[str, Any]:
+    # Only loaded columns are captured, so rows fetched with load_only()
+    # round-trip without inventing values for the pruned columns.
+    return snapshot_values(type(obj), obj.__dict__)
+
+
+def snapshot_values(model: type, state: Mapping[str, Any]) -> Dict[str, Any]:
+    """snapshot_row for a plain column mapping, e.g. a Core RETURNING row."""
+    data = {}
+    for key, _ in _columns(model):
+        if key not in state:
+            continue
+        value = state[key]
+        if isinstance(value, datetime):
+            value = value.isoformat()
+        elif isinstance(value, enum.Enum):
+            value = value.value
+        data[key] = value
+    return data
+
+
+def restore_row(model: type, data: Dict[str, Any]) -> Any:
+    values = {}
+    for key, python_type in _columns(model):
+        if key not in data:
+            continue
+        value = data[key]
+        if value is not None:
+            if python_type is datetime and isinstance(value, str):
+                value = datetime.fromisoformat(value)
+            elif isinstance(python_type, type) and issubclass(python_type, enum.Enum):
+                value = python_type(value)
+        values[key] = value
+    return model(**values)
+
+
+# -------------------------------------------------------------------
+# In-process LRU tier
+# -------------------------------------------------------------------
+class LRUCache:
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: int) -> None:
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class CacheStats:
+    def __init__(self):
+        self.local_hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        hits = self.local_hits + self.redis_hits
+        lookups = hits + self.misses
+        return {
+            "hits": hits,
+            "local_hits": self.local_hits,
+            "redis_hits": self.redis_hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "hit_ratio": round(hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+# -------------------------------------------------------------------
+# Entity cache
+# -------------------------------------------------------------------
+class EntityCache:
+    """
+    Read-through cache for single rows looked up by primary key.
+
+    Entries are keyed by (entity, id, version). Writes bump the version instead
+    of deleting keys, so a reader that loaded a row before the write can never
+    publish it under the new version. With the Redis tier enabled the version
+    counters live in Redis and invalidations are visible to every worker;
+    otherwise they are per-process and other workers converge within the TTL,
+    so entities in ``ENTITY_CACHE_SHARED_ONLY`` are not cached at all.
+    """
+
+    def __init__(self, maxsize: int, use_redis: bool):
+        self.use_redis = use_redis
+        self._local = LRUCache(maxsize)
+        self._versions: Dict[Tuple[str, Any], int] = {}
+        self._stats: Dict[str, CacheStats] = {}
+
+    def is_enabled(self, entity: Optional[str]) -> bool:
+        return (
+            entity is not None
+            and settings.ENTITY_CACHE_ENABLED
+            and entity not in settings.ENTITY_CACHE_DISABLED
+            and (self.use_redis or entity not in settings.ENTITY_CACHE_SHARED_ONLY)
+        )
+
+    def ttl(self, entity: str) -> int:
+        return settings.ENTITY_CACHE_TTL_SECONDS.get(entity, settings.ENTITY_CACHE_DEFAULT_TTL)
+
+    def _stats_for(self, entity: str) -> CacheStats:
+        stats = self._stats.get(entity)
+        if stats is None:
+            stats = self._stats[entity] = CacheStats()
+        return stats
+
+    async def version(self, entity: str, id: Any) -> int:
+        if self.use_redis:
+            value = await redis_client.get(f"cache:v:{entity}:{id}")
+            return int(value) if value else 0
+        return self._versions.get((entity, id), 0)
+
+    async def get(self, entity: str, id: Any, version: int) -> Optional[Dict[str, Any]]:
+        stats = self._stats_for(entity)
+        cached = self._local.get((entity, id))
+        if cached is not None and cached[0] == version:
+            stats.local_hits += 1
+            return cached[1]
+
+        if self.use_redis:
+            raw = await redis_client.get(f"cache:e:{entity}:{id}:{version}")
+            if raw is not None:
+                data = json.loads(raw)
+                self._local.set((entity, id), (version, data), self.ttl(entity))
+                stats.redis_hits += 1
+                return data
+
+        stats.misses += 1
+        return None
+
+    async def set(self, entity: str, id: Any, version: int, data: Dict[str, Any]) -> None:
+        ttl = self.ttl(entity)
+        self._local.set((entity, id), (version, data), ttl)
+        if self.use_redis:
+            await redis_client.set(f"cache:e:{entity}:{id}:{version}", json.dumps(data), ex=ttl)
+
+    async def invalidate(self, entity: str, id: Any) -> None:
+        self._stats_for(entity).invalidations += 1
+        self._local.pop((entity, id))
+        if self.use_redis:
+            await redis_client.incr(f"cache:v:{entity}:{id}")
+        else:
+            self._versions[(entity, id)] = self._versions.get((entity, id), 0) + 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": settings.ENTITY_CACHE_ENABLED,
+            "redis_tier": self.use_redis,
+            "local_entries": len(self._local),
+            "entities": {
+                entity: {
+                    **stats.as_dict(),
+                    "ttl_seconds": self.ttl(entity),
+                    "disabled": entity in settings.ENTITY_CACHE_DISABLED,
+                }
+                for entity, stats in self._stats.items()
+            },
+        }
+
+    def clear(self) -> None:
+        self._local.clear()
+        self._versions.clear()
+        self._stats.clear()
+
+
+entity_cache = EntityCache(
+    maxsize=settings.ENTITY_CACHE_MAX_ENTRIES,
+    use_redis=settings.ENTITY_CACHE_REDIS,
+)
+
+
+# -------------------------------------------------------------------
+# Query result cache
+# -------------------------------------------------------------------
+class QueryCache:
+    """
+    Caches list query results under a version-stamped scope.
+
+    Each scope (e.g. one project's issues) has a counter that is part of every
+    cache key, so bumping it invalidates all cached pages of that scope in O(1);
+    stale entries simply age out of the LRU / Redis TTL.
+    """
+
+    def __init__(self, namespace: str, maxsize: int, use_redis: bool):
+        self.namespace = namespace
+        self.use_redis = use_redis
+        self._local = LRUCache(maxsize)
+        self._versions: Dict[str, int] = {}
+        self._stats = CacheStats()
+
+    @property
+    def enabled(self) -> bool:
+        return settings.QUERY_CACHE_ENABLED and self.namespace not in settings.QUERY_CACHE_DISABLED
+
+    async def version(self, scope: str) -> int:
+        if self.use_redis:
+            value = await redis_client.get(f"cache:qv:{self.namespace}:{scope}")
+            return int(value) if value else 0
+        return self._versions.get(scope, 0)
+
+    def _key(self, scope: str, version: int, params: Tuple) -> str:
+        return f"cache:q:{self.namespace}:{scope}:{version}:{json.dumps(params, default=str)}"
+
+    async def get(self, scope: str, version: int, params: Tuple) -> Optional[Any]:
+        key = self._key(scope, version, params)
+        value = self._local.get(key)
+        if value is not None:
+            self._stats.local_hits += 1
+            return value
+
+        if self.use_redis:
+            raw = await redis_client.get(key)
+            if raw is not None:
+                value = json.loads(raw)
+                self._local.set(key, value, settings.QUERY_CACHE_TTL)
+                self._stats.redis_hits += 1
+                return value
+
+        self._stats.misses += 1
+        return None
+
+    async def set(self, scope: str, version: int, params: Tuple, value: Any) -> None:
+        key = self._key(scope, version, params)
+        self._local.set(key, value, settings.QUERY_CACHE_TTL)
+        if self.use_redis:
+            await redis_client.set(key, json.dumps(value), ex=settings.QUERY_CACHE_TTL)
+
+    async def bump(self, *scopes: str) -> None:
+        for scope in scopes:
+            self._stats.invalidations += 1
+            if self.use_redis:
+                await redis_client.incr(f"cache:qv:{self.namespace}:{scope}")
+            else:
+                self._versions[scope] = self._versions.get(scope, 0) + 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "redis_tier": self.use_redis,
+            "local_entries": len(self._local),
+            "ttl_seconds": settings.QUERY_CACHE_TTL,
+            **self._stats.as_dict(),
+        }
+
+    def clear(self) -> None:
+        self._local.clear()
+        self._versions.clear()
+        self._stats = CacheStats()
+
+
+issue_list_cache = QueryCache(
+    "issues",
+    maxsize=settings.QUERY_CACHE_MAX_ENTRIES,
+    use_redis=settings.QUERY_CACHE_REDIS,
+)
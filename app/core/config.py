@@ -1,5 +1,5 @@
 import os
-from typing import List, Union
+from typing import Dict, List, Union
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import AnyHttpUrl, field_validator
 
@@ -46,7 +46,141 @@ class Settings(BaseSettings):
     REDIS_HOST: str = "localhost"
     REDIS_PORT: int = 6379
     REDIS_DB: int = 0
-    
+
+    # Entity cache (read-through cache for rows fetched by primary key)
+    ENTITY_CACHE_ENABLED: bool = True
+    # Version counters in Redis, as for the query cache: archiving a project or
+    # deactivating a user must take effect on every worker, not just this one.
+    ENTITY_CACHE_REDIS: bool = True
+    ENTITY_CACHE_MAX_ENTRIES: int = 10000
+    ENTITY_CACHE_DEFAULT_TTL: int = 60
+    ENTITY_CACHE_TTL_SECONDS: Dict[str, int] = {"project": 300, "user": 60}
+    ENTITY_CACHE_DISABLED: List[str] = []
+    # Cached only with the Redis tier: per-process versions would let other
+    # workers serve an archived project or a deactivated user until the TTL
+    # runs out.
+    ENTITY_CACHE_SHARED_ONLY: List[str] = ["project", "user"]
+
+    # Query result cache (issue list pages, versioned per project)
+    QUERY_CACHE_ENABLED: bool = True
+    # Version counters (and entries) in Redis, so a write on one replica
+    # invalidates every replica's cached pages. Only turn off for a single
+    # process; otherwise other workers serve stale lists for QUERY_CACHE_TTL.
+    QUERY_CACHE_REDIS: bool = True
+    QUERY_CACHE_MAX_ENTRIES: int = 5000
+    QUERY_CACHE_TTL: int = 30
+    QUERY_CACHE_DISABLED: List[str] = []
+
+    # Share one in-flight query among concurrent identical issue-list / project reads
+    SINGLE_FLIGHT_ENABLED: bool = True
+
+    # Serialize list responses straight from ORM rows, skipping response_model validation
+    FAST_JSON_RESPONSES: bool = False
+
+    # Comments at least this long (chars) that contain markup are sanitized in a worker thread
+    SANITIZE_OFFLOAD_THRESHOLD: int = 512
+
+    # /changes feeds stop this many seconds behind now so rows from transactions
+    # still in flight (updated_at is set at statement time) are not skipped
+    SYNC_SETTLE_SECONDS: int = 5
+
+    # Server-Sent Events: fan out across pods through Redis pub/sub when enabled
+    EVENTS_REDIS: bool = False
+    EVENTS_CHANNEL: str = "bugtracker:events"
+    EVENTS_CLIENT_BUFFER: int = 256
+    EVENTS_HEARTBEAT_SECONDS: int = 15
+
+    # Transactional outbox (rows written with each issue/comment change, delivered by app.workers.outbox)
+    OUTBOX_ENABLED: bool = True
+    OUTBOX_BATCH_SIZE: int = 100
+    OUTBOX_LEASE_SECONDS: int = 60
+    # Handlers are cancelled after this long so an event is settled before its
+    # lease runs out and another worker can claim it; must be below the lease.
+    OUTBOX_HANDLER_TIMEOUT_SECONDS: float = 45.0
+    OUTBOX_MAX_ATTEMPTS: int = 10
+    OUTBOX_RETRY_BASE_SECONDS: float = 2.0
+    OUTBOX_RETRY_MAX_SECONDS: float = 600.0
+    OUTBOX_POLL_INTERVAL: float = 1.0
+    OUTBOX_RETENTION_HOURS: int = 72
+
+    # Webhook delivery (runs in the outbox worker)
+    WEBHOOK_TIMEOUT_SECONDS: float = 10.0
+    WEBHOOK_MAX_CONNECTIONS: int = 100
+    WEBHOOK_MAX_CONCURRENCY_PER_ENDPOINT: int = 4
+    WEBHOOK_MAX_BATCH: int = 50
+    WEBHOOK_MAX_ATTEMPTS: int = 5
+    WEBHOOK_RETRY_BASE_SECONDS: float = 1.0
+    WEBHOOK_RETRY_MAX_SECONDS: float = 60.0
+    # Webhook URLs must resolve to public addresses; hosts or CIDRs listed here
+    # (e.g. "hooks.internal", "10.20.0.0/16") are exempt.
+    WEBHOOK_ALLOWED_HOSTS: List[str] = []
+
+    # Idempotency-Key support for POST /issues and POST /comments
+    IDEMPOTENCY_TTL_SECONDS: int = 86400
+    IDEMPOTENCY_LOCK_SECONDS: int = 60
+    IDEMPOTENCY_WAIT_SECONDS: float = 10.0
+
+    # Prometheus metrics at /metrics (per worker process)
+    METRICS_ENABLED: bool = True
+    METRICS_LOOP_LAG_INTERVAL: float = 0.5
+
+    # Per-request SQL instrumentation: Server-Timing header, slow-query log and
+    # N+1 detection (same statement shape run N_PLUS_ONE_THRESHOLD+ times in
+    # one request; meant for dev and test)
+    SERVER_TIMING_ENABLED: bool = True
+    SLOW_QUERY_MS: float = 200.0
+    N_PLUS_ONE_DETECTION: bool = False
+    N_PLUS_ONE_THRESHOLD: int = 5
+
+    # Admin sampling profiler (window profiles and X-Profile-Token request profiles)
+    PROFILING_ENABLED: bool = True
+    PROFILE_INTERVAL_MS: float = 5.0
+    PROFILE_MAX_WINDOW_SECONDS: int = 60
+    PROFILE_TOKEN_TTL_SECONDS: int = 600
+    PROFILE_TTL_SECONDS: int = 86400
+
+    # Tracing: head-based sampling of new traces, incoming traceparent decisions
+    # are honoured; spans go to a JSON-lines file or an OTLP/HTTP JSON endpoint
+    TRACING_ENABLED: bool = True
+    TRACING_SAMPLE_RATE: float = 0.05
+    TRACING_EXPORTER: str = "none"  # none | file | otlp
+    TRACING_FILE: str = "traces/spans.jsonl"
+    TRACING_OTLP_ENDPOINT: str = "http://localhost:4318/v1/traces"
+    TRACING_SERVICE_NAME: str = "bugtracker-api"
+    TRACING_EXPORT_INTERVAL: float = 2.0
+    TRACING_MAX_BUFFER: int = 10000
+
+    # Rate limits, requests per minute per client IP (per path)
+    GLOBAL_RATE_LIMIT_PER_MINUTE: int = 100
+    LOGIN_RATE_LIMIT_PER_MINUTE: int = 5
+    REFRESH_RATE_LIMIT_PER_MINUTE: int = 10
+
+    # Logging: records beyond LOG_QUEUE_SIZE waiting for the writer thread are
+    # dropped; successful requests are access-logged at ACCESS_LOG_SAMPLE_RATE,
+    # 4xx/5xx and requests slower than ACCESS_LOG_SLOW_MS always
+    LOG_QUEUE_SIZE: int = 10000
+    ACCESS_LOG_ENABLED: bool = True
+    ACCESS_LOG_SAMPLE_RATE: float = 0.1
+    ACCESS_LOG_SLOW_MS: float = 1000.0
+
+    # Readiness: DB / Redis are probed in the background every
+    # HEALTH_PROBE_INTERVAL; /ready serves the cached result and reports
+    # not-ready once it is older than HEALTH_STALE_SECONDS
+    HEALTH_PROBE_INTERVAL: float = 5.0
+    HEALTH_PROBE_TIMEOUT: float = 2.0
+    HEALTH_STALE_SECONDS: float = 30.0
+
+    # Admission control: shed with 503 + Retry-After while any signal is over
+    # its limit (per worker)
+    ADMISSION_CONTROL_ENABLED: bool = True
+    ADMISSION_MAX_IN_FLIGHT: int = 500
+    ADMISSION_MAX_LOOP_LAG_MS: float = 250.0
+    ADMISSION_MAX_POOL_WAIT_MS: float = 1000.0
+    ADMISSION_RETRY_AFTER_SECONDS: int = 2
+
+    # Threads that run Argon2 hashing off the event loop
+    PASSWORD_HASH_WORKERS: int = 4
+
     # Security
     SECRET_KEY: str = "supersecretkey" # Change in production
     ALGORITHM: str = "RS256"
@@ -0,0 +1,207 @@
+import asyncio
+import json
+from typing import Any, AsyncIterator, Dict, Iterable, Optional, Set
+
+from pydantic_core import to_json
+
+from app.core.config import settings
+from app.core.logging import logger
+from app.core.rate_limit import redis_client
+from app.core.serialization import dump_row, response_fields
+
+
+# -------------------------------------------------------------------
+# Change events
+# -------------------------------------------------------------------
+# Services publish after their commit. Each worker process keeps one broker:
+# a single upstream (in-process, or one Redis pub/sub subscription) fanned out
+# to every open /events stream on that worker. Events are encoded into an SSE
+# frame once and the same bytes are queued for every matching client.
+
+
+class Event:
+    __slots__ = ("type", "project_id", "frame")
+
+    def __init__(self, type: str, project_id: int, frame: bytes):
+        self.type = type
+        self.project_id = project_id
+        self.frame = frame
+
+    @classmethod
+    def from_message(cls, message: Dict[str, Any]) -> "Event":
+        frame = b"event: " + message["type"].encode() + b"\ndata: " + to_json(message) + b"\n\n"
+        return cls(message["type"], message["project_id"], frame)
+
+
+# Queued in place of events once a client falls too far behind.
+RESYNC_FRAME = b"event: resync\ndata: {}\n\n"
+HEARTBEAT_FRAME = b": keepalive\n\n"
+
+
+class Subscription:
+    """
+    One client's bounded buffer. A client that stops reading is not allowed
+    to hold up the publisher or grow memory: when its buffer fills it is
+    detached and told to resync (from ``/changes``) and reconnect.
+    """
+
+    def __init__(self, broker: "EventBroker", project_ids: Optional[Set[int]], maxsize: int):
+        self.broker = broker
+        self.project_ids = project_ids
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize)
+        self.overflowed = False
+
+    def offer(self, frame: bytes) -> None:
+        if self.overflowed:
+            return
+        try:
+            self.queue.put_nowait(frame)
+        except asyncio.QueueFull:
+            self.overflowed = True
+            self.broker.stats["overflows"] += 1
+            self.broker.unsubscribe(self)
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(RESYNC_FRAME)
+
+    async def frames(self, heartbeat: float) -> AsyncIterator[bytes]:
+        """SSE frames for this client, with a keepalive comment when idle."""
+        try:
+            while True:
+                try:
+                    frame = await asyncio.wait_for(self.queue.get(), heartbeat)
+                except asyncio.TimeoutError:
+                    yield HEARTBEAT_FRAME
+                    continue
+                yield frame
+                if frame is RESYNC_FRAME:
+                    return
+        finally:
+            self.broker.unsubscribe(self)
+
+
+class EventBroker:
+    """In-process broker for single-node deployments and tests."""
+
+    def __init__(self, client_buffer: int):
+        self.client_buffer = client_buffer
+        # Subscribers indexed by project so a publish only touches interested clients.
+        self._by_project: Dict[int, Set[Subscription]] = {}
+        self._all_projects: Set[Subscription] = set()
+        self.stats = {"published": 0, "delivered": 0, "overflows": 0}
+
+    @property
+    def subscribers(self) -> int:
+        return len(self._all_projects) + sum(len(subs) for subs in self._by_project.values())
+
+    def subscribe(self, project_ids: Optional[Iterable[int]] = None) -> Subscription:
+        scope = set(project_ids) if project_ids else None
+        subscription = Subscription(self, scope, self.client_buffer)
+        if scope is None:
+            self._all_projects.add(subscription)
+        else:
+            for project_id in scope:
+                self._by_project.setdefault(project_id, set()).add(subscription)
+        return subscription
+
+    async def stream(self, project_ids: Optional[Iterable[int]], heartbeat: float) -> AsyncIterator[bytes]:
+        # Subscribes on first iteration, so a response that never starts
+        # streaming never registers a client.
+        subscription = self.subscribe(project_ids)
+        try:
+            async for frame in subscription.frames(heartbeat):
+                yield frame
+        finally:
+            self.unsubscribe(subscription)
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        if subscription.project_ids is None:
+            self._all_projects.discard(subscription)
+            return
+        for project_id in subscription.project_ids:
+            subs = self._by_project.get(project_id)
+            if subs is not None:
+                subs.discard(subscription)
+                if not subs:
+                    del self._by_project[project_id]
+
+    async def publish(self, type: str, project_id: int, data: Dict[str, Any]) -> None:
+        # Called after commit: a failed publish is logged, never raised to the caller.
+        message = {"type": type, "project_id": project_id, "data": data}
+        try:
+            await self._send(message)
+            self.stats["published"] += 1
+        except Exception as exc:
+            logger.warning("event_publish_failed", event_type=type, project_id=project_id, error=str(exc))
+
+    async def _send(self, message: Dict[str, Any]) -> None:
+        self._dispatch(Event.from_message(message))
+
+    def _dispatch(self, event: Event) -> None:
+        targets = list(self._all_projects)
+        targets.extend(self._by_project.get(event.project_id, ()))
+        for subscription in targets:
+            subscription.offer(event.frame)
+        self.stats["delivered"] += len(targets)
+
+    async def close(self) -> None:
+        pass
+
+
+class RedisEventBroker(EventBroker):
+    """
+    Cross-pod fan-out: publishes go to one Redis channel and each worker holds
+    a single subscription to it, started with its first client.
+    """
+
+    def __init__(self, client_buffer: int, channel: str):
+        super().__init__(client_buffer)
+        self.channel = channel
+        self._listener: Optional[asyncio.Task] = None
+
+    def subscribe(self, project_ids: Optional[Iterable[int]] = None) -> Subscription:
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.create_task(self._listen())
+        return super().subscribe(project_ids)
+
+    async def _send(self, message: Dict[str, Any]) -> None:
+        await redis_client.publish(self.channel, to_json(message).decode())
+
+    async def _listen(self) -> None:
+        backoff = 0.5
+        while True:
+            pubsub = redis_client.pubsub()
+            try:
+                await pubsub.subscribe(self.channel)
+                backoff = 0.5
+                async for message in pubsub.listen():
+                    if message["type"] == "message":
+                        self._dispatch(Event.from_message(json.loads(message["data"])))
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.warning("event_subscription_lost", channel=self.channel, error=str(exc))
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 30)
+            finally:
+                await pubsub.aclose()
+
+    async def close(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+
+
+if settings.EVENTS_REDIS:
+    event_broker: EventBroker = RedisEventBroker(settings.EVENTS_CLIENT_BUFFER, settings.EVENTS_CHANNEL)
+else:
+    event_broker = EventBroker(settings.EVENTS_CLIENT_BUFFER)
+
+
+async def publish_change(type: str, project_id: int, row: Any, schema: Any) -> None:
+    """Publish a committed ORM row as ``type`` using its response schema's fields."""
+    await event_broker.publish(type, project_id, dump_row(row, response_fields(schema)))
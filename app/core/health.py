@@ -0,0 +1,69 @@
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict
+
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.core.logging import logger
+from app.core.rate_limit import redis_client
+from app.db.session import engine
+
+
+# -------------------------------------------------------------------
+# Dependency probes
+# -------------------------------------------------------------------
+# One background task per worker probes Postgres and Redis on a fixed
+# interval and caches the outcome. /ready only reads the cache, so however
+# often the orchestrator polls, the dependencies see one cheap query per
+# interval per worker, and a hung dependency never hangs the probe itself.
+
+async def _probe_database() -> None:
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+
+
+async def _probe_redis() -> None:
+    await redis_client.ping()
+
+
+class HealthMonitor:
+    def __init__(self, probes: Dict[str, Callable[[], Awaitable[Any]]]):
+        self.probes = probes
+        self.status: Dict[str, Dict[str, Any]] = {}
+
+    async def _check(self, name: str, probe: Callable[[], Awaitable[Any]]) -> None:
+        started = time.perf_counter()
+        try:
+            await asyncio.wait_for(probe(), timeout=settings.HEALTH_PROBE_TIMEOUT)
+            error = None
+        except Exception as exc:
+            error = f"{type(exc).__name__}: {exc}"[:200] if str(exc) else type(exc).__name__
+        previous = self.status.get(name)
+        self.status[name] = {
+            "ok": error is None,
+            "latency_ms": round((time.perf_counter() - started) * 1000, 2),
+            "checked_at": time.time(),
+            "error": error,
+        }
+        if previous is not None and previous["ok"] != (error is None):
+            logger.warning("dependency_health_changed", dependency=name, ok=error is None, error=error)
+
+    async def check(self) -> None:
+        await asyncio.gather(*(self._check(name, probe) for name, probe in self.probes.items()))
+
+    async def run(self, interval: float = settings.HEALTH_PROBE_INTERVAL) -> None:
+        while True:
+            await self.check()
+            await asyncio.sleep(interval)
+
+    def ready(self) -> bool:
+        """Every dependency passed its last probe, and that probe is recent."""
+        now = time.time()
+        return len(self.status) == len(self.probes) and all(
+            status["ok"] and now - status["checked_at"] <= settings.HEALTH_STALE_SECONDS
+            for status in self.status.values()
+        )
+
+
+health_monitor = HealthMonitor({"database": _probe_database, "redis": _probe_redis})
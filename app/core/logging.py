@@ -1,44 +1,174 @@
-import sys
+import atexit
+import copy
 import logging
+import logging.handlers
+import queue
+import random
+import sys
+from contextvars import ContextVar
+from typing import Any, Dict, Optional
+
 import structlog
 from app.core.config import settings
 
+
+# -------------------------------------------------------------------
+# Queued log pipeline
+# -------------------------------------------------------------------
+# The event loop thread only runs the cheap structlog processors (context,
+# level, timestamp) and puts the event dict on a bounded queue. JSON rendering
+# and the write to stdout happen on a QueueListener thread, so a slow log
+# consumer or a full pipe never blocks request handling. When the queue is
+# full the record is dropped and counted rather than waited on.
+
+log_stats = {"dropped": 0, "sampled_out": 0}
+
+_listener: Optional[logging.handlers.QueueListener] = None
+_queue_handler: Optional[logging.Handler] = None
+
+_request_context: ContextVar[Optional[Dict[str, Any]]] = ContextVar("request_context", default=None)
+
+
+def start_request_context(**fields: Any):
+    """Begin a request's log context; returns a token for ``end_request_context``."""
+    return _request_context.set(dict(fields))
+
+
+def end_request_context(token) -> None:
+    _request_context.reset(token)
+
+
+def bind_request_context(**fields: Any) -> None:
+    """
+    Add fields (user id, route) to every later log line of the current
+    request. The context is one dict shared by reference, so fields bound in
+    a dependency are still visible to the middleware that opened it.
+    """
+    context = _request_context.get()
+    if context is not None:
+        context.update(fields)
+
+
+def request_context() -> Dict[str, Any]:
+    return _request_context.get() or {}
+
+
+def _merge_request_context(logger, method_name, event_dict):
+    context = _request_context.get()
+    if context:
+        for key, value in context.items():
+            event_dict.setdefault(key, value)
+    return event_dict
+
+
+def _sample_access_logs(logger, method_name, event_dict):
+    # Successful requests are the bulk of the volume; warnings and errors
+    # (4xx, 5xx, slow requests) are always kept.
+    if event_dict.get("event") == "access" and method_name in ("debug", "info"):
+        if random.random() >= settings.ACCESS_LOG_SAMPLE_RATE:
+            log_stats["sampled_out"] += 1
+            raise structlog.DropEvent
+    return event_dict
+
+
+def _capture_exc_info(logger, method_name, event_dict):
+    # exc_info=True means "the exception being handled"; resolve it here,
+    # the listener thread has no exception in flight.
+    if event_dict.get("exc_info") is True:
+        event_dict["exc_info"] = sys.exc_info()
+    return event_dict
+
+
+def _merge_record_context(logger, method_name, event_dict):
+    # Foreign (stdlib) records are formatted on the listener thread, where the
+    # request's contextvars are gone; the handler captured them on the record.
+    for key, value in getattr(event_dict["_record"], "log_context", {}).items():
+        event_dict.setdefault(key, value)
+    return event_dict
+
+
+class NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """Enqueues without formatting and drops instead of blocking when full."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        if not isinstance(record.msg, dict):
+            record.log_context = {**structlog.contextvars.get_contextvars(), **request_context()}
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            log_stats["dropped"] += 1
+
+
+def log_queue_depth() -> int:
+    return _listener.queue.qsize() if _listener is not None else 0
+
+
 def setup_logging():
-    shared_processors = [
-        structlog.contextvars.merge_contextvars,
-        structlog.processors.add_log_level,
-        structlog.processors.StackInfoRenderer(),
-        structlog.dev.set_exc_info,
-        structlog.processors.TimeStamper(fmt="iso"),
-    ]
-
-    if settings.PROJECT_NAME: # Just a check, usually we check env type (PROD/DEV)
-        # In a real scenario, check if ENV==PROD
-        pass
+    global _listener, _queue_handler
+    if _listener is not None:
+        return
 
     structlog.configure(
-        processors=shared_processors + [
-            structlog.processors.JSONRenderer()
+        processors=[
+            structlog.contextvars.merge_contextvars,
+            _merge_request_context,
+            structlog.processors.add_log_level,
+            _sample_access_logs,
+            structlog.processors.StackInfoRenderer(),
+            structlog.dev.set_exc_info,
+            _capture_exc_info,
+            structlog.processors.TimeStamper(fmt="iso"),
+            structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
         ],
         logger_factory=structlog.stdlib.LoggerFactory(),
         wrapper_class=structlog.stdlib.BoundLogger,
         cache_logger_on_first_use=True,
     )
-    
-    # Stdlib compatibility
+
+    # Runs on the listener thread, for structlog and stdlib records alike.
     formatter = structlog.stdlib.ProcessorFormatter(
-        foreign_pre_chain=shared_processors,
+        foreign_pre_chain=[
+            _merge_record_context,
+            structlog.processors.add_log_level,
+            structlog.processors.TimeStamper(fmt="iso"),
+        ],
         processors=[
             structlog.stdlib.ProcessorFormatter.remove_processors_meta,
+            structlog.processors.format_exc_info,
             structlog.processors.JSONRenderer(),
         ],
     )
-    
+
     handler = logging.StreamHandler(sys.stdout)
     handler.setFormatter(formatter)
-    
+
+    log_queue: queue.Queue = queue.Queue(maxsize=settings.LOG_QUEUE_SIZE)
+    _listener = logging.handlers.QueueListener(log_queue, handler, respect_handler_level=True)
+    _listener.start()
+    # Flush what is still queued when the process exits.
+    atexit.register(stop_logging)
+
+    _queue_handler = NonBlockingQueueHandler(log_queue)
     root_logger = logging.getLogger()
-    root_logger.addHandler(handler)
+    root_logger.addHandler(_queue_handler)
     root_logger.setLevel(logging.INFO)
 
+
+def stop_logging() -> None:
+    """Undo ``setup_logging``: flush the queue and detach the pipeline, so a later setup can reinstall it."""
+    global _listener, _queue_handler
+    # Detach first: with the listener gone, records would sit in the queue.
+    if _queue_handler is not None:
+        logging.getLogger().removeHandler(_queue_handler)
+        _queue_handler = None
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+        atexit.unregister(stop_logging)
+
+
 logger = structlog.get_logger()
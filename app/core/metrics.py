@@ -0,0 +1,248 @@
+import asyncio
+import math
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from app.core.config import settings
+from app.core.logging import log_queue_depth, log_stats, logger
+
+
+# -------------------------------------------------------------------
+# Metrics
+# -------------------------------------------------------------------
+# A small in-process registry rendered in the Prometheus text format at
+# /metrics. Everything is updated from the event loop thread, so recording a
+# sample is a dict lookup plus a bisect, with no locks. Values are per worker
+# process; Prometheus aggregates across workers and pods.
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+FAST_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Metric:
+    type = ""
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+
+    def samples(self) -> Iterable[str]:
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.type}", *self.samples()]
+
+
+class Counter(Metric):
+    type = "counter"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, help, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        self._values[labels] = self._values.get(labels, 0) + amount
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(labels, 0)
+
+    def samples(self) -> Iterable[str]:
+        for labels, value in self._values.items():
+            yield f"{self.name}{_labels(self.labelnames, labels)} {_format_value(value)}"
+
+
+class Gauge(Metric):
+    """Either set directly or read from ``callback`` at scrape time."""
+
+    type = "gauge"
+
+    def __init__(self, name: str, help: str, callback: Optional[Callable[[], float]] = None):
+        super().__init__(name, help)
+        self.callback = callback
+        self._value = 0.0
+
+    def set(self, value: float) -> None:
+        self._value = value
+
+    def inc(self, amount: float = 1) -> None:
+        self._value += amount
+
+    def dec(self, amount: float = 1) -> None:
+        self._value -= amount
+
+    def samples(self) -> Iterable[str]:
+        value = self._value
+        if self.callback is not None:
+            try:
+                value = self.callback()
+            except Exception as exc:
+                logger.warning("metrics_gauge_failed", metric=self.name, error=str(exc))
+                return
+        yield f"{self.name} {_format_value(value)}"
+
+
+class Histogram(Metric):
+    type = "histogram"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # labels -> [per-bucket counts (last one is +Inf), sum]
+        self._values: Dict[Tuple[str, ...], list] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        entry = self._values.get(labels)
+        if entry is None:
+            entry = self._values[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+        entry[0][bisect_left(self.buckets, value)] += 1
+        entry[1] += value
+
+    def count(self, *labels: str) -> int:
+        entry = self._values.get(labels)
+        return sum(entry[0]) if entry else 0
+
+    def samples(self) -> Iterable[str]:
+        bounds = [*self.buckets, math.inf]
+        for labels, (counts, total) in self._values.items():
+            cumulative = 0
+            for bound, count in zip(bounds, counts):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                yield f"{self.name}_bucket{_labels(self.labelnames, labels, le)} {cumulative}"
+            yield f"{self.name}_sum{_labels(self.labelnames, labels)} {_format_value(total)}"
+            yield f"{self.name}_count{_labels(self.labelnames, labels)} {cumulative}"
+
+
+class RecentPeak:
+    """
+    Highest value observed over the last one to two ``window`` seconds. Old
+    peaks age out even when nothing new is observed, so a signal that stops
+    being recorded (no checkouts while shedding load) cannot stick high.
+    """
+
+    def __init__(self, window: float = 5.0):
+        self.window = window
+        self._current = self._previous = 0.0
+        self._bucket = 0
+
+    def _rotate(self) -> None:
+        bucket = int(time.monotonic() // self.window)
+        if bucket != self._bucket:
+            self._previous = self._current if bucket == self._bucket + 1 else 0.0
+            self._current = 0.0
+            self._bucket = bucket
+
+    def observe(self, value: float) -> None:
+        self._rotate()
+        if value > self._current:
+            self._current = value
+
+    def value(self) -> float:
+        self._rotate()
+        return max(self._current, self._previous)
+
+
+class Registry:
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+
+    def register(self, metric: Metric) -> Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def unregister(self, name: str) -> None:
+        self._metrics.pop(name, None)
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+http_request_duration = registry.register(Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template; _count is the request count",
+    ("method", "route", "status"),
+))
+http_requests_in_flight = registry.register(Gauge("http_requests_in_flight", "HTTP requests currently being served"))
+db_pool_checkout = registry.register(Histogram(
+    "db_pool_checkout_seconds", "Time spent waiting for a database connection from the pool", buckets=FAST_BUCKETS,
+))
+redis_command_duration = registry.register(Histogram(
+    "redis_command_duration_seconds", "Redis command round-trip time", ("command",), buckets=FAST_BUCKETS,
+))
+rate_limit_rejections = registry.register(Counter(
+    "rate_limit_rejections_total", "Requests rejected with 429 by a rate limiter", ("limiter",),
+))
+password_hash_queue = registry.register(Histogram(
+    "password_hash_queue_seconds", "Time Argon2 work waited for a hashing thread", ("operation",), buckets=FAST_BUCKETS,
+))
+password_hash_duration = registry.register(Histogram(
+    "password_hash_duration_seconds", "Argon2 hash / verify time", ("operation",),
+))
+event_loop_lag = registry.register(Histogram(
+    "event_loop_lag_seconds", "How late the event loop ran a timer scheduled by the lag monitor", buckets=FAST_BUCKETS,
+))
+
+admission_rejections = registry.register(Counter(
+    "admission_rejections_total", "Requests shed with 503 by admission control", ("reason",),
+))
+# Recent peaks read by admission control on every request.
+loop_lag_peak = RecentPeak()
+pool_wait_peak = RecentPeak()
+log_queue_size = registry.register(Gauge(
+    "log_queue_records", "Log records waiting for the writer thread", callback=log_queue_depth,
+))
+log_records_dropped = registry.register(Gauge(
+    "log_records_dropped", "Log records dropped because the log queue was full", callback=lambda: log_stats["dropped"],
+))
+
+
+def register_pool_gauges(pool) -> None:
+    """Expose size / checked-out / overflow gauges for a QueuePool."""
+    for name, help, read in (
+        ("db_pool_size", "Configured database pool size", pool.size),
+        ("db_pool_checked_out", "Database connections currently checked out", pool.checkedout),
+        ("db_pool_overflow", "Database connections open beyond the pool size", lambda: max(pool.overflow(), 0)),
+    ):
+        registry.unregister(name)
+        registry.register(Gauge(name, help, callback=read))
+
+
+async def monitor_event_loop_lag(interval: float = settings.METRICS_LOOP_LAG_INTERVAL) -> None:
+    """Sleep ``interval`` repeatedly and record how late each wake-up was."""
+    loop = asyncio.get_running_loop()
+    while True:
+        started = loop.time()
+        await asyncio.sleep(interval)
+        lag = max(loop.time() - started - interval, 0.0)
+        event_loop_lag.observe(lag)
+        loop_lag_peak.observe(lag)
@@ -0,0 +1,109 @@
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Dict, List, Mapping, Optional, Sequence, Tuple, Type
+
+from sqlalchemy import event, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.cache import snapshot_row, snapshot_values
+from app.core.config import settings
+from app.models.comment import Comment
+from app.models.issue import Issue
+from app.models.outbox import OutboxEvent
+
+
+# -------------------------------------------------------------------
+# Transactional outbox
+# -------------------------------------------------------------------
+# Inserts and updates of the models below are recorded as outbox rows by the
+# same flush, so they commit or roll back together with the domain change and
+# the request path only pays for the extra INSERT. Delivery happens later in
+# app.workers.outbox.
+
+OUTBOX_ENTITIES: Dict[Type[Any], str] = {
+    Issue: "issue",
+    Comment: "comment",
+}
+
+_PENDING_KEY = "outbox_pending"
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changes(session: Session, flush_context) -> None:
+    # new/dirty still describe what this flush wrote; ids are assigned.
+    if not settings.OUTBOX_ENABLED:
+        return
+    pending: List[Tuple[str, Any]] = []
+    for obj in session.new:
+        entity = OUTBOX_ENTITIES.get(type(obj))
+        if entity is not None:
+            pending.append((f"{entity}.created", obj))
+    for obj in session.dirty:
+        entity = OUTBOX_ENTITIES.get(type(obj))
+        if entity is not None and session.is_modified(obj, include_collections=False):
+            pending.append((f"{entity}.updated", obj))
+    if pending:
+        session.info.setdefault(_PENDING_KEY, []).extend(pending)
+
+
+@event.listens_for(Session, "after_flush_postexec")
+def _write_outbox_rows(session: Session, flush_context) -> None:
+    # Objects added here are written by the follow-up flush that commit()
+    # performs before it commits, inside the same transaction.
+    pending = session.info.pop(_PENDING_KEY, None)
+    if not pending:
+        return
+    session.add_all(
+        OutboxEvent(event_type=event_type, aggregate_id=obj.id, payload=snapshot_row(obj))
+        for event_type, obj in pending
+    )
+
+
+async def record_bulk_created(db: AsyncSession, model: Type[Any], rows: Sequence[Mapping[str, Any]]) -> None:
+    """
+    Outbox rows for inserts that bypass the ORM flush (multi-row INSERT or
+    COPY), written in the caller's transaction. ``rows`` are the inserted
+    rows with every column, ids included.
+    """
+    if not settings.OUTBOX_ENABLED or not rows:
+        return
+    event_type = f"{OUTBOX_ENTITIES[model]}.created"
+    await db.execute(
+        insert(OutboxEvent),
+        [{"event_type": event_type, "aggregate_id": row["id"], "payload": snapshot_values(model, row)} for row in rows],
+    )
+
+
+# -------------------------------------------------------------------
+# Handlers
+# -------------------------------------------------------------------
+Handler = Callable[[OutboxEvent], Awaitable[None]]
+
+# Event loop time at which the worker cancels the running handler. Handlers
+# that hand work to background tasks pass it on, so that work stops too.
+handler_deadline: ContextVar[Optional[float]] = ContextVar("outbox_handler_deadline", default=None)
+
+
+class OutboxHandlers:
+    """
+    Registry of async handlers keyed by event type; ``"*"`` receives every
+    event. Delivery is at-least-once, so handlers must be idempotent.
+    """
+
+    def __init__(self):
+        self._handlers: Dict[str, List[Handler]] = {}
+
+    def register(self, event_type: str) -> Callable[[Handler], Handler]:
+        def decorator(fn: Handler) -> Handler:
+            self._handlers.setdefault(event_type, []).append(fn)
+            return fn
+        return decorator
+
+    def unregister(self, event_type: str, fn: Handler) -> None:
+        self._handlers.get(event_type, []).remove(fn)
+
+    def for_event(self, event_type: str) -> List[Handler]:
+        return [*self._handlers.get(event_type, ()), *self._handlers.get("*", ())]
+
+
+outbox_handlers = OutboxHandlers()
@@ -0,0 +1,184 @@
+import asyncio
+import hashlib
+import hmac
+import json
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Any, Dict, Optional, Tuple
+from uuid import uuid4
+
+from app.core.config import settings
+from app.core.rate_limit import redis_client
+
+
+# -------------------------------------------------------------------
+# Sampling profiler
+# -------------------------------------------------------------------
+# A background thread wakes every ``interval`` seconds, reads the event loop
+# thread's current stack from sys._current_frames() and counts it. Nothing is
+# installed in the interpreter (no sys.setprofile / settrace), so the loop
+# runs at full speed between samples. The thread only exists while a profile
+# is being taken, so there is no cost when nothing is being profiled.
+#
+# Profiles are stored as collapsed stacks ("outer;inner;leaf 42" per line),
+# the format flamegraph.pl and speedscope both read, in Redis so any worker
+# can serve them.
+
+PROFILE_TOKEN_HEADER = b"x-profile-token"
+PROFILE_ID_HEADER = "X-Profile-Id"
+
+_SITE_PREFIXES = tuple(sorted({os.path.dirname(os.path.dirname(os.__file__)), *sys.path}, key=len, reverse=True))
+
+
+def _frame_name(code) -> str:
+    filename = code.co_filename
+    for prefix in _SITE_PREFIXES:
+        if prefix and filename.startswith(prefix):
+            filename = filename[len(prefix):].lstrip(os.sep)
+            break
+    # ';' separates frames in the collapsed format.
+    return f"{code.co_qualname} ({filename}:{code.co_firstlineno})".replace(";", ":")
+
+
+def _collapse(frame) -> str:
+    names = []
+    while frame is not None:
+        names.append(_frame_name(frame.f_code))
+        frame = frame.f_back
+    return ";".join(reversed(names))
+
+
+class Sampler:
+    """
+    Samples one thread's stack. With ``task`` set, only samples taken while
+    that asyncio task is running on the loop are kept, which isolates one
+    request from the others sharing the loop.
+    """
+
+    def __init__(
+        self,
+        thread_id: int,
+        interval: float = settings.PROFILE_INTERVAL_MS / 1000,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+        task: Optional[asyncio.Task] = None,
+    ):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.loop = loop
+        self.task = task
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self.started_at = 0.0
+        self.duration = 0.0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "Sampler":
+        self.started_at = time.time()
+        self._thread = threading.Thread(target=self._run, name="profiler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.duration = time.time() - self.started_at
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            if self.task is not None and asyncio.current_task(self.loop) is not self.task:
+                continue
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            self.stacks[_collapse(frame)] += 1
+            self.samples += 1
+
+    def collapsed(self) -> str:
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+
+def to_speedscope(collapsed: str, name: str, interval: float) -> Dict[str, Any]:
+    """Convert collapsed stacks to a speedscope "sampled" profile document."""
+    frames: Dict[str, int] = {}
+    samples = []
+    weights = []
+    for line in collapsed.splitlines():
+        stack, _, count = line.rpartition(" ")
+        samples.append([frames.setdefault(frame, len(frames)) for frame in stack.split(";")])
+        weights.append(int(count) * interval)
+    return {
+        "$schema": "https://www.speedscope.app/file-format-schema.json",
+        "shared": {"frames": [{"name": frame} for frame in frames]},
+        "profiles": [{
+            "type": "sampled",
+            "name": name,
+            "unit": "seconds",
+            "startValue": 0,
+            "endValue": sum(weights),
+            "samples": samples,
+            "weights": weights,
+        }],
+        "name": name,
+        "exporter": "bugtracker-profiler",
+    }
+
+
+# -------------------------------------------------------------------
+# Storage
+# -------------------------------------------------------------------
+def _key(profile_id: str) -> str:
+    return f"profile:{profile_id}"
+
+
+def new_profile_id() -> str:
+    return uuid4().hex
+
+
+async def save_profile(sampler: Sampler, label: str, profile_id: Optional[str] = None) -> Dict[str, Any]:
+    meta = {
+        "id": profile_id or new_profile_id(),
+        "label": label,
+        "started_at": sampler.started_at,
+        "duration_seconds": round(sampler.duration, 4),
+        "interval_ms": sampler.interval * 1000,
+        "samples": sampler.samples,
+    }
+    stored = json.dumps({"meta": meta, "collapsed": sampler.collapsed()})
+    await redis_client.set(_key(meta["id"]), stored, ex=settings.PROFILE_TTL_SECONDS)
+    return meta
+
+
+async def load_profile(profile_id: str) -> Optional[Tuple[Dict[str, Any], str]]:
+    raw = await redis_client.get(_key(profile_id))
+    if raw is None:
+        return None
+    stored = json.loads(raw)
+    return stored["meta"], stored["collapsed"]
+
+
+# -------------------------------------------------------------------
+# Request tokens
+# -------------------------------------------------------------------
+# An admin mints a short-lived token; any request carrying it in
+# X-Profile-Token is profiled. The token is an HMAC over its expiry, so it
+# can be checked without a lookup and cannot be forged or extended.
+
+def _token_signature(expires: int) -> str:
+    return hmac.new(settings.SECRET_KEY.encode(), f"profile:{expires}".encode(), hashlib.sha256).hexdigest()
+
+
+def issue_profile_token(ttl: int = settings.PROFILE_TOKEN_TTL_SECONDS) -> Tuple[str, int]:
+    expires = int(time.time()) + ttl
+    return f"{expires}.{_token_signature(expires)}", expires
+
+
+def verify_profile_token(token: str) -> bool:
+    expires, _, signature = token.partition(".")
+    if not expires.isdigit() or int(expires) < time.time():
+        return False
+    return hmac.compare_digest(signature, _token_signature(int(expires)))
@@ -7,6 +7,9 @@ import redis.asyncio as redis
 from fastapi import Request, Response, HTTPException, status
 
 from app.core.config import settings
+from app.core.metrics import rate_limit_rejections, redis_command_duration
+from app.core.request_timing import current_timings
+from app.core.tracing import span
 
 
 class _InMemoryPipeline:
@@ -51,10 +54,15 @@ class _InMemoryRedis:
         value = self._store.get(key)
         return None if value is None else str(value)
 
-    async def set(self, key: str, value: str, ex: Optional[int] = None):
+    async def set(self, key: str, value: str, ex: Optional[int] = None, nx: bool = False):
+        if nx and not self._is_expired(key) and key in self._store:
+            return None
         self._store[key] = int(value) if isinstance(value, int) else value
         if ex is not None:
             self._expirations[key] = time.monotonic() + ex
+        else:
+            self._expirations.pop(key, None)
+        return True
 
     async def incr(self, key: str):
         current = self._store.get(key)
@@ -73,6 +81,9 @@ class _InMemoryRedis:
         self._expirations.pop(key, None)
         return existed
 
+    async def ping(self) -> bool:
+        return True
+
     async def flushall(self) -> None:
         self._store.clear()
         self._expirations.clear()
@@ -81,19 +92,36 @@ class _InMemoryRedis:
         return _InMemoryPipeline(self._store, self._expirations)
 
 
+class InstrumentedRedis(redis.Redis):
+    """redis.asyncio client that records per-command latency."""
+
+    async def execute_command(self, *args, **options):
+        started = time.perf_counter()
+        try:
+            with span(f"redis {str(args[0]).upper()}", layer="redis"):
+                return await super().execute_command(*args, **options)
+        finally:
+            elapsed = time.perf_counter() - started
+            redis_command_duration.observe(elapsed, str(args[0]).upper())
+            timings = current_timings()
+            if timings is not None:
+                timings.add("redis", elapsed)
+
+
 if "pytest" in sys.modules or os.getenv("ALLOW_INMEMORY_RATE_LIMIT") == "1":
     redis_client = _InMemoryRedis()
 else:
-    redis_client = redis.from_url(
+    redis_client = InstrumentedRedis.from_url(
         f"redis://{settings.REDIS_HOST}:{settings.REDIS_PORT}",
         encoding="utf-8",
         decode_responses=True,
     )
 
 class RateLimiter:
-    def __init__(self, times: int, seconds: int):
+    def __init__(self, times: int, seconds: int, name: str = "route"):
         self.times = times
         self.seconds = seconds
+        self.name = name
 
     async def __call__(self, request: Request, response: Response):
         client_ip = request.client.host
@@ -108,6 +136,7 @@ class RateLimiter:
         current = await redis_client.get(key)
         
         if current and int(current) >= self.times:
+            rate_limit_rejections.inc(self.name)
             raise HTTPException(
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
                 detail="Too many requests"
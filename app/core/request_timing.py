@@ -0,0 +1,133 @@
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+from app.core.logging import logger
+
+
+# -------------------------------------------------------------------
+# Per-request timings
+# -------------------------------------------------------------------
+# RequestTimingMiddleware puts a RequestTimings in a contextvar for the
+# lifetime of each request. The SQLAlchemy hooks below, the Redis client, the
+# auth dependency and the JSON renderers add to it. The totals go out in the
+# Server-Timing header, and repeated statement shapes are reported as N+1
+# candidates. Work outside a request (workers, scripts) sees no timings and
+# only gets the slow-query log.
+
+PHASES = ("db", "redis", "auth", "serialize")
+
+
+class RequestTimings:
+    __slots__ = ("path", "started", "queries", "phases", "slowest", "shapes")
+
+    def __init__(self, path: str):
+        self.path = path
+        self.started = time.perf_counter()
+        self.queries = 0
+        self.phases = dict.fromkeys(PHASES, 0.0)
+        self.slowest: Tuple[float, str] = (0.0, "")
+        self.shapes: Counter = Counter()
+
+    def add(self, phase: str, seconds: float) -> None:
+        self.phases[phase] += seconds
+
+    def record_query(self, statement: str, seconds: float) -> None:
+        self.queries += 1
+        self.phases["db"] += seconds
+        if seconds > self.slowest[0]:
+            self.slowest = (seconds, statement)
+        self.shapes[statement_shape(statement)] += 1
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def repeated_statements(self, threshold: int) -> List[Tuple[str, int]]:
+        return [(shape, count) for shape, count in self.shapes.most_common() if count >= threshold]
+
+    def server_timing(self) -> str:
+        total = self.elapsed()
+        entries = [f'db;dur={self.phases["db"] * 1000:.2f};desc="{self.queries} queries"']
+        entries.extend(f"{phase};dur={self.phases[phase] * 1000:.2f}" for phase in PHASES[1:])
+        entries.append(f"total;dur={total * 1000:.2f}")
+        return ", ".join(entries)
+
+
+_current: ContextVar[Optional[RequestTimings]] = ContextVar("request_timings", default=None)
+
+
+def current_timings() -> Optional[RequestTimings]:
+    return _current.get()
+
+
+def start_request(path: str):
+    """Begin collecting for the current context; returns a token for ``end_request``."""
+    return _current.set(RequestTimings(path))
+
+
+def end_request(token) -> None:
+    _current.reset(token)
+
+
+@contextmanager
+def timed(phase: str) -> Iterator[None]:
+    timings = _current.get()
+    if timings is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.add(phase, time.perf_counter() - started)
+
+
+# Expanded IN lists and positional placeholders differ between otherwise
+# identical statements; fold them so one loop shows up as one shape.
+_PLACEHOLDER = re.compile(r"\$\d+|:\w+|%\(\w+\)s|%s")
+_PLACEHOLDER_LIST = re.compile(r"\?(?:\s*,\s*\?)+")
+
+
+def statement_shape(statement: str) -> str:
+    return _PLACEHOLDER_LIST.sub("?", _PLACEHOLDER.sub("?", " ".join(statement.split())))
+
+
+# -------------------------------------------------------------------
+# SQLAlchemy hooks
+# -------------------------------------------------------------------
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    elapsed = time.perf_counter() - conn.info["query_started"].pop()
+    timings = _current.get()
+    if timings is not None:
+        timings.record_query(statement, elapsed)
+    if elapsed * 1000 >= settings.SLOW_QUERY_MS:
+        # Parameters are left out: they carry user content.
+        logger.warning(
+            "slow_query",
+            duration_ms=round(elapsed * 1000, 2),
+            statement=" ".join(statement.split())[:2000],
+            path=timings.path if timings is not None else None,
+        )
+
+
+@event.listens_for(Engine, "handle_error")
+def _handle_error(exception_context) -> None:
+    # after_cursor_execute does not fire for failed statements.
+    connection = exception_context.connection
+    if connection is not None:
+        started = connection.info.get("query_started")
+        if started:
+            started.pop()
@@ -0,0 +1,49 @@
+import asyncio
+import re
+import threading
+
+from bleach.sanitizer import Cleaner
+
+from app.core.config import settings
+
+# Characters that make bleach.clean(text, strip=True) differ from its input:
+# markup and entity delimiters, plus the C0 controls html5lib rewrites
+# (everything below 0x20 except tab and newline). Text without any of them
+# comes back unchanged, so parsing it can be skipped.
+_NEEDS_CLEANING = re.compile(r"[\x00-\x08\x0b-\x1f&<>]")
+
+_local = threading.local()
+
+
+def _cleaner() -> Cleaner:
+    # A Cleaner keeps html5lib parser and serializer state between calls and
+    # is not thread-safe, so each thread builds and reuses its own.
+    cleaner = getattr(_local, "cleaner", None)
+    if cleaner is None:
+        cleaner = _local.cleaner = Cleaner(strip=True)
+    return cleaner
+
+
+def needs_cleaning(text: str) -> bool:
+    return _NEEDS_CLEANING.search(text) is not None
+
+
+def sanitize(text: str) -> str:
+    """Same output as ``bleach.clean(text, strip=True)``."""
+    if not needs_cleaning(text):
+        return text
+    return _cleaner().clean(text)
+
+
+async def sanitize_async(text: str) -> str:
+    """
+    ``sanitize`` for request handlers: markup-free text returns immediately,
+    small bodies are cleaned inline, and bodies of at least
+    ``SANITIZE_OFFLOAD_THRESHOLD`` characters are parsed in a worker thread so
+    the event loop keeps serving other requests.
+    """
+    if not needs_cleaning(text):
+        return text
+    if len(text) < settings.SANITIZE_OFFLOAD_THRESHOLD:
+        return _cleaner().clean(text)
+    return await asyncio.to_thread(sanitize, text)
@@ -1,9 +1,13 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Optional, Any, Union
 from uuid import uuid4
 from jose import jwt
 from passlib.context import CryptContext
 from app.core.config import settings
+from app.core.metrics import password_hash_duration, password_hash_queue
 
 pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
 
@@ -13,6 +17,32 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
+# Argon2 is deliberately slow (tens of ms of CPU); running it on the event loop
+# would stall every other request on the worker, so the async variants below
+# hand it to a small dedicated pool.
+_hash_executor = ThreadPoolExecutor(max_workers=settings.PASSWORD_HASH_WORKERS, thread_name_prefix="argon2")
+
+
+async def _run_hash(operation: str, fn, *args):
+    submitted = time.perf_counter()
+
+    def run():
+        started = time.perf_counter()
+        result = fn(*args)
+        return started, time.perf_counter(), result
+
+    started, finished, result = await asyncio.get_running_loop().run_in_executor(_hash_executor, run)
+    # Recorded back on the loop thread; the metrics registry is not locked.
+    password_hash_queue.observe(started - submitted, operation)
+    password_hash_duration.observe(finished - started, operation)
+    return result
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await _run_hash("verify", verify_password, plain_password, hashed_password)
+
+async def get_password_hash_async(password: str) -> str:
+    return await _run_hash("hash", get_password_hash, password)
+
 def create_access_token(subject: Union[str, Any], expires_delta: Optional[timedelta] = None) -> str:
     if expires_delta:
         expire = datetime.utcnow() + expires_delta
@@ -0,0 +1,107 @@
+import zlib
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Sequence, Tuple, Type
+
+from fastapi import Response
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+from app.core.exceptions import InvalidOperationException
+from app.core.request_timing import timed
+
+
+# -------------------------------------------------------------------
+# Fast JSON path
+# -------------------------------------------------------------------
+# Rows coming out of the repositories are already valid (they were validated
+# on the way in and constrained by the schema), so re-validating every field
+# against the response model only costs CPU. This path reads the response
+# model's field names straight off the ORM objects and encodes them with
+# pydantic-core's Rust serializer, which handles datetimes and enums natively.
+
+
+@lru_cache(maxsize=None)
+def response_fields(schema: Type[BaseModel]) -> Tuple[str, ...]:
+    return tuple(schema.model_fields)
+
+
+def parse_fields(raw: Optional[str], schema: Type[BaseModel]) -> Optional[Tuple[str, ...]]:
+    """
+    Parse a ``fields=a,b,c`` sparse fieldset against a response model.
+    Returns None when no fieldset was requested. ``id`` is always included
+    and the model's field order is preserved.
+    """
+    if raw is None:
+        return None
+    requested = {name.strip() for name in raw.split(",") if name.strip()}
+    available = response_fields(schema)
+    unknown = requested - set(available)
+    if unknown:
+        raise InvalidOperationException(f"Unknown fields: {', '.join(sorted(unknown))}")
+    requested.add("id")
+    return tuple(name for name in available if name in requested)
+
+
+def dump_row(row: Any, fields: Sequence[str]) -> Dict[str, Any]:
+    # Loaded column values sit in the instance __dict__; reading them there
+    # skips the instrumented attribute descriptor. Anything missing (expired
+    # attributes, properties) falls back to a normal getattr.
+    state = row.__dict__
+    return {name: state[name] if name in state else getattr(row, name) for name in fields}
+
+
+def dump_rows(
+    rows: Iterable[Any],
+    schema: Type[BaseModel],
+    fields: Optional[Sequence[str]] = None,
+) -> List[Dict[str, Any]]:
+    names = fields if fields is not None else response_fields(schema)
+    return [dump_row(row, names) for row in rows]
+
+
+class FastJSONResponse(Response):
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        with timed("serialize"):
+            return to_json(content)
+
+
+class TimedJSONResponse(JSONResponse):
+    """Default response class; counts JSON rendering as serialize time."""
+
+    def render(self, content: Any) -> bytes:
+        with timed("serialize"):
+            return super().render(content)
+
+
+def fast_json_response(
+    rows: Iterable[Any],
+    schema: Type[BaseModel],
+    fields: Optional[Sequence[str]] = None,
+) -> FastJSONResponse:
+    with timed("serialize"):
+        return FastJSONResponse(to_json(dump_rows(rows, schema, fields)))
+
+
+def fast_json_item(
+    row: Any,
+    schema: Type[BaseModel],
+    fields: Optional[Sequence[str]] = None,
+) -> FastJSONResponse:
+    names = fields if fields is not None else response_fields(schema)
+    with timed("serialize"):
+        return FastJSONResponse(to_json(dump_row(row, names)))
+
+
+async def gzip_stream(chunks: AsyncIterator[bytes], level: int = 6) -> AsyncIterator[bytes]:
+    """Incrementally gzip a byte stream without buffering the whole body."""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)  # wbits=31 -> gzip container
+    async for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
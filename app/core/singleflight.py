@@ -0,0 +1,92 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+from app.core.config import settings
+
+
+# -------------------------------------------------------------------
+# Single-flight
+# -------------------------------------------------------------------
+# Concurrent identical reads on one worker share a single execution: the
+# first caller (the leader) runs the query in its own session, and everyone
+# who asks for the same key while it runs waits for that result instead of
+# issuing the query again. Followers get a session-independent snapshot of
+# the result (see ``share``), never the leader's ORM instances.
+#
+# Keys must capture everything the result depends on: the normalized
+# parameters, the caller's authorization scope and the cache version of the
+# data, so a read that starts after a write never joins a flight that began
+# before it.
+
+
+class SingleFlight:
+    def __init__(self, namespace: str):
+        self.namespace = namespace
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+        self.executions = 0
+        self.collapsed = 0
+
+    @property
+    def enabled(self) -> bool:
+        return settings.SINGLE_FLIGHT_ENABLED
+
+    async def do(
+        self,
+        key: Hashable,
+        fn: Callable[[], Awaitable[Any]],
+        share: Callable[[Any], Any] = lambda value: value,
+    ) -> Tuple[Any, bool]:
+        """
+        Run ``fn`` once per key among concurrent callers. Returns
+        ``(value, leader)``: the leader gets what ``fn`` returned, followers
+        get ``share(value)``. Errors from ``fn`` are raised to every waiter;
+        if the leader is cancelled, a waiting follower takes over.
+        """
+        while True:
+            future = self._calls.get(key)
+            if future is None:
+                break
+            self.collapsed += 1
+            try:
+                return await asyncio.shield(future), False
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+                # The leader went away (client disconnect); retry as leader.
+                self.collapsed -= 1
+
+        future = self._calls[key] = asyncio.get_running_loop().create_future()
+        self.executions += 1
+        try:
+            value = await fn()
+            shared = share(value)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            # Mark retrieved so an error nobody waited for is not logged.
+            future.exception()
+            raise
+        else:
+            future.set_result(shared)
+            return value, True
+        finally:
+            del self._calls[key]
+
+    def stats(self) -> Dict[str, Any]:
+        requests = self.executions + self.collapsed
+        return {
+            "executions": self.executions,
+            "collapsed": self.collapsed,
+            "in_flight": len(self._calls),
+            "collapsed_ratio": round(self.collapsed / requests, 4) if requests else 0.0,
+        }
+
+    def clear(self) -> None:
+        self.executions = 0
+        self.collapsed = 0
+
+
+issue_list_flight = SingleFlight("issues")
+project_flight = SingleFlight("project")
@@ -0,0 +1,264 @@
+import asyncio
+import functools
+import inspect
+import json
+import os
+import random
+import re
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import httpx
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+from app.core.logging import logger
+
+
+# -------------------------------------------------------------------
+# Tracing
+# -------------------------------------------------------------------
+# A deliberately small tracer: W3C ``traceparent`` in, spans at the endpoint,
+# service, repository, SQL and Redis boundaries, and OTLP/JSON-shaped spans
+# out to a file or a collector. The sampling decision is made once at the
+# head of the trace and then inherited, so an unsampled request only pays for
+# a contextvar lookup at each boundary. Trace ids are bound into structlog's
+# contextvars for every request, sampled or not, so log lines correlate.
+
+# OTLP span kinds: 1 internal, 2 server, 3 client.
+_SPAN_KINDS = {"http": 2, "db": 3, "redis": 3}
+
+_TRACEPARENT = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+
+
+def _new_id(bits: int) -> str:
+    return f"{random.getrandbits(bits):0{bits // 4}x}"
+
+
+class Span:
+    __slots__ = ("trace_id", "span_id", "parent_id", "name", "sampled", "start_ns", "end_ns", "attributes", "error")
+
+    def __init__(self, trace_id: str, parent_id: Optional[str], name: str, sampled: bool):
+        self.trace_id = trace_id
+        self.span_id = _new_id(64)
+        self.parent_id = parent_id
+        self.name = name
+        self.sampled = sampled
+        self.start_ns = time.time_ns()
+        self.end_ns = 0
+        self.attributes: Dict[str, Any] = {}
+        self.error: Optional[str] = None
+
+    @property
+    def traceparent(self) -> str:
+        return f"00-{self.trace_id}-{self.span_id}-{'01' if self.sampled else '00'}"
+
+    def child(self, name: str) -> "Span":
+        return Span(self.trace_id, self.span_id, name, self.sampled)
+
+    def finish(self) -> None:
+        self.end_ns = time.time_ns()
+        if self.sampled:
+            tracer.record(self)
+
+    def to_otlp(self) -> Dict[str, Any]:
+        span = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": _SPAN_KINDS.get(self.attributes.get("layer"), 1),
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": [
+                {"key": key, "value": {"intValue": str(value)} if isinstance(value, int) else {"stringValue": str(value)}}
+                for key, value in self.attributes.items()
+            ],
+            "status": {"code": 2, "message": self.error} if self.error else {"code": 0},
+        }
+        if self.parent_id:
+            span["parentSpanId"] = self.parent_id
+        return span
+
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+
+def current_span() -> Optional[Span]:
+    return _current_span.get()
+
+
+def parse_traceparent(value: Optional[str]) -> Optional[Tuple[str, str, bool]]:
+    if not value:
+        return None
+    match = _TRACEPARENT.match(value.strip().lower())
+    if match is None or match.group(1) == "0" * 32 or match.group(2) == "0" * 16:
+        return None
+    return match.group(1), match.group(2), int(match.group(3), 16) & 1 == 1
+
+
+def start_trace(name: str, traceparent: Optional[str] = None) -> Span:
+    """Root span for a request: continue the caller's trace or start a new one."""
+    parent = parse_traceparent(traceparent)
+    if parent is not None:
+        trace_id, parent_id, sampled = parent
+    else:
+        trace_id, parent_id = _new_id(128), None
+        sampled = random.random() < settings.TRACING_SAMPLE_RATE
+    # Nothing to export to: keep the ids for log correlation, skip the spans.
+    return Span(trace_id, parent_id, name, sampled and settings.TRACING_EXPORTER != "none")
+
+
+@contextmanager
+def activate(span: Span) -> Iterator[Span]:
+    token = _current_span.set(span)
+    try:
+        yield span
+    except BaseException as exc:
+        span.error = f"{type(exc).__name__}: {exc}"[:500]
+        raise
+    finally:
+        _current_span.reset(token)
+        span.finish()
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Optional[Span]]:
+    """Child span of the current one; a no-op outside sampled traces."""
+    parent = _current_span.get()
+    if parent is None or not parent.sampled:
+        yield None
+        return
+    child = parent.child(name)
+    child.attributes.update(attributes)
+    with activate(child):
+        yield child
+
+
+def traced(layer: str):
+    """
+    Class decorator: wrap every public coroutine method defined on the class
+    in a ``"{Class}.{method}"`` span tagged with ``layer``.
+    """
+    def decorate(cls):
+        for attr, fn in list(vars(cls).items()):
+            if not attr.startswith("_") and inspect.iscoroutinefunction(fn):
+                setattr(cls, attr, _traced_method(fn, f"{cls.__name__}.{attr}", layer))
+        return cls
+    return decorate
+
+
+def _traced_method(fn, name: str, layer: str):
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        parent = _current_span.get()
+        if parent is None or not parent.sampled:
+            return await fn(*args, **kwargs)
+        child = parent.child(name)
+        child.attributes["layer"] = layer
+        with activate(child):
+            return await fn(*args, **kwargs)
+    wrapper.__traced__ = True
+    return wrapper
+
+
+# -------------------------------------------------------------------
+# Export
+# -------------------------------------------------------------------
+class Tracer:
+    """
+    Buffers finished sampled spans and ships them in batches from a
+    background task, so request handling never waits on the exporter.
+    """
+
+    def __init__(self, max_buffer: int = settings.TRACING_MAX_BUFFER):
+        self.max_buffer = max_buffer
+        self._buffer: List[Span] = []
+        self._client: Optional[httpx.AsyncClient] = None
+        self.stats = {"recorded": 0, "exported": 0, "dropped": 0}
+
+    def record(self, span: Span) -> None:
+        if len(self._buffer) >= self.max_buffer:
+            self.stats["dropped"] += 1
+            return
+        self._buffer.append(span)
+        self.stats["recorded"] += 1
+
+    def _payload(self, spans: List[Span]) -> Dict[str, Any]:
+        return {"resourceSpans": [{
+            "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": settings.TRACING_SERVICE_NAME}}]},
+            "scopeSpans": [{"scope": {"name": "app.core.tracing"}, "spans": [s.to_otlp() for s in spans]}],
+        }]}
+
+    async def flush(self) -> None:
+        spans, self._buffer = self._buffer, []
+        if not spans or settings.TRACING_EXPORTER == "none":
+            return
+        try:
+            if settings.TRACING_EXPORTER == "file":
+                lines = "".join(json.dumps(s.to_otlp()) + "\n" for s in spans)
+                await asyncio.to_thread(self._append, settings.TRACING_FILE, lines)
+            elif settings.TRACING_EXPORTER == "otlp":
+                if self._client is None:
+                    self._client = httpx.AsyncClient(timeout=5.0)
+                response = await self._client.post(settings.TRACING_OTLP_ENDPOINT, json=self._payload(spans))
+                response.raise_for_status()
+            self.stats["exported"] += len(spans)
+        except Exception as exc:
+            self.stats["dropped"] += len(spans)
+            logger.warning("trace_export_failed", exporter=settings.TRACING_EXPORTER, spans=len(spans), error=str(exc))
+
+    @staticmethod
+    def _append(path: str, lines: str) -> None:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(lines)
+
+    async def run(self, interval: float = settings.TRACING_EXPORT_INTERVAL) -> None:
+        try:
+            while True:
+                await asyncio.sleep(interval)
+                await self.flush()
+        finally:
+            await self.flush()
+
+    async def close(self) -> None:
+        await self.flush()
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+tracer = Tracer()
+
+
+# -------------------------------------------------------------------
+# SQL spans
+# -------------------------------------------------------------------
+@event.listens_for(Engine, "before_cursor_execute")
+def _start_query_span(conn, cursor, statement, parameters, context, executemany) -> None:
+    parent = _current_span.get()
+    if parent is not None and parent.sampled:
+        child = parent.child("db.query")
+        child.attributes["layer"] = "db"
+        child.attributes["db.statement"] = " ".join(statement.split())[:500]
+        conn.info.setdefault("trace_spans", []).append(child)
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _end_query_span(conn, cursor, statement, parameters, context, executemany) -> None:
+    spans = conn.info.get("trace_spans")
+    if spans:
+        spans.pop().finish()
+
+
+@event.listens_for(Engine, "handle_error")
+def _fail_query_span(exception_context) -> None:
+    connection = exception_context.connection
+    spans = connection.info.get("trace_spans") if connection is not None else None
+    if spans:
+        failed = spans.pop()
+        failed.error = str(exception_context.original_exception)[:500]
+        failed.finish()
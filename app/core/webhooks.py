@@ -0,0 +1,248 @@
+import asyncio
+import hashlib
+import hmac
+import ipaddress
+import random
+import socket
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
+
+import httpx
+from pydantic_core import to_json
+
+from app.core.config import settings
+from app.core.logging import logger
+
+
+# -------------------------------------------------------------------
+# Webhook delivery
+# -------------------------------------------------------------------
+# Deliveries share one pooled httpx.AsyncClient, so repeat deliveries to an
+# endpoint reuse keep-alive connections. Each endpoint gets at most
+# ``max_concurrency`` requests in flight. Events that arrive while all of
+# those are busy wait in the endpoint's queue and go out together in the next
+# request, so a slow receiver gets fewer, larger requests instead of an
+# ever-growing backlog. Every request body is ``{"events": [...]}``.
+
+SIGNATURE_HEADER = "X-Webhook-Signature"
+TIMESTAMP_HEADER = "X-Webhook-Timestamp"
+
+
+def sign(secret: str, timestamp: str, body: bytes) -> str:
+    """``sha256=`` HMAC of ``"{timestamp}." + body``; receivers recompute and compare."""
+    digest = hmac.new(secret.encode(), timestamp.encode() + b"." + body, hashlib.sha256).hexdigest()
+    return f"sha256={digest}"
+
+
+class WebhookDeliveryError(Exception):
+    pass
+
+
+class UnsafeWebhookTarget(WebhookDeliveryError):
+    """The URL points at loopback, private, link-local or reserved addresses."""
+
+
+def _allowed_networks() -> List[Any]:
+    networks = []
+    for entry in settings.WEBHOOK_ALLOWED_HOSTS:
+        try:
+            networks.append(ipaddress.ip_network(entry, strict=False))
+        except ValueError:
+            pass  # a hostname, matched by name
+    return networks
+
+
+async def check_target(url: str) -> None:
+    """
+    Resolve the URL's host and raise UnsafeWebhookTarget unless every address
+    is publicly routable or allowlisted in WEBHOOK_ALLOWED_HOSTS. Runs when a
+    subscription is created and again before each delivery, so a hostname
+    re-pointed at an internal address later is still refused. Redirects are
+    never followed.
+    """
+    parsed = httpx.URL(url)
+    host = parsed.host
+    if parsed.scheme not in ("http", "https") or not host:
+        raise UnsafeWebhookTarget(f"{url}: not an absolute http(s) URL")
+    if host.lower() in {entry.lower() for entry in settings.WEBHOOK_ALLOWED_HOSTS}:
+        return
+    try:
+        addresses = [ipaddress.ip_address(host)]
+    except ValueError:
+        try:
+            infos = await asyncio.get_running_loop().getaddrinfo(host, parsed.port or 443, type=socket.SOCK_STREAM)
+        except socket.gaierror as exc:
+            raise UnsafeWebhookTarget(f"{host}: cannot be resolved ({exc})") from exc
+        addresses = [ipaddress.ip_address(info[4][0].split("%")[0]) for info in infos]
+
+    allowed = _allowed_networks()
+    for address in addresses:
+        if isinstance(address, ipaddress.IPv6Address) and address.ipv4_mapped:
+            address = address.ipv4_mapped
+        if any(address in network for network in allowed):
+            continue
+        if not address.is_global or address.is_multicast:
+            raise UnsafeWebhookTarget(f"{host}: resolves to non-public address {address}")
+
+
+class _Endpoint:
+    def __init__(self, dispatcher: "WebhookDispatcher", url: str, secret: str):
+        self.dispatcher = dispatcher
+        self.url = url
+        self.secret = secret
+        self.pending: Deque[Tuple[Dict[str, Any], asyncio.Future, Optional[float]]] = deque()
+        self.in_flight = 0
+
+    def kick(self) -> None:
+        while self.pending and self.in_flight < self.dispatcher.max_concurrency:
+            batch = [self.pending.popleft() for _ in range(min(len(self.pending), self.dispatcher.max_batch))]
+            self.in_flight += 1
+            self.dispatcher._spawn(self._send(batch))
+
+    async def _send(self, batch: List[Tuple[Dict[str, Any], asyncio.Future, Optional[float]]]) -> None:
+        # The batch gives up when its most impatient caller would.
+        deadlines = [deadline for _, _, deadline in batch if deadline is not None]
+        try:
+            await self.dispatcher._post(
+                self.url, self.secret, [event for event, _, _ in batch], min(deadlines, default=None)
+            )
+        except Exception as exc:
+            for _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(exc)
+        else:
+            for _, future, _ in batch:
+                if not future.done():
+                    future.set_result(None)
+        finally:
+            self.in_flight -= 1
+            self.kick()
+            if not self.pending and not self.in_flight:
+                self.dispatcher._endpoints.pop((self.url, self.secret), None)
+
+
+class WebhookDispatcher:
+    def __init__(
+        self,
+        client: Optional[httpx.AsyncClient] = None,
+        max_concurrency: int = settings.WEBHOOK_MAX_CONCURRENCY_PER_ENDPOINT,
+        max_batch: int = settings.WEBHOOK_MAX_BATCH,
+        max_attempts: int = settings.WEBHOOK_MAX_ATTEMPTS,
+        retry_base: float = settings.WEBHOOK_RETRY_BASE_SECONDS,
+        retry_max: float = settings.WEBHOOK_RETRY_MAX_SECONDS,
+    ):
+        self._client = client
+        self.max_concurrency = max_concurrency
+        self.max_batch = max_batch
+        self.max_attempts = max_attempts
+        self.retry_base = retry_base
+        self.retry_max = retry_max
+        self._endpoints: Dict[Tuple[str, str], _Endpoint] = {}
+        self._tasks: Set[asyncio.Task] = set()
+        self.stats = {"requests": 0, "events": 0, "retries": 0, "failures": 0, "max_batch": 0}
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=settings.WEBHOOK_TIMEOUT_SECONDS,
+                limits=httpx.Limits(
+                    max_connections=settings.WEBHOOK_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.WEBHOOK_MAX_CONNECTIONS,
+                    keepalive_expiry=30,
+                ),
+                headers={"User-Agent": "bugtracker-webhooks/1"},
+            )
+        return self._client
+
+    async def deliver(self, url: str, secret: str, event: Dict[str, Any], deadline: Optional[float] = None) -> None:
+        """
+        Queue one event for an endpoint and wait until it has been accepted
+        (2xx). Raises WebhookDeliveryError once retries are exhausted or, if
+        ``deadline`` (event loop time) is given, once it is reached: sending
+        and retrying stop there, so nothing is delivered after the caller has
+        given up.
+        """
+        key = (url, secret)
+        endpoint = self._endpoints.get(key)
+        if endpoint is None:
+            endpoint = self._endpoints[key] = _Endpoint(self, url, secret)
+        future = asyncio.get_running_loop().create_future()
+        entry = (event, future, deadline)
+        endpoint.pending.append(entry)
+        endpoint.kick()
+        try:
+            await future
+        except asyncio.CancelledError:
+            # The caller gave up (outbox handler timeout): do not send it later.
+            if entry in endpoint.pending:
+                endpoint.pending.remove(entry)
+            raise
+
+    def _spawn(self, coro) -> None:
+        # Keep a reference so in-flight sends are not garbage collected.
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _post(
+        self, url: str, secret: str, events: List[Dict[str, Any]], deadline: Optional[float] = None
+    ) -> None:
+        body = to_json({"events": events})
+        self.stats["max_batch"] = max(self.stats["max_batch"], len(events))
+        try:
+            await check_target(url)
+        except UnsafeWebhookTarget as exc:
+            self.stats["failures"] += 1
+            logger.warning("webhook_target_refused", url=url, error=str(exc))
+            raise
+        error = "no response"
+        try:
+            async with asyncio.timeout_at(deadline):
+                for attempt in range(1, self.max_attempts + 1):
+                    timestamp = str(int(time.time()))
+                    headers = {
+                        "Content-Type": "application/json",
+                        TIMESTAMP_HEADER: timestamp,
+                        SIGNATURE_HEADER: sign(secret, timestamp, body),
+                    }
+                    retry_after = None
+                    self.stats["requests"] += 1
+                    try:
+                        response = await self.client.post(url, content=body, headers=headers)
+                    except httpx.HTTPError as exc:
+                        error = f"{type(exc).__name__}: {exc}"
+                    else:
+                        if response.is_success:
+                            self.stats["events"] += len(events)
+                            return
+                        error = f"HTTP {response.status_code}"
+                        # Other 4xx responses will not change on retry.
+                        if response.is_client_error and response.status_code not in (408, 429):
+                            break
+                        retry_after = response.headers.get("Retry-After")
+                    if attempt < self.max_attempts:
+                        delay = self._backoff(attempt, retry_after)
+                        if deadline is not None and asyncio.get_running_loop().time() + delay >= deadline:
+                            break
+                        self.stats["retries"] += 1
+                        await asyncio.sleep(delay)
+        except TimeoutError:
+            error = f"{error}; deadline reached"
+        self.stats["failures"] += 1
+        logger.warning("webhook_delivery_failed", url=url, events=len(events), error=error)
+        raise WebhookDeliveryError(f"{url}: {error}")
+
+    def _backoff(self, attempt: int, retry_after: Optional[str]) -> float:
+        if retry_after is not None and retry_after.isdigit():
+            return min(float(retry_after), self.retry_max)
+        ceiling = min(self.retry_base * 2 ** (attempt - 1), self.retry_max)
+        return random.uniform(0, ceiling)
+
+    async def aclose(self) -> None:
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
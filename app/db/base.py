@@ -5,3 +5,5 @@ from app.models.user import User
 from app.models.project import Project
 from app.models.issue import Issue
 from app.models.comment import Comment
+from app.models.outbox import OutboxEvent
+from app.models.webhook import WebhookDelivery, WebhookSubscription
@@ -1,13 +1,39 @@
+import time
+
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from app.core.config import settings
+from app.core.metrics import db_pool_checkout, pool_wait_peak, register_pool_gauges
+
+
+class TimedQueuePool(AsyncAdaptedQueuePool):
+    """Records how long each checkout waited for (or opened) a connection."""
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            waited = time.perf_counter() - started
+            db_pool_checkout.observe(waited)
+            pool_wait_peak.observe(waited)
+
+
+_engine_options = {}
+if not settings.SQLALCHEMY_DATABASE_URI.startswith("sqlite"):
+    _engine_options["poolclass"] = TimedQueuePool
 
 engine = create_async_engine(
     settings.SQLALCHEMY_DATABASE_URI,
     echo=False,
     future=True,
     pool_pre_ping=True,
+    **_engine_options,
 )
 
+if isinstance(engine.pool, AsyncAdaptedQueuePool):
+    register_pool_gauges(engine.pool)
+
 AsyncSessionLocal = async_sessionmaker(
     bind=engine,
     class_=AsyncSession,
@@ -22,3 +48,10 @@ async def get_db() -> AsyncSession:
             yield session
         finally:
             await session.close()
+
+# Registers the flush listeners that write outbox rows alongside domain changes.
+import app.core.outbox  # noqa: E402,F401
+# Registers the cursor hooks behind Server-Timing and the slow-query log.
+import app.core.request_timing  # noqa: E402,F401
+# Registers the cursor hooks behind SQL spans.
+import app.core.tracing  # noqa: E402,F401
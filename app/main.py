@@ -1,6 +1,8 @@
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, Request
+import asyncio
+
+from fastapi import Depends, FastAPI, Request, Response
 from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
@@ -9,10 +11,23 @@ from redis.exceptions import ConnectionError as RedisConnectionError
 
 from app.core.config import settings
 from app.api.v1.api import api_router
-from app.core.logging import setup_logging
+from app.core.logging import setup_logging, stop_logging
+from app.api.deps import bind_route
 from app.middlewares.global_rate_limit import GlobalRateLimitMiddleware
+from app.middlewares.idempotency import IdempotencyMiddleware
+from app.middlewares.metrics import MetricsMiddleware
+from app.middlewares.profiling import ProfilingMiddleware
+from app.middlewares.tracing import TracingMiddleware
+from app.middlewares.request_context import RequestContextMiddleware
+from app.middlewares.admission import AdmissionControlMiddleware
+from app.middlewares.request_timing import RequestTimingMiddleware
+from app.core.serialization import TimedJSONResponse
+from app.core.metrics import CONTENT_TYPE, monitor_event_loop_lag, registry
+from app.core.tracing import tracer
+from app.core.health import health_monitor
 from app.core.exceptions import BaseAPIException
 from app.db.init_db import init_db
+from app.core.events import event_broker
 
 
 # -------------------------------------------------------------------
@@ -26,6 +41,9 @@ setup_logging()
 # -------------------------------------------------------------------
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    # Reinstalls the log pipeline if a previous shutdown stopped it.
+    setup_logging()
+
     # 🔐 Startup validation
     print("Startup: Validating configuration...")
 
@@ -41,10 +59,26 @@ async def lifespan(app: FastAPI):
     await init_db()
     print("Startup: Database schema ready.")
 
+    # Admission control reads the loop lag this records.
+    lag_monitor = (
+        asyncio.create_task(monitor_event_loop_lag())
+        if settings.METRICS_ENABLED or settings.ADMISSION_CONTROL_ENABLED else None
+    )
+    health_probes = asyncio.create_task(health_monitor.run())
+    span_exporter = asyncio.create_task(tracer.run()) if settings.TRACING_ENABLED else None
+
     yield
 
     # Optional shutdown logic
     print("Shutdown: Application shutting down.")
+    if lag_monitor is not None:
+        lag_monitor.cancel()
+    health_probes.cancel()
+    if span_exporter is not None:
+        span_exporter.cancel()
+        await tracer.close()
+    await event_broker.close()
+    stop_logging()
 
 
 # -------------------------------------------------------------------
@@ -54,6 +88,8 @@ app = FastAPI(
     title=settings.PROJECT_NAME,
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
     lifespan=lifespan,
+    default_response_class=TimedJSONResponse,
+    dependencies=[Depends(bind_route)],
 )
 
 
@@ -61,6 +97,19 @@ app = FastAPI(
 # Middleware
 # -------------------------------------------------------------------
 
+# Orchestrator probes and scrapes: never shed, or an overloaded pod looks dead
+PROBE_PATHS = ("/health", "/live", "/ready", "/metrics")
+
+# On-demand request profiling (innermost: must share the endpoint's task)
+if settings.PROFILING_ENABLED:
+    app.add_middleware(ProfilingMiddleware)
+
+# Idempotency-Key replay for create endpoints (after rate limiting)
+app.add_middleware(
+    IdempotencyMiddleware,
+    paths=[f"{settings.API_V1_STR}/issues/", f"{settings.API_V1_STR}/comments/"],
+)
+
 # CORS
 if settings.BACKEND_CORS_ORIGINS:
     app.add_middleware(
@@ -71,10 +120,10 @@ if settings.BACKEND_CORS_ORIGINS:
         allow_headers=["*"],
     )
 
-# Global Rate Limiting (100 req/min/IP)
+# Global Rate Limiting (100 req/min/IP by default)
 app.add_middleware(
     GlobalRateLimitMiddleware,
-    times=100,
+    times=settings.GLOBAL_RATE_LIMIT_PER_MINUTE,
     seconds=60,
 )
 
@@ -84,6 +133,24 @@ app.add_middleware(
     allowed_hosts=settings.ALLOWED_HOSTS,
 )
 
+# Per-request DB / Redis / auth / serialize timings (Server-Timing header)
+app.add_middleware(RequestTimingMiddleware)
+
+# Request id / user id / route log context and the access log
+app.add_middleware(RequestContextMiddleware)
+
+# Root span per request, traceparent propagation and log correlation
+if settings.TRACING_ENABLED:
+    app.add_middleware(TracingMiddleware)
+
+# Shed load with 503 + Retry-After before any other work is done
+if settings.ADMISSION_CONTROL_ENABLED:
+    app.add_middleware(AdmissionControlMiddleware, exempt_paths=PROBE_PATHS)
+
+# Request metrics (outermost, so rejected requests are counted too)
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
 
 # -------------------------------------------------------------------
 # Health Check
@@ -96,6 +163,34 @@ async def health_check():
     return {"status": "ok"}
 
 
+@app.get("/live", tags=["health"])
+async def liveness():
+    """
+    Liveness: the process is up and its event loop is serving requests.
+    """
+    return {"status": "alive"}
+
+
+@app.get("/ready", tags=["health"])
+async def readiness():
+    """
+    Readiness: cached result of the background DB / Redis probes.
+    """
+    ready = health_monitor.ready()
+    return JSONResponse(
+        status_code=200 if ready else 503,
+        content={"status": "ready" if ready else "unavailable", "dependencies": health_monitor.status},
+    )
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """
+    Prometheus text exposition of this worker's metrics.
+    """
+    return Response(registry.render(), media_type=CONTENT_TYPE)
+
+
 # -------------------------------------------------------------------
 # Exception Handlers
 # -------------------------------------------------------------------
@@ -7,7 +7,7 @@ from app.core.rate_limit import RateLimiter
 class GlobalRateLimitMiddleware(BaseHTTPMiddleware):
     def __init__(self, app, times: int = 100, seconds: int = 60):
         super().__init__(app)
-        self.limiter = RateLimiter(times=times, seconds=seconds)
+        self.limiter = RateLimiter(times=times, seconds=seconds, name="global")
 
     async def dispatch(self, request: Request, call_next):
         # We need to manually call the limiter.
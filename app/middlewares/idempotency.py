@@ -0,0 +1,218 @@
+import asyncio
+import base64
+import hashlib
+import json
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from jose import JWTError, jwt
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.logging import logger
+from app.core.rate_limit import redis_client
+
+
+# -------------------------------------------------------------------
+# Idempotency keys
+# -------------------------------------------------------------------
+# A POST sent with ``Idempotency-Key`` is executed at most once per caller
+# and key. The first request claims the key with SET NX. Its response is
+# stored, and a retry with the same key and body gets that stored response
+# back without executing again. A duplicate that arrives while the first is
+# still running waits for its result instead of racing it. If the first
+# request fails with a 5xx the key is released so the client can retry.
+
+IDEMPOTENCY_HEADER = b"idempotency-key"
+REPLAYED_HEADER = "Idempotent-Replayed"
+
+# Outcomes that may change on retry are not stored.
+_RETRYABLE_STATUSES = {401, 408, 409, 429}
+
+_RELEASED = object()
+
+
+def _caller(scope: Scope) -> Optional[str]:
+    # Keys are scoped to the verified token subject, so a key can never
+    # replay another user's response and survives token refresh.
+    for name, value in scope["headers"]:
+        if name == b"authorization":
+            scheme, _, token = value.decode("latin-1").partition(" ")
+            if scheme.lower() != "bearer":
+                return None
+            try:
+                payload = jwt.decode(
+                    token, settings.PUBLIC_KEY, algorithms=[settings.ALGORITHM], options={"verify_aud": False}
+                )
+            except JWTError:
+                return None
+            return payload.get("sub")
+    return None
+
+
+def _header(scope: Scope, name: bytes) -> Optional[str]:
+    for key, value in scope["headers"]:
+        if key == name:
+            return value.decode("latin-1")
+    return None
+
+
+async def _read_body(receive: Receive) -> bytes:
+    chunks: List[bytes] = []
+    while True:
+        message = await receive()
+        if message["type"] != "http.request":
+            break
+        chunks.append(message.get("body", b""))
+        if not message.get("more_body", False):
+            break
+    return b"".join(chunks)
+
+
+async def _send_json(send: Send, status: int, detail: str) -> None:
+    body = json.dumps({"detail": detail}).encode()
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())],
+    })
+    await send({"type": "http.response.body", "body": body})
+
+
+class IdempotencyMiddleware:
+    """
+    Pure ASGI middleware so the request body is read once and replayed to
+    the app, and the response is captured without buffering through
+    ``BaseHTTPMiddleware``.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        paths: Iterable[str],
+        ttl: int = settings.IDEMPOTENCY_TTL_SECONDS,
+        lock_ttl: int = settings.IDEMPOTENCY_LOCK_SECONDS,
+        wait: float = settings.IDEMPOTENCY_WAIT_SECONDS,
+    ):
+        self.app = app
+        self.paths = frozenset(paths)
+        self.ttl = ttl
+        self.lock_ttl = lock_ttl
+        self.wait = wait
+        # Same-worker duplicates are woken as soon as the first request
+        # finishes; duplicates on other workers poll the store.
+        self._in_flight: Dict[str, asyncio.Event] = {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "POST" or scope["path"] not in self.paths:
+            await self.app(scope, receive, send)
+            return
+        idempotency_key = _header(scope, IDEMPOTENCY_HEADER)
+        if idempotency_key is None:
+            await self.app(scope, receive, send)
+            return
+        if not 0 < len(idempotency_key) <= 255:
+            await _send_json(send, 400, "Idempotency-Key must be 1-255 characters")
+            return
+        caller = _caller(scope)
+        if caller is None:
+            # Unauthenticated: let the endpoint reject it as usual.
+            await self.app(scope, receive, send)
+            return
+
+        body = await _read_body(receive)
+        fingerprint = hashlib.sha256(body).hexdigest()
+        digest = hashlib.sha256(f"{caller}:{scope['path']}:{idempotency_key}".encode()).hexdigest()
+        key = f"idempotency:{digest}"
+
+        pending = json.dumps({"state": "pending", "fingerprint": fingerprint})
+        while True:
+            if await redis_client.set(key, pending, ex=self.lock_ttl, nx=True):
+                await self._execute(key, fingerprint, scope, body, send)
+                return
+            record = await self._wait_for_result(key)
+            if record is not _RELEASED:
+                break
+            # The first attempt failed and gave the key up; run this one instead.
+
+        if record is None:
+            await _send_json(send, 409, "A request with this Idempotency-Key is still being processed")
+        elif record["fingerprint"] != fingerprint:
+            await _send_json(send, 422, "Idempotency-Key was already used with a different request body")
+        else:
+            await self._replay(record, send)
+
+    async def _execute(self, key: str, fingerprint: str, scope: Scope, body: bytes, send: Send) -> None:
+        done = self._in_flight[key] = asyncio.Event()
+        status = 500
+        headers: List[Tuple[bytes, bytes]] = []
+        chunks: List[bytes] = []
+        sent = False
+
+        async def receive() -> Message:
+            nonlocal sent
+            if not sent:
+                sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            return {"type": "http.disconnect"}
+
+        async def capture(message: Message) -> None:
+            nonlocal status, headers
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                headers = list(message.get("headers", []))
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, capture)
+        finally:
+            try:
+                if status >= 500 or status in _RETRYABLE_STATUSES:
+                    await redis_client.delete(key)
+                else:
+                    record = {
+                        "state": "done",
+                        "fingerprint": fingerprint,
+                        "status": status,
+                        "headers": [(name.decode("latin-1"), value.decode("latin-1")) for name, value in headers],
+                        "body": base64.b64encode(b"".join(chunks)).decode(),
+                    }
+                    await redis_client.set(key, json.dumps(record), ex=self.ttl)
+            except Exception as exc:
+                # The lock expires on its own; the response already went out.
+                logger.warning("idempotency_store_failed", error=str(exc))
+            finally:
+                self._in_flight.pop(key, None)
+                done.set()
+
+    async def _wait_for_result(self, key: str) -> Any:
+        """The stored record, ``_RELEASED`` if the key was given up, or None on timeout."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.wait
+        delay = 0.05
+        while True:
+            raw = await redis_client.get(key)
+            if raw is None:
+                return _RELEASED
+            record = json.loads(raw)
+            if record["state"] == "done":
+                return record
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return None
+            event = self._in_flight.get(key)
+            try:
+                if event is not None:
+                    await asyncio.wait_for(event.wait(), remaining)
+                else:
+                    await asyncio.sleep(min(delay, remaining))
+                    delay = min(delay * 2, 1.0)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _replay(self, record: Dict, send: Send) -> None:
+        headers = [(name.encode("latin-1"), value.encode("latin-1")) for name, value in record["headers"]]
+        headers.append((REPLAYED_HEADER.lower().encode(), b"true"))
+        await send({"type": "http.response.start", "status": record["status"], "headers": headers})
+        await send({"type": "http.response.body", "body": base64.b64decode(record["body"])})
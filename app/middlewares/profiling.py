@@ -0,0 +1,51 @@
+import asyncio
+import threading
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.profiler import (
+    PROFILE_ID_HEADER,
+    PROFILE_TOKEN_HEADER,
+    Sampler,
+    new_profile_id,
+    save_profile,
+    verify_profile_token,
+)
+
+
+class ProfilingMiddleware:
+    """
+    Profiles requests that carry a valid ``X-Profile-Token``. Installed
+    innermost so the endpoint runs in the same task as this middleware, which
+    is how the sampler tells this request apart from others on the loop. The
+    stored profile's id is returned in ``X-Profile-Id``.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        token = next((value for name, value in scope["headers"] if name == PROFILE_TOKEN_HEADER), None)
+        if token is None or not verify_profile_token(token.decode("latin-1")):
+            await self.app(scope, receive, send)
+            return
+
+        profile_id = new_profile_id()
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = [*message.get("headers", []), (PROFILE_ID_HEADER.lower().encode(), profile_id.encode())]
+                message = {**message, "headers": headers}
+            await send(message)
+
+        sampler = Sampler(
+            threading.get_ident(), loop=asyncio.get_running_loop(), task=asyncio.current_task()
+        ).start()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            await asyncio.to_thread(sampler.stop)
+            await save_profile(sampler, f"{scope['method']} {scope['path']}", profile_id)
@@ -0,0 +1,68 @@
+import re
+import time
+from uuid import uuid4
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.logging import end_request_context, logger, request_context, start_request_context
+from app.middlewares.metrics import route_template
+
+REQUEST_ID_HEADER = b"x-request-id"
+
+# Accept the proxy's id if it is a sane token, otherwise mint our own.
+_REQUEST_ID = re.compile(rb"^[A-Za-z0-9._:-]{1,128}$")
+
+
+class RequestContextMiddleware:
+    """
+    Opens the request's log context (request id, later user id and route)
+    and writes one access log line per request. The request id is taken from
+    X-Request-ID when present and echoed back on the response.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        incoming = next((value for name, value in scope["headers"] if name == REQUEST_ID_HEADER), b"")
+        request_id = incoming.decode("ascii") if _REQUEST_ID.match(incoming) else uuid4().hex
+        started = time.perf_counter()
+        status = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                message.setdefault("headers", [])
+                message["headers"] = [*message["headers"], (REQUEST_ID_HEADER, request_id.encode("ascii"))]
+            await send(message)
+
+        token = start_request_context(request_id=request_id)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            if settings.ACCESS_LOG_ENABLED:
+                self._log_access(scope, status, (time.perf_counter() - started) * 1000)
+            end_request_context(token)
+
+    @staticmethod
+    def _log_access(scope: Scope, status: int, duration_ms: float) -> None:
+        if status >= 500:
+            log = logger.error
+        elif status >= 400 or duration_ms >= settings.ACCESS_LOG_SLOW_MS:
+            log = logger.warning
+        else:
+            log = logger.info
+        log(
+            "access",
+            method=scope["method"],
+            path=scope["path"],
+            route=request_context().get("route") or route_template(scope),
+            status=status,
+            duration_ms=round(duration_ms, 2),
+        )
@@ -0,0 +1,57 @@
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.logging import bind_request_context, logger
+from app.core.request_timing import end_request, start_request
+
+
+class RequestTimingMiddleware:
+    """
+    Collects per-request DB / Redis / auth / serialization time, sends it as
+    a ``Server-Timing`` header and reports repeated statement shapes (N+1
+    query loops) when ``N_PLUS_ONE_DETECTION`` is on. Requests slower than
+    ``ACCESS_LOG_SLOW_MS`` get their query count and slowest statement added
+    to the access log line.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = start_request(scope["path"])
+        timings = token.var.get()
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start" and settings.SERVER_TIMING_ENABLED:
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", timings.server_timing().encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            end_request(token)
+            slowest_seconds, slowest_statement = timings.slowest
+            if slowest_statement and timings.elapsed() * 1000 >= settings.ACCESS_LOG_SLOW_MS:
+                # Parameters are left out: they carry user content.
+                bind_request_context(
+                    db_queries=timings.queries,
+                    db_ms=round(timings.phases["db"] * 1000, 2),
+                    slowest_query_ms=round(slowest_seconds * 1000, 2),
+                    slowest_query=" ".join(slowest_statement.split())[:2000],
+                )
+            if settings.N_PLUS_ONE_DETECTION:
+                for shape, count in timings.repeated_statements(settings.N_PLUS_ONE_THRESHOLD):
+                    logger.warning(
+                        "n_plus_one_detected",
+                        method=scope["method"],
+                        path=scope["path"],
+                        count=count,
+                        queries=timings.queries,
+                        statement=shape[:2000],
+                    )
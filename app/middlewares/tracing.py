@@ -0,0 +1,45 @@
+import structlog
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.tracing import activate, start_trace
+from app.middlewares.metrics import route_template
+
+
+class TracingMiddleware:
+    """
+    Opens the root span of each request, continuing an incoming W3C
+    ``traceparent`` when there is one, and binds ``trace_id`` / ``span_id``
+    into structlog's contextvars so every log line of the request carries them.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        traceparent = next((value.decode("latin-1") for name, value in scope["headers"] if name == b"traceparent"), None)
+        root = start_trace(f"{scope['method']} {scope['path']}", traceparent)
+        root.attributes["layer"] = "http"
+        root.attributes["http.method"] = scope["method"]
+        status = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        tokens = structlog.contextvars.bind_contextvars(trace_id=root.trace_id, span_id=root.span_id)
+        try:
+            with activate(root):
+                try:
+                    await self.app(scope, receive, send_wrapper)
+                finally:
+                    root.name = f"{scope['method']} {route_template(scope)}"
+                    root.attributes["http.route"] = route_template(scope)
+                    root.attributes["http.status_code"] = status
+        finally:
+            structlog.contextvars.reset_contextvars(**tokens)
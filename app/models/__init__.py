@@ -3,3 +3,5 @@ from app.models.user import User
 from app.models.project import Project
 from app.models.issue import Issue, IssueStatus
 from app.models.comment import Comment
+from app.models.outbox import OutboxEvent
+from app.models.webhook import WebhookSubscription
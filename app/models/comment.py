@@ -1,10 +1,12 @@
-from sqlalchemy import ForeignKey, Text
+from sqlalchemy import ForeignKey, Index, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.db.base_class import Base
 from app.db.mixins import TimestampMixin
 
 class Comment(TimestampMixin, Base):
     __tablename__ = "comments"
+    # Keyset order for the /changes delta-sync feed
+    __table_args__ = (Index("ix_comments_updated_at_id", "updated_at", "id"),)
 
     content: Mapped[str] = mapped_column(Text, nullable=False)
     
@@ -1,5 +1,5 @@
 import enum
-from sqlalchemy import String, ForeignKey, Text, Enum
+from sqlalchemy import String, ForeignKey, Text, Enum, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.db.base_class import Base
 from app.db.mixins import TimestampMixin
@@ -13,6 +13,8 @@ class IssueStatus(str, enum.Enum):
 
 class Issue(TimestampMixin, Base):
     __tablename__ = "issues"
+    # Keyset order for the /changes delta-sync feed
+    __table_args__ = (Index("ix_issues_updated_at_id", "updated_at", "id"),)
 
     title: Mapped[str] = mapped_column(String, index=True, nullable=False)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
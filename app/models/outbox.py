@@ -0,0 +1,28 @@
+from datetime import datetime, timezone
+from typing import Any
+from sqlalchemy import String, Integer, Text, DateTime, JSON, Index
+from sqlalchemy.orm import Mapped, mapped_column
+from app.db.base_class import Base
+from app.db.mixins import TimestampMixin
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class OutboxEvent(TimestampMixin, Base):
+    __tablename__ = "outbox_events"
+    # The worker claims pending rows in available_at order
+    __table_args__ = (Index("ix_outbox_events_status_available_at", "status", "available_at"),)
+
+    event_type: Mapped[str] = mapped_column(String(64), nullable=False)
+    aggregate_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    payload: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False)
+
+    status: Mapped[str] = mapped_column(String(16), default="pending", nullable=False) # pending, done, dead
+    attempts: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    # Worker-side timestamps are written from Python so they compare consistently on every backend
+    available_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=_utcnow, nullable=False)
+    locked_until: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    processed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
@@ -11,6 +11,8 @@ class UserRole(str, enum.Enum):
 
 class User(TimestampMixin, Base):
     __tablename__ = "users"
+    # Never copied into cache entries or outbox payloads.
+    __snapshot_exclude__ = ("hashed_password",)
 
     username: Mapped[str] = mapped_column(String(50), unique=True, index=True, nullable=False)
     email: Mapped[str] = mapped_column(String, unique=True, index=True, nullable=False)
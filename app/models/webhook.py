@@ -0,0 +1,27 @@
+from sqlalchemy import String, Boolean, ForeignKey, Integer, JSON, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from app.db.base_class import Base
+from app.db.mixins import TimestampMixin
+
+class WebhookSubscription(TimestampMixin, Base):
+    __tablename__ = "webhook_subscriptions"
+
+    url: Mapped[str] = mapped_column(String(2048), nullable=False)
+    secret: Mapped[str] = mapped_column(String(128), nullable=False) # HMAC key for X-Webhook-Signature
+    event_types: Mapped[list[str]] = mapped_column(JSON, nullable=False) # e.g. ["issue.updated"], or ["*"]
+    is_active: Mapped[bool] = mapped_column(Boolean, default=True)
+
+    project_id: Mapped[int] = mapped_column(ForeignKey("projects.id"), index=True)
+    created_by_id: Mapped[int] = mapped_column(ForeignKey("users.id"))
+
+    project = relationship("Project")
+
+
+class WebhookDelivery(TimestampMixin, Base):
+    """An outbox event accepted by one subscription; retries of the event skip it."""
+    __tablename__ = "webhook_deliveries"
+    __table_args__ = (UniqueConstraint("event_id", "subscription_id", name="uq_webhook_deliveries_event_subscription"),)
+
+    # No foreign key: outbox rows are purged independently.
+    event_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    subscription_id: Mapped[int] = mapped_column(ForeignKey("webhook_subscriptions.id", ondelete="CASCADE"), nullable=False)
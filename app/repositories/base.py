@@ -1,20 +1,87 @@
-from typing import Generic, TypeVar, Type, Optional, List, Any
+from datetime import datetime, timezone
+from typing import Generic, TypeVar, Type, Optional, List, Any, Dict, Iterable, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, delete
+from sqlalchemy import select, update, delete, inspect, func, tuple_
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy.orm.util import identity_key
 from app.db.base_class import Base
+from app.core.cache import entity_cache, snapshot_row, restore_row
+from app.core.tracing import traced
 
 ModelType = TypeVar("ModelType", bound=Base)
 
+@traced("repository")
 class BaseRepository(Generic[ModelType]):
+    # Entity name used by the read-through cache; None disables caching.
+    cache_entity: Optional[str] = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        traced("repository")(cls)
+
     def __init__(self, model: Type[ModelType], db: AsyncSession):
         self.model = model
         self.db = db
 
-    async def get_by_id(self, id: Any) -> Optional[ModelType]:
+    async def get_by_id(self, id: Any, cached: bool = True) -> Optional[ModelType]:
+        if not cached or not entity_cache.is_enabled(self.cache_entity):
+            return await self._get_by_id_uncached(id)
+
+        # Already loaded in this session: no query and no cache lookup needed.
+        existing = self.db.identity_map.get(identity_key(self.model, id))
+        if existing is not None and not inspect(existing).expired_attributes:
+            return existing
+
+        version = await entity_cache.version(self.cache_entity, id)
+        data = await entity_cache.get(self.cache_entity, id, version)
+        if data is not None:
+            return await self.attach(data)
+
+        db_obj = await self._get_by_id_uncached(id)
+        if db_obj is not None:
+            await entity_cache.set(self.cache_entity, id, version, snapshot_row(db_obj))
+        return db_obj
+
+    async def attach(self, data: Dict[str, Any]) -> ModelType:
+        """Bring a row snapshot into this session as a persistent object, without a query."""
+        db_obj = restore_row(self.model, data)
+        make_transient_to_detached(db_obj)
+        return await self.db.merge(db_obj, load=False)
+
+    async def _get_by_id_uncached(self, id: Any) -> Optional[ModelType]:
         query = select(self.model).where(self.model.id == id)
         result = await self.db.execute(query)
         return result.scalars().first()
 
+    async def get_many(self, ids: Iterable[Any]) -> Dict[Any, ModelType]:
+        # One IN query for a batch of ids, keyed by id for the caller.
+        wanted = {id for id in ids if id is not None}
+        if not wanted:
+            return {}
+        query = select(self.model).where(self.model.id.in_(wanted))
+        result = await self.db.execute(query)
+        return {obj.id: obj for obj in result.scalars().all()}
+
+    def _changed_since(self, query, after: Optional[Tuple[datetime, int]], until: datetime, limit: int):
+        """
+        Keyset page over ``(updated_at, id)``: rows strictly after ``after``
+        and no newer than ``until``, oldest first. Served by the
+        ``(updated_at, id)`` index on the synced tables.
+        """
+        query = query.where(self.model.updated_at <= self._db_time(until))
+        if after is not None:
+            query = query.where(tuple_(self.model.updated_at, self.model.id) > tuple_(self._db_time(after[0]), after[1]))
+        return query.order_by(self.model.updated_at, self.model.id).limit(limit)
+
+    def _db_time(self, value: datetime):
+        if self.db.bind.dialect.name != "sqlite":
+            return value
+        # SQLite keeps server timestamps as naive UTC 'YYYY-MM-DD HH:MM:SS' text;
+        # render the parameter the same way so text comparison orders correctly.
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return func.datetime(value.isoformat(sep=" "))
+
     async def get_all(self, skip: int = 0, limit: int = 100) -> List[ModelType]:
         query = select(self.model).offset(skip).limit(limit)
         result = await self.db.execute(query)
@@ -41,6 +108,7 @@ class BaseRepository(Generic[ModelType]):
         except Exception:
             await self.db.rollback()
             raise
+        await self._invalidate(db_obj)
         return db_obj
 
     async def delete(self, db_obj: ModelType) -> ModelType:
@@ -50,4 +118,9 @@ class BaseRepository(Generic[ModelType]):
         except Exception:
             await self.db.rollback()
             raise
+        await self._invalidate(db_obj)
         return db_obj
+
+    async def _invalidate(self, db_obj: ModelType) -> None:
+        if self.cache_entity is not None:
+            await entity_cache.invalidate(self.cache_entity, db_obj.id)
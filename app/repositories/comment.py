@@ -1,8 +1,11 @@
-from typing import List
-from sqlalchemy import select
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.repositories.base import BaseRepository
 from app.models.comment import Comment
+from app.models.issue import Issue
+from app.models.project import Project
 
 class CommentRepository(BaseRepository[Comment]):
     def __init__(self, db: AsyncSession):
@@ -12,3 +15,47 @@ class CommentRepository(BaseRepository[Comment]):
         query = select(Comment).where(Comment.issue_id == issue_id).offset(skip).limit(limit)
         result = await self.db.execute(query)
         return result.scalars().all()
+
+    async def get_changed_since(
+        self, after: Optional[Tuple[datetime, int]], until: datetime, limit: int
+    ) -> List[Comment]:
+        query = (
+            select(Comment)
+            .join(Issue, Comment.issue_id == Issue.id)
+            .join(Project, Issue.project_id == Project.id)
+            .where(Project.is_archived == False)
+        )
+        result = await self.db.execute(self._changed_since(query, after, until, limit))
+        return result.scalars().all()
+
+    async def get_commented_issue_ids(self, issue_ids: Iterable[int]) -> Set[int]:
+        ids = set(issue_ids)
+        if not ids:
+            return set()
+        query = select(Comment.issue_id).where(Comment.issue_id.in_(ids)).distinct()
+        result = await self.db.execute(query)
+        return set(result.scalars().all())
+
+    async def get_latest_for_issues(self, issue_ids: Iterable[int], per_issue: int) -> Dict[int, List[Comment]]:
+        """
+        Latest ``per_issue`` comments for each issue in a single windowed query.
+        """
+        ids = set(issue_ids)
+        if not ids:
+            return {}
+        rank = func.row_number().over(
+            partition_by=Comment.issue_id,
+            order_by=(Comment.created_at.desc(), Comment.id.desc()),
+        ).label("rank")
+        ranked = select(Comment.id, rank).where(Comment.issue_id.in_(ids)).subquery()
+        query = (
+            select(Comment)
+            .join(ranked, Comment.id == ranked.c.id)
+            .where(ranked.c.rank <= per_issue)
+            .order_by(Comment.issue_id, ranked.c.rank)
+        )
+        result = await self.db.execute(query)
+        latest: Dict[int, List[Comment]] = {}
+        for comment in result.scalars().all():
+            latest.setdefault(comment.issue_id, []).append(comment)
+        return latest
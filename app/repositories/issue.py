@@ -1,8 +1,12 @@
-from typing import List, Optional
-from sqlalchemy import select, desc
+import enum
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
+from sqlalchemy import select, desc, insert, text
+from sqlalchemy.orm import joinedload, load_only
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.repositories.base import BaseRepository
 from app.models.issue import Issue, IssueStatus
+from app.models.project import Project
 
 class IssueRepository(BaseRepository[Issue]):
     def __init__(self, db: AsyncSession):
@@ -23,6 +27,7 @@ class IssueRepository(BaseRepository[Issue]):
         skip: int,
         limit: int,
         sort: str,
+        columns: Optional[Sequence[str]] = None,
     ) -> List[Issue]:
         sort_mapping = {
             "created_at": Issue.created_at,
@@ -35,6 +40,8 @@ class IssueRepository(BaseRepository[Issue]):
         order_clause = sort_mapping.get(sort, desc(Issue.created_at))
 
         query = select(Issue)
+        if columns:
+            query = query.options(self._load_only(columns))
         if project_id:
             query = query.where(Issue.project_id == project_id)
         if status:
@@ -49,3 +56,82 @@ class IssueRepository(BaseRepository[Issue]):
         query = query.order_by(order_clause).offset(skip).limit(limit)
         result = await self.db.execute(query)
         return result.scalars().all()
+
+    async def stream_by_project(self, project_id: int, batch_size: int = 1000) -> AsyncIterator[Any]:
+        """
+        Yield plain rows (no ORM identity map) for every issue in a project
+        from a server-side cursor, ``batch_size`` rows per fetch.
+        """
+        query = (
+            select(Issue.__table__)
+            .where(Issue.project_id == project_id)
+            .order_by(Issue.id)
+            .execution_options(yield_per=batch_size)
+        )
+        result = await self.db.stream(query)
+        async for row in result:
+            yield row
+
+    async def bulk_insert(self, rows: List[Dict[str, Any]]) -> List[Mapping[str, Any]]:
+        """
+        Insert many issues without committing: COPY on Postgres, a multi-row
+        INSERT ... RETURNING everywhere else. All rows must share keys.
+        Returns the inserted rows with every column, in input order.
+        """
+        if not rows:
+            return []
+        conn = await self.db.connection()
+        table = Issue.__table__
+        if conn.dialect.name == "postgresql":
+            # COPY cannot return generated ids, so reserve them up front.
+            ids = (await self.db.execute(
+                text("SELECT nextval(pg_get_serial_sequence('issues', 'id')) FROM generate_series(1, :n)"),
+                {"n": len(rows)},
+            )).scalars().all()
+            columns = ["id", *rows[0]]
+            # Enum columns are stored by member name, which COPY does not translate.
+            records = [
+                (id, *(value.name if isinstance(value, enum.Enum) else value for value in (row[c] for c in columns[1:])))
+                for id, row in zip(ids, rows)
+            ]
+            raw = await conn.get_raw_connection()
+            await raw.driver_connection.copy_records_to_table(
+                Issue.__tablename__, records=records, columns=columns
+            )
+            result = await self.db.execute(select(table).where(table.c.id.in_(ids)).order_by(table.c.id))
+        else:
+            result = await self.db.execute(insert(Issue).returning(*table.c, sort_by_parameter_order=True), rows)
+        return [row._mapping for row in result]
+
+    async def get_by_id_with_columns(self, id: int, columns: Sequence[str]) -> Optional[Issue]:
+        query = select(Issue).where(Issue.id == id).options(self._load_only(columns))
+        result = await self.db.execute(query)
+        return result.scalars().first()
+
+    async def get_existing_ids(self, ids: Iterable[int]) -> Set[int]:
+        wanted = set(ids)
+        if not wanted:
+            return set()
+        result = await self.db.execute(select(Issue.id).where(Issue.id.in_(wanted)))
+        return set(result.scalars().all())
+
+    async def get_changed_since(
+        self, after: Optional[Tuple[datetime, int]], until: datetime, limit: int
+    ) -> List[Issue]:
+        query = select(Issue).join(Project, Issue.project_id == Project.id).where(Project.is_archived == False)
+        result = await self.db.execute(self._changed_since(query, after, until, limit))
+        return result.scalars().all()
+
+    async def get_many_with_projects(self, ids: Iterable[int]) -> Dict[int, Issue]:
+        # Targets and their projects in one joined query, keyed by issue id.
+        wanted = set(ids)
+        if not wanted:
+            return {}
+        query = select(Issue).options(joinedload(Issue.project)).where(Issue.id.in_(wanted))
+        result = await self.db.execute(query)
+        return {issue.id: issue for issue in result.scalars().all()}
+
+    @staticmethod
+    def _load_only(columns: Sequence[str]):
+        # Primary key is always loaded by SQLAlchemy; project_id is kept for archive checks.
+        return load_only(*(getattr(Issue, name) for name in {*columns, "project_id"}))
@@ -1,10 +1,13 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import Iterable, List, Optional, Set, Tuple
 from sqlalchemy import select, asc, desc, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.repositories.base import BaseRepository
 from app.models.project import Project
 
 class ProjectRepository(BaseRepository[Project]):
+    cache_entity = "project"
+
     def __init__(self, db: AsyncSession):
         super().__init__(Project, db)
 
@@ -39,11 +42,28 @@ class ProjectRepository(BaseRepository[Project]):
         return result.scalars().all()
 
     async def get_by_id_active(self, id: int) -> Optional[Project]:
-        query = select(Project).where(Project.id == id, Project.is_archived == False)
-        result = await self.db.execute(query)
-        return result.scalars().first()
+        # Served through the entity cache; archived projects are filtered here.
+        project = await self.get_by_id(id)
+        if project is None or project.is_archived:
+            return None
+        return project
 
     async def get_by_key(self, key: str) -> Optional[Project]:
         query = select(Project).where(func.lower(Project.key) == key.lower())
         result = await self.db.execute(query)
         return result.scalars().first()
+
+    async def get_active_ids(self, ids: Iterable[int]) -> Set[int]:
+        wanted = set(ids)
+        if not wanted:
+            return set()
+        query = select(Project.id).where(Project.id.in_(wanted), Project.is_archived == False)
+        result = await self.db.execute(query)
+        return set(result.scalars().all())
+
+    async def get_archived_since(
+        self, after: Optional[Tuple[datetime, int]], until: datetime, limit: int
+    ) -> List[Project]:
+        query = select(Project).where(Project.is_archived == True)
+        result = await self.db.execute(self._changed_since(query, after, until, limit))
+        return result.scalars().all()
@@ -1,10 +1,12 @@
-from typing import Optional
+from typing import Iterable, Optional, Set
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.repositories.base import BaseRepository
 from app.models.user import User
 
 class UserRepository(BaseRepository[User]):
+    cache_entity = "user"
+
     def __init__(self, db: AsyncSession):
         super().__init__(User, db)
 
@@ -17,3 +19,11 @@ class UserRepository(BaseRepository[User]):
         query = select(User).where(User.username == username)
         result = await self.db.execute(query)
         return result.scalars().first()
+
+    async def get_active_ids(self, ids: Iterable[int]) -> Set[int]:
+        wanted = set(ids)
+        if not wanted:
+            return set()
+        query = select(User.id).where(User.id.in_(wanted), User.is_active == True)
+        result = await self.db.execute(query)
+        return set(result.scalars().all())
@@ -0,0 +1,53 @@
+from typing import Iterable, List, Set
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.repositories.base import BaseRepository
+from app.models.issue import Issue
+from app.models.webhook import WebhookDelivery, WebhookSubscription
+
+class WebhookRepository(BaseRepository[WebhookSubscription]):
+    def __init__(self, db: AsyncSession):
+        super().__init__(WebhookSubscription, db)
+
+    async def get_by_project(self, project_id: int) -> List[WebhookSubscription]:
+        query = select(WebhookSubscription).where(WebhookSubscription.project_id == project_id).order_by(WebhookSubscription.id)
+        result = await self.db.execute(query)
+        return result.scalars().all()
+
+    async def get_active_for_project(self, project_id: int) -> List[WebhookSubscription]:
+        query = select(WebhookSubscription).where(
+            WebhookSubscription.project_id == project_id,
+            WebhookSubscription.is_active == True,
+        )
+        result = await self.db.execute(query)
+        return result.scalars().all()
+
+    async def get_active_for_issue(self, issue_id: int) -> List[WebhookSubscription]:
+        # Comment events only carry the issue id; resolve the project in the same query.
+        project_id = select(Issue.project_id).where(Issue.id == issue_id).scalar_subquery()
+        query = select(WebhookSubscription).where(
+            WebhookSubscription.project_id == project_id,
+            WebhookSubscription.is_active == True,
+        )
+        result = await self.db.execute(query)
+        return result.scalars().all()
+
+    async def get_delivered_subscription_ids(self, event_id: int, subscription_ids: Iterable[int]) -> Set[int]:
+        wanted = set(subscription_ids)
+        if not wanted:
+            return set()
+        query = select(WebhookDelivery.subscription_id).where(
+            WebhookDelivery.event_id == event_id,
+            WebhookDelivery.subscription_id.in_(wanted),
+        )
+        result = await self.db.execute(query)
+        return set(result.scalars().all())
+
+    async def record_delivery(self, event_id: int, subscription_id: int) -> None:
+        self.db.add(WebhookDelivery(event_id=event_id, subscription_id=subscription_id))
+        try:
+            await self.db.commit()
+        except IntegrityError:
+            # Another worker delivered the same event concurrently.
+            await self.db.rollback()
@@ -1,3 +1,4 @@
+from typing import List
 from pydantic import BaseModel, ConfigDict, field_validator
 from datetime import datetime
 
@@ -24,3 +25,7 @@ class CommentResponse(CommentBase):
     created_at: datetime
 
     model_config = ConfigDict(from_attributes=True)
+
+class IssueComments(BaseModel):
+    issue_id: int
+    comments: List[CommentResponse]
@@ -1,5 +1,5 @@
-from typing import Optional
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from typing import List, Optional
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 from datetime import datetime
 from app.models.issue import IssueStatus
 
@@ -56,3 +56,40 @@ class IssueResponse(IssueBase):
     updated_at: datetime
 
     model_config = ConfigDict(from_attributes=True)
+
+class IssueImportError(BaseModel):
+    line: int
+    error: str
+
+class IssueImportReport(BaseModel):
+    total: int
+    imported: int
+    failed: int
+    errors: List[IssueImportError]
+    errors_truncated: bool = False
+    elapsed_seconds: float
+    rows_per_second: float
+
+class IssueBatchOperation(IssueUpdate):
+    id: int = Field(..., gt=0, example=10, title="ID of the Issue")
+
+class IssueBatchUpdate(BaseModel):
+    operations: List[IssueBatchOperation] = Field(..., min_length=1, max_length=200)
+
+    @model_validator(mode="after")
+    def validate_unique_ids(self) -> "IssueBatchUpdate":
+        ids = [op.id for op in self.operations]
+        if len(ids) != len(set(ids)):
+            raise ValueError("Each issue may appear only once per batch")
+        return self
+
+class IssueBatchResult(BaseModel):
+    id: int
+    status_code: int
+    detail: Optional[str] = None
+    issue: Optional[IssueResponse] = None
+
+class IssueBatchResponse(BaseModel):
+    updated: int
+    failed: int
+    results: List[IssueBatchResult]
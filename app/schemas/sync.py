@@ -0,0 +1,21 @@
+from typing import List
+from pydantic import BaseModel
+from datetime import datetime
+from app.schemas.comment import CommentResponse
+from app.schemas.issue import IssueResponse
+
+class ProjectTombstone(BaseModel):
+    # Archived project: the client drops its local issues and comments.
+    project_id: int
+    archived_at: datetime
+
+class ChangesBase(BaseModel):
+    tombstones: List[ProjectTombstone]
+    cursor: str
+    has_more: bool
+
+class IssueChanges(ChangesBase):
+    items: List[IssueResponse]
+
+class CommentChanges(ChangesBase):
+    items: List[CommentResponse]
@@ -0,0 +1,39 @@
+from typing import List, Optional
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from datetime import datetime
+
+WEBHOOK_EVENT_TYPES = {"*", "issue.created", "issue.updated", "comment.created", "comment.updated"}
+
+class WebhookCreate(BaseModel):
+    url: str = Field(..., max_length=2048, example="https://ci.example.com/hooks/bugtracker", title="Delivery URL")
+    event_types: List[str] = Field(["*"], min_length=1, example=["issue.updated"], title="Event types to deliver")
+    secret: Optional[str] = Field(None, min_length=16, max_length=128, title="HMAC secret; generated when omitted")
+
+    @field_validator("url")
+    @classmethod
+    def validate_url(cls, v: str) -> str:
+        if not v.startswith(("https://", "http://")):
+            raise ValueError("Webhook URL must be http or https")
+        return v
+
+    @field_validator("event_types")
+    @classmethod
+    def validate_event_types(cls, v: List[str]) -> List[str]:
+        unknown = set(v) - WEBHOOK_EVENT_TYPES
+        if unknown:
+            raise ValueError(f"Event types must be among {sorted(WEBHOOK_EVENT_TYPES)}")
+        return sorted(set(v))
+
+class WebhookResponse(BaseModel):
+    id: int
+    project_id: int
+    url: str
+    event_types: List[str]
+    is_active: bool
+    created_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+class WebhookCreated(WebhookResponse):
+    # The secret is only ever returned once, at creation.
+    secret: str
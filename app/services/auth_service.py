@@ -2,12 +2,14 @@ from datetime import timedelta, datetime, timezone
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.repositories.user import UserRepository
 from app.schemas.user import UserCreate, UserResponse, Token
-from app.core.security import get_password_hash, verify_password
+from app.core.security import get_password_hash_async, verify_password_async
 from app.core.exceptions import EntityNotFoundException, AuthenticationFailedException
 from app.core.config import settings
 from app.core.token_service import generate_token_pair, rotate_refresh_token, logout, logout_all_devices
 from app.models.user import UserRole
+from app.core.tracing import traced
 
+@traced("service")
 class AuthService:
     def __init__(self, db: AsyncSession):
         self.user_repo = UserRepository(db)
@@ -19,7 +21,7 @@ class AuthService:
         if existing_user or existing_username:
             raise AuthenticationFailedException(detail="Email or username already registered")
         
-        hashed_pw = get_password_hash(user_in.password)
+        hashed_pw = await get_password_hash_async(user_in.password)
         user_data = user_in.model_dump(exclude={"password"})
         user_data["username"] = username
         user_data["hashed_password"] = hashed_pw
@@ -31,7 +33,7 @@ class AuthService:
 
     async def login(self, email: str, password: str) -> Token:
         user = await self.user_repo.get_by_email(email)
-        if not user or not verify_password(password, user.hashed_password):
+        if not user or not await verify_password_async(password, user.hashed_password):
             raise AuthenticationFailedException(detail="Invalid credentials")
         
         if not user.is_active:
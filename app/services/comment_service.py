@@ -1,13 +1,16 @@
-from typing import List
+from typing import Dict, List, Sequence
 from sqlalchemy.ext.asyncio import AsyncSession
-import bleach
 from app.repositories.comment import CommentRepository
-from app.schemas.comment import CommentCreate
+from app.schemas.comment import CommentCreate, CommentResponse
 from app.models.user import User
 from app.models.comment import Comment
 from app.repositories.issue import IssueRepository
 from app.core.exceptions import EntityNotFoundException, PermissionDeniedException
+from app.core.sanitizer import sanitize_async
+from app.core.events import publish_change
+from app.core.tracing import traced
 
+@traced("service")
 class CommentService:
     def __init__(self, db: AsyncSession):
         self.comment_repo = CommentRepository(db)
@@ -21,8 +24,10 @@ class CommentService:
              
         comment_data = comment_in.model_dump()
         comment_data["author_id"] = current_user.id
-        comment_data["content"] = bleach.clean(comment_data["content"], strip=True)
-        return await self.comment_repo.create(comment_data)
+        comment_data["content"] = await sanitize_async(comment_data["content"])
+        comment = await self.comment_repo.create(comment_data)
+        await publish_change("comment.created", issue.project_id, comment, CommentResponse)
+        return comment
 
     async def get_comments(self, issue_id: int, skip: int = 0, limit: int = 100) -> List[Comment]:
         issue = await self.issue_repo.get_by_id(issue_id)
@@ -30,13 +35,24 @@ class CommentService:
             raise EntityNotFoundException(entity_name="Issue", identifier=issue_id)
         return await self.comment_repo.get_by_issue(issue_id, skip, limit)
     
+    async def get_latest_comments(self, issue_ids: Sequence[int], per_issue: int) -> Dict[int, List[Comment]]:
+        # One existence check for the whole set, then one windowed query.
+        existing = await self.issue_repo.get_existing_ids(issue_ids)
+        missing = sorted(set(issue_ids) - existing)
+        if missing:
+            raise EntityNotFoundException(entity_name="Issue", identifier=", ".join(map(str, missing)))
+        return await self.comment_repo.get_latest_for_issues(issue_ids, per_issue)
+
     async def update_comment(self, comment_id: int, content: str, current_user: User) -> Comment:
         comment = await self.comment_repo.get_by_id(comment_id)
         if not comment:
             raise EntityNotFoundException(entity_name="Comment", identifier=comment_id)
         if comment.author_id != current_user.id:
             raise PermissionDeniedException("Only the author can edit a comment")
-        sanitized = bleach.clean(content, strip=True)
-        return await self.comment_repo.update(comment, {"content": sanitized})
+        sanitized = await sanitize_async(content)
+        comment = await self.comment_repo.update(comment, {"content": sanitized})
+        issue = await self.issue_repo.get_by_id(comment.issue_id)
+        await publish_change("comment.updated", issue.project_id, comment, CommentResponse)
+        return comment
 
     # Deleting comments is intentionally unsupported
@@ -0,0 +1,69 @@
+import csv
+import enum
+import io
+from datetime import datetime
+from typing import AsyncIterator, Iterable, List
+
+from pydantic_core import to_json
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.serialization import response_fields
+from app.repositories.issue import IssueRepository
+from app.schemas.issue import IssueResponse
+from app.core.tracing import traced
+
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+
+def _csv_value(value):
+    if value is None:
+        return ""
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+@traced("service")
+class IssueExportService:
+    """
+    Streams every issue of a project as NDJSON or CSV. Rows come from a
+    server-side cursor and are encoded in chunks of ``chunk_rows``, so memory
+    stays flat no matter how large the project is.
+    """
+
+    def __init__(self, db: AsyncSession, chunk_rows: int = 500):
+        self.issue_repo = IssueRepository(db)
+        self.chunk_rows = chunk_rows
+        self.fields = response_fields(IssueResponse)
+
+    async def stream(self, project_id: int, fmt: str) -> AsyncIterator[bytes]:
+        encode = self._encode_ndjson if fmt == "ndjson" else self._encode_csv
+        if fmt == "csv":
+            yield self._csv_lines([self.fields])
+
+        batch: List[dict] = []
+        async for row in self.issue_repo.stream_by_project(project_id, batch_size=self.chunk_rows):
+            mapping = row._mapping
+            batch.append({name: mapping[name] for name in self.fields})
+            if len(batch) >= self.chunk_rows:
+                yield encode(batch)
+                batch = []
+        if batch:
+            yield encode(batch)
+
+    def _encode_ndjson(self, rows: List[dict]) -> bytes:
+        return b"".join(to_json(row) + b"\n" for row in rows)
+
+    def _encode_csv(self, rows: List[dict]) -> bytes:
+        return self._csv_lines([_csv_value(row[name]) for name in self.fields] for row in rows)
+
+    @staticmethod
+    def _csv_lines(lines: Iterable[Iterable]) -> bytes:
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(lines)
+        return buffer.getvalue().encode("utf-8")
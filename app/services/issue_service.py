@@ -1,14 +1,55 @@
-from typing import List
+import json
+from typing import Any, Dict, Iterable, List, Sequence
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.repositories.issue import IssueRepository
 from app.repositories.comment import CommentRepository
 from app.repositories.project import ProjectRepository
 from app.repositories.user import UserRepository
-from app.schemas.issue import IssueCreate, IssueUpdate
+from app.schemas.issue import (
+    IssueBatchOperation,
+    IssueBatchResult,
+    IssueCreate,
+    IssueResponse,
+    IssueUpdate,
+)
 from app.models.user import User
 from app.models.issue import Issue, IssueStatus
-from app.core.exceptions import EntityNotFoundException, PermissionDeniedException, DomainRuleViolationException
+from app.core.exceptions import BaseAPIException, EntityNotFoundException, PermissionDeniedException, DomainRuleViolationException
+from app.core.cache import issue_list_cache, snapshot_row, restore_row
+from app.core.events import publish_change
+from app.core.singleflight import issue_list_flight
+from app.core.tracing import traced
 
+
+def _issue_list_scopes(project_id: int | None) -> tuple[str, ...]:
+    # Unscoped lists share one counter that every issue write bumps.
+    if project_id:
+        return (f"project:{project_id}", "all")
+    return ("all",)
+
+
+ALLOWED_TRANSITIONS = {
+    IssueStatus.OPEN: [IssueStatus.IN_PROGRESS],
+    IssueStatus.IN_PROGRESS: [IssueStatus.RESOLVED],
+    IssueStatus.RESOLVED: [IssueStatus.CLOSED, IssueStatus.REOPENED],
+    IssueStatus.REOPENED: [IssueStatus.IN_PROGRESS, IssueStatus.RESOLVED],
+    IssueStatus.CLOSED: [IssueStatus.REOPENED]
+}
+
+CRITICAL_CLOSE_MESSAGE = "Critical issues cannot be closed without a comment"
+
+
+# Related resources that can be embedded with ?include=, mapped to the issue
+# column each one is resolved from.
+ISSUE_INCLUDES = {
+    "comments": "id",
+    "reporter": "reporter_id",
+    "assignee": "assignee_id",
+    "project": "project_id",
+}
+
+
+@traced("service")
 class IssueService:
     def __init__(self, db: AsyncSession):
         self.issue_repo = IssueRepository(db)
@@ -32,11 +73,14 @@ class IssueService:
             issue_data = issue_in.model_dump()
             issue_data["reporter_id"] = current_user.id
             issue_data["status"] = IssueStatus.OPEN
-            return await self.issue_repo.create(issue_data)
+            issue = await self.issue_repo.create(issue_data)
         except Exception as e:
             # Fallback catch-all for unexpected database driver errors
             print(f"CRITICAL DB ERROR: {e}")
             raise e
+        await issue_list_cache.bump(*_issue_list_scopes(issue.project_id))
+        await publish_change("issue.created", issue.project_id, issue, IssueResponse)
+        return issue
 
     async def get_issues(
         self,
@@ -48,8 +92,9 @@ class IssueService:
         skip: int = 0,
         limit: int = 100,
         sort: str = "created_at",
+        fields: Sequence[str] | None = None,
     ) -> List[Issue]:
-        return await self.issue_repo.get_filtered(
+        filters = dict(
             project_id=project_id,
             status=status,
             severity=severity,
@@ -58,10 +103,70 @@ class IssueService:
             skip=skip,
             limit=limit,
             sort=sort,
+            columns=fields,
+        )
+        # Search uses ILIKE, so its case does not change the result set.
+        scope = _issue_list_scopes(project_id)[0]
+        params = (
+            status.value if status else None,
+            severity,
+            assignee_id,
+            search.lower() if search else None,
+            sort,
+            skip,
+            limit,
+            list(fields) if fields else None,
         )
+        version = await issue_list_cache.version(scope)
+        if issue_list_cache.enabled:
+            rows = await issue_list_cache.get(scope, version, params)
+            if rows is not None:
+                return [restore_row(Issue, row) for row in rows]
 
-    async def get_issue(self, issue_id: int) -> Issue:
-        issue = await self.issue_repo.get_by_id(issue_id)
+        if issue_list_flight.enabled:
+            # List results do not depend on the caller, so the flight key is
+            # the same (scope, version, params) triple as the cache key.
+            issues, leader = await issue_list_flight.do(
+                (scope, version, json.dumps(params)),
+                lambda: self.issue_repo.get_filtered(**filters),
+                share=lambda issues: [snapshot_row(issue) for issue in issues],
+            )
+            if not leader:
+                return [restore_row(Issue, row) for row in issues]
+        else:
+            issues = await self.issue_repo.get_filtered(**filters)
+        if issue_list_cache.enabled:
+            await issue_list_cache.set(scope, version, params, [snapshot_row(issue) for issue in issues])
+        return issues
+
+    async def load_includes(
+        self,
+        issues: Sequence[Issue],
+        include: Iterable[str],
+        comments_limit: int = 3,
+    ) -> Dict[str, Dict[int, Any]]:
+        """
+        Batch-load related resources for a page of issues: one query per
+        relation regardless of page size. Results are keyed by the id the
+        issue references (issue id for comments).
+        """
+        loaded: Dict[str, Dict[int, Any]] = {}
+        for name in include:
+            column = ISSUE_INCLUDES[name]
+            ids = [getattr(issue, column) for issue in issues]
+            if name == "comments":
+                loaded[name] = await self.comment_repo.get_latest_for_issues(ids, comments_limit)
+            elif name == "project":
+                loaded[name] = await self.project_repo.get_many(ids)
+            else:
+                loaded[name] = await self.user_repo.get_many(ids)
+        return loaded
+
+    async def get_issue(self, issue_id: int, fields: Sequence[str] | None = None) -> Issue:
+        if fields:
+            issue = await self.issue_repo.get_by_id_with_columns(issue_id, fields)
+        else:
+            issue = await self.issue_repo.get_by_id(issue_id)
         if not issue:
             raise EntityNotFoundException(entity_name="Issue", identifier=issue_id)
         await self.issue_repo.db.refresh(issue, ["project"])
@@ -75,36 +180,97 @@ class IssueService:
         await self.issue_repo.db.refresh(issue, ["project"])
         if issue.project and issue.project.is_archived:
             raise EntityNotFoundException(entity_name="Project", identifier=issue.project_id)
-        is_reporter = issue.reporter_id == current_user.id
-        is_assignee = issue.assignee_id == current_user.id
-        is_admin = current_user.is_admin
-        is_project_owner = issue.project.owner_id == current_user.id
-        
-        if not (is_reporter or is_assignee or is_project_owner or is_admin):
-            raise PermissionDeniedException("You do not have permission to edit this issue")
-
-        if issue_in.assignee_id is not None and issue_in.assignee_id != issue.assignee_id:
-            if not (is_reporter or is_project_owner or is_admin):
-                 raise PermissionDeniedException("Only Reporter, Manager or Admin can change assignee")
-
-        # State Machine Validation
-        if issue_in.status is not None and issue_in.status != issue.status:
-            allowed_transitions = {
-                IssueStatus.OPEN: [IssueStatus.IN_PROGRESS],
-                IssueStatus.IN_PROGRESS: [IssueStatus.RESOLVED],
-                IssueStatus.RESOLVED: [IssueStatus.CLOSED, IssueStatus.REOPENED],
-                IssueStatus.REOPENED: [IssueStatus.IN_PROGRESS, IssueStatus.RESOLVED],
-                IssueStatus.CLOSED: [IssueStatus.REOPENED]
-            }
-            
-            if issue_in.status not in allowed_transitions.get(issue.status, []):
-                 raise DomainRuleViolationException(f"Invalid status transition from {issue.status} to {issue_in.status}")
-
-            # Critical Issue Check
-            if issue_in.status == IssueStatus.CLOSED and issue.severity == "critical":
-                # Check comments count
-                comments = await self.comment_repo.get_by_issue(issue_id, limit=1)
-                if not comments:
-                     raise DomainRuleViolationException("Critical issues cannot be closed without a comment")
-
-        return await self.issue_repo.update(issue, issue_in.model_dump(exclude_unset=True))
+        _check_update(issue, issue_in, current_user)
+
+        # Critical Issue Check
+        if _closes_critical(issue, issue_in):
+            comments = await self.comment_repo.get_by_issue(issue_id, limit=1)
+            if not comments:
+                raise DomainRuleViolationException(CRITICAL_CLOSE_MESSAGE)
+
+        issue = await self.issue_repo.update(issue, issue_in.model_dump(exclude_unset=True))
+        await issue_list_cache.bump(*_issue_list_scopes(issue.project_id))
+        await publish_change("issue.updated", issue.project_id, issue, IssueResponse)
+        return issue
+
+    async def batch_update_issues(
+        self, operations: Sequence[IssueBatchOperation], current_user: User
+    ) -> List[IssueBatchResult]:
+        """
+        Apply many updates in one transaction. Targets, projects, commented
+        issues and assignees are each resolved with a single query; every
+        operation is checked against the same rules as ``update_issue`` and
+        reported individually. Valid operations are committed together.
+        """
+        issues = await self.issue_repo.get_many_with_projects(op.id for op in operations)
+        commented = await self.comment_repo.get_commented_issue_ids(
+            op.id for op in operations if op.id in issues and _closes_critical(issues[op.id], op)
+        )
+        assignees = await self.user_repo.get_active_ids(
+            op.assignee_id for op in operations if op.assignee_id is not None
+        )
+
+        results: Dict[int, IssueBatchResult] = {}
+        applied: List[Issue] = []
+        for op in operations:
+            issue = issues.get(op.id)
+            try:
+                if issue is None:
+                    raise EntityNotFoundException(entity_name="Issue", identifier=op.id)
+                if issue.project.is_archived:
+                    raise EntityNotFoundException(entity_name="Project", identifier=issue.project_id)
+                _check_update(issue, op, current_user)
+                if _closes_critical(issue, op) and issue.id not in commented:
+                    raise DomainRuleViolationException(CRITICAL_CLOSE_MESSAGE)
+                if op.assignee_id is not None and op.assignee_id not in assignees:
+                    raise EntityNotFoundException(entity_name="User", identifier=op.assignee_id)
+            except BaseAPIException as exc:
+                results[op.id] = IssueBatchResult(id=op.id, status_code=exc.status_code, detail=exc.detail)
+                continue
+            for field, value in op.model_dump(exclude_unset=True, exclude={"id"}).items():
+                setattr(issue, field, value)
+            applied.append(issue)
+
+        if applied:
+            db = self.issue_repo.db
+            try:
+                await db.commit()
+            except Exception:
+                await db.rollback()
+                raise
+            # updated_at is set by the database; reload the applied rows in one query.
+            await self.issue_repo.get_many(issue.id for issue in applied)
+            await issue_list_cache.bump("all", *{f"project:{issue.project_id}" for issue in applied})
+            for issue in applied:
+                await publish_change("issue.updated", issue.project_id, issue, IssueResponse)
+                results[issue.id] = IssueBatchResult(
+                    id=issue.id, status_code=200, issue=IssueResponse.model_validate(issue)
+                )
+        return [results[op.id] for op in operations]
+
+
+def _check_update(issue: Issue, issue_in: IssueUpdate, current_user: User) -> None:
+    is_reporter = issue.reporter_id == current_user.id
+    is_assignee = issue.assignee_id == current_user.id
+    is_admin = current_user.is_admin
+    is_project_owner = issue.project.owner_id == current_user.id
+
+    if not (is_reporter or is_assignee or is_project_owner or is_admin):
+        raise PermissionDeniedException("You do not have permission to edit this issue")
+
+    if issue_in.assignee_id is not None and issue_in.assignee_id != issue.assignee_id:
+        if not (is_reporter or is_project_owner or is_admin):
+            raise PermissionDeniedException("Only Reporter, Manager or Admin can change assignee")
+
+    # State Machine Validation
+    if issue_in.status is not None and issue_in.status != issue.status:
+        if issue_in.status not in ALLOWED_TRANSITIONS.get(issue.status, []):
+            raise DomainRuleViolationException(f"Invalid status transition from {issue.status} to {issue_in.status}")
+
+
+def _closes_critical(issue: Issue, issue_in: IssueUpdate) -> bool:
+    return (
+        issue_in.status == IssueStatus.CLOSED
+        and issue_in.status != issue.status
+        and issue.severity == "critical"
+    )
@@ -5,7 +5,10 @@ from app.repositories.project import ProjectRepository
 from app.schemas.project import ProjectCreate, ProjectUpdate
 from app.models.user import User
 from app.models.project import Project
+from app.core.cache import entity_cache, snapshot_row
+from app.core.singleflight import project_flight
 from app.core.exceptions import EntityNotFoundException, PermissionDeniedException, DomainRuleViolationException, DatabaseSchemaMismatchException
+from app.core.tracing import traced
 
 
 
@@ -14,6 +17,7 @@ def _is_missing_project_key_column(exc: ProgrammingError) -> bool:
     return "projects.key" in message and "does not exist" in message
 
 
+@traced("service")
 class ProjectService:
     def __init__(self, db: AsyncSession):
         self.project_repo = ProjectRepository(db)
@@ -48,7 +52,19 @@ class ProjectService:
         )
 
     async def get_project(self, project_id: int) -> Project:
-        project = await self.project_repo.get_by_id_active(project_id)
+        if project_flight.enabled:
+            # Project reads are not filtered by caller; the entity cache version
+            # keeps reads that start after a write out of an older flight.
+            version = await entity_cache.version("project", project_id)
+            project, leader = await project_flight.do(
+                (project_id, version),
+                lambda: self.project_repo.get_by_id_active(project_id),
+                share=lambda project: snapshot_row(project) if project is not None else None,
+            )
+            if not leader and project is not None:
+                project = await self.project_repo.attach(project)
+        else:
+            project = await self.project_repo.get_by_id_active(project_id)
         if not project:
             raise EntityNotFoundException(entity_name="Project", identifier=project_id)
         return project
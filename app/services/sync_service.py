@@ -0,0 +1,83 @@
+import base64
+import binascii
+import json
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.exceptions import InvalidOperationException
+from app.repositories.comment import CommentRepository
+from app.repositories.issue import IssueRepository
+from app.repositories.project import ProjectRepository
+from app.core.tracing import traced
+
+Position = Optional[Tuple[datetime, int]]
+
+
+def encode_cursor(rows: Position, tombstones: Position) -> str:
+    payload = {
+        name: [position[0].isoformat(), position[1]] if position else None
+        for name, position in (("rows", rows), ("tombstones", tombstones))
+    }
+    return base64.urlsafe_b64encode(json.dumps(payload, separators=(",", ":")).encode()).decode()
+
+
+def decode_cursor(cursor: Optional[str]) -> Tuple[Position, Position]:
+    if not cursor:
+        return None, None
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return tuple(
+            (datetime.fromisoformat(payload[name][0]), int(payload[name][1])) if payload[name] else None
+            for name in ("rows", "tombstones")
+        )
+    except (binascii.Error, ValueError, KeyError, TypeError, IndexError):
+        raise InvalidOperationException("Invalid sync cursor")
+
+
+@traced("service")
+class SyncService:
+    """
+    Delta-sync feeds. Each call returns rows whose ``(updated_at, id)`` is past
+    the cursor, oldest first, plus tombstones for projects archived since the
+    last call. Rows and tombstones advance independently inside one opaque
+    cursor; keep calling with the returned cursor until ``has_more`` is false.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.issue_repo = IssueRepository(db)
+        self.comment_repo = CommentRepository(db)
+        self.project_repo = ProjectRepository(db)
+
+    async def issue_changes(self, cursor: Optional[str], limit: int) -> Dict[str, Any]:
+        return await self._changes(self.issue_repo, cursor, limit)
+
+    async def comment_changes(self, cursor: Optional[str], limit: int) -> Dict[str, Any]:
+        return await self._changes(self.comment_repo, cursor, limit)
+
+    async def _changes(self, repo, cursor: Optional[str], limit: int) -> Dict[str, Any]:
+        rows_after, tombstones_after = decode_cursor(cursor)
+        until = datetime.now(timezone.utc) - timedelta(seconds=settings.SYNC_SETTLE_SECONDS)
+
+        # One extra row tells us whether another page follows.
+        rows = await repo.get_changed_since(rows_after, until, limit + 1)
+        archived = await self.project_repo.get_archived_since(tombstones_after, until, limit + 1)
+        has_more = len(rows) > limit or len(archived) > limit
+        rows, archived = rows[:limit], archived[:limit]
+
+        return {
+            "items": rows,
+            "tombstones": [
+                {"project_id": project.id, "archived_at": project.updated_at} for project in archived
+            ],
+            "cursor": encode_cursor(_last_position(rows, rows_after), _last_position(archived, tombstones_after)),
+            "has_more": has_more,
+        }
+
+
+def _last_position(page: List[Any], previous: Position) -> Position:
+    if not page:
+        return previous
+    return page[-1].updated_at, page[-1].id
@@ -0,0 +1,106 @@
+import asyncio
+import secrets
+from typing import List
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.exceptions import EntityNotFoundException, InvalidOperationException, PermissionDeniedException
+from app.core.outbox import handler_deadline
+from app.core.webhooks import UnsafeWebhookTarget, WebhookDispatcher, check_target
+from app.models.outbox import OutboxEvent
+from app.models.user import User
+from app.models.webhook import WebhookSubscription
+from app.repositories.project import ProjectRepository
+from app.repositories.webhook import WebhookRepository
+from app.schemas.webhook import WebhookCreate
+from app.core.tracing import traced
+
+
+@traced("service")
+class WebhookService:
+    def __init__(self, db: AsyncSession):
+        self.webhook_repo = WebhookRepository(db)
+        self.project_repo = ProjectRepository(db)
+
+    async def _get_managed_project(self, project_id: int, current_user: User):
+        project = await self.project_repo.get_by_id_active(project_id)
+        if not project:
+            raise EntityNotFoundException(entity_name="Project", identifier=project_id)
+        # Permission: Owner or Admin
+        if project.owner_id != current_user.id and not current_user.is_admin:
+            raise PermissionDeniedException("Only Owner or Admin can manage project webhooks")
+        return project
+
+    async def create_webhook(self, project_id: int, webhook_in: WebhookCreate, current_user: User) -> WebhookSubscription:
+        await self._get_managed_project(project_id, current_user)
+        try:
+            await check_target(webhook_in.url)
+        except UnsafeWebhookTarget as exc:
+            raise InvalidOperationException(f"Webhook URL is not allowed: {exc}")
+        data = webhook_in.model_dump()
+        data["secret"] = data["secret"] or secrets.token_hex(32)
+        data["project_id"] = project_id
+        data["created_by_id"] = current_user.id
+        return await self.webhook_repo.create(data)
+
+    async def get_webhooks(self, project_id: int, current_user: User) -> List[WebhookSubscription]:
+        await self._get_managed_project(project_id, current_user)
+        return await self.webhook_repo.get_by_project(project_id)
+
+    async def delete_webhook(self, project_id: int, webhook_id: int, current_user: User) -> WebhookSubscription:
+        await self._get_managed_project(project_id, current_user)
+        webhook = await self.webhook_repo.get_by_id(webhook_id)
+        if not webhook or webhook.project_id != project_id:
+            raise EntityNotFoundException(entity_name="Webhook", identifier=webhook_id)
+        return await self.webhook_repo.delete(webhook)
+
+
+@traced("service")
+class WebhookOutboxHandler:
+    """
+    Outbox handler that fans an event out to the project's active webhook
+    subscriptions. Each accepted delivery is recorded right away, so when one
+    endpoint fails and the outbox retries the event, only the subscriptions
+    that have not accepted it yet are sent it again. Receivers still dedupe on
+    the event ``id``, as delivery is at-least-once.
+    """
+
+    def __init__(self, session_factory: async_sessionmaker, dispatcher: WebhookDispatcher):
+        self.session_factory = session_factory
+        self.dispatcher = dispatcher
+
+    async def __call__(self, event: OutboxEvent) -> None:
+        async with self.session_factory() as db:
+            repo = WebhookRepository(db)
+            if event.event_type.startswith("comment."):
+                subscriptions = await repo.get_active_for_issue(event.payload["issue_id"])
+            else:
+                subscriptions = await repo.get_active_for_project(event.payload["project_id"])
+            targets = [
+                sub for sub in subscriptions
+                if "*" in sub.event_types or event.event_type in sub.event_types
+            ]
+            delivered = await repo.get_delivered_subscription_ids(event.id, (sub.id for sub in targets))
+        targets = [sub for sub in targets if sub.id not in delivered]
+        if not targets:
+            return
+        body = {
+            "id": event.id,
+            "type": event.event_type,
+            "project_id": targets[0].project_id,
+            "data": event.payload,
+        }
+        results = await asyncio.gather(*(self._deliver(event, sub, body) for sub in targets), return_exceptions=True)
+        failures = [result for result in results if isinstance(result, Exception)]
+        if failures:
+            raise failures[0]
+
+    async def _deliver(self, event: OutboxEvent, subscription: WebhookSubscription, body: dict) -> None:
+        await self.dispatcher.deliver(subscription.url, subscription.secret, body, handler_deadline.get())
+        # A delivery accepted just before the deadline is still recorded, so
+        # the retry does not send it again.
+        await asyncio.shield(self._record(event, subscription))
+
+    async def _record(self, event: OutboxEvent, subscription: WebhookSubscription) -> None:
+        async with self.session_factory() as db:
+            await WebhookRepository(db).record_delivery(event.id, subscription.id)
@@ -6,10 +6,15 @@ from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sess
 from app.db.base_class import Base
 from app.db import base  # noqa: F401
 from app.core.rate_limit import redis_client
+from app.core.cache import entity_cache, issue_list_cache
+from app.core.singleflight import issue_list_flight, project_flight
 from app.db.session import get_db
 from app.main import app
 from app.core.config import settings
 
+# Flag N+1 query loops in every test request.
+settings.N_PLUS_ONE_DETECTION = True
+
 # Use SQLite for testing
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
@@ -51,4 +56,9 @@ async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
 async def reset_inmemory_rate_limiter():
     if hasattr(redis_client, "flushall"):
         await redis_client.flushall()
+    # Tables are recreated per test, so cached rows would leak across ids.
+    entity_cache.clear()
+    issue_list_cache.clear()
+    issue_list_flight.clear()
+    project_flight.clear()
     yield
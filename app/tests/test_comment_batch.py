@@ -0,0 +1,67 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.security import create_access_token
+from app.models.comment import Comment
+from app.models.issue import Issue, IssueStatus
+from app.models.project import Project
+from app.models.user import User, UserRole
+
+
+async def _seed(db_session: AsyncSession):
+    me = User(username="reader", email="reader@test.com", hashed_password="pw", role=UserRole.USER)
+    db_session.add(me)
+    await db_session.commit()
+    project = Project(name="Board", key="BOARD", owner_id=me.id)
+    db_session.add(project)
+    await db_session.commit()
+    issues = [
+        Issue(title=f"Bug {i}", description="d", project_id=project.id, reporter_id=me.id,
+              status=IssueStatus.OPEN, severity="low")
+        for i in range(3)
+    ]
+    db_session.add_all(issues)
+    await db_session.commit()
+    db_session.add_all([Comment(content=f"a{n}", issue_id=issues[0].id, author_id=me.id) for n in range(4)])
+    db_session.add(Comment(content="b0", issue_id=issues[1].id, author_id=me.id))
+    await db_session.commit()
+    return me, issues
+
+
+@pytest.mark.asyncio
+async def test_batch_returns_latest_comments_per_issue(client: AsyncClient, db_session: AsyncSession):
+    me, issues = await _seed(db_session)
+    headers = {"Authorization": f"Bearer {create_access_token(me.id)}"}
+    ids = f"{issues[2].id},{issues[0].id},{issues[1].id}"
+
+    statements = []
+    sync_engine = db_session.bind.sync_engine
+    listener = lambda conn, cursor, statement, *args: statements.append(statement)
+    event.listen(sync_engine, "before_cursor_execute", listener)
+    try:
+        r = await client.get("/api/v1/comments/batch", headers=headers, params={"issue_ids": ids, "limit": 2})
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", listener)
+
+    assert r.status_code == 200
+    body = r.json()
+    assert [entry["issue_id"] for entry in body] == [issues[2].id, issues[0].id, issues[1].id]
+    assert body[0]["comments"] == []
+    assert [c["content"] for c in body[1]["comments"]] == ["a3", "a2"]
+    assert [c["content"] for c in body[2]["comments"]] == ["b0"]
+    # current user + existence check + windowed comment query
+    assert len(statements) == 3
+
+
+@pytest.mark.asyncio
+async def test_batch_rejects_unknown_issues(client: AsyncClient, db_session: AsyncSession):
+    me, issues = await _seed(db_session)
+    headers = {"Authorization": f"Bearer {create_access_token(me.id)}"}
+
+    r = await client.get("/api/v1/comments/batch", headers=headers, params={"issue_ids": f"{issues[0].id},9999"})
+    assert r.status_code == 404
+    assert r.json()["detail"] == "Issue not found: 9999"
+
+    r = await client.get("/api/v1/comments/batch", headers=headers, params={"issue_ids": "1,x"})
+    assert r.status_code == 400
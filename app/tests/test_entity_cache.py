@@ -0,0 +1,120 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.cache import EntityCache, entity_cache
+from app.core.config import settings
+from app.core.security import create_access_token
+from app.models.project import Project
+from app.models.user import User, UserRole
+from app.repositories.project import ProjectRepository
+from app.repositories.user import UserRepository
+
+
+async def _create_owner_and_project(db_session: AsyncSession):
+    owner = User(username="owner", email="owner@test.com", hashed_password="pw", role=UserRole.USER)
+    db_session.add(owner)
+    await db_session.commit()
+    project = Project(name="Cached", key="CACHE", owner_id=owner.id)
+    db_session.add(project)
+    await db_session.commit()
+    return owner, project
+
+
+@pytest.mark.asyncio
+async def test_project_lookup_is_served_from_cache(db_session: AsyncSession):
+    _, project = await _create_owner_and_project(db_session)
+
+    async with AsyncSession(bind=db_session.bind, expire_on_commit=False) as first:
+        loaded = await ProjectRepository(first).get_by_id_active(project.id)
+        assert loaded.name == "Cached"
+
+    async with AsyncSession(bind=db_session.bind, expire_on_commit=False) as second:
+        repo = ProjectRepository(second)
+        cached = await repo.get_by_id_active(project.id)
+        assert cached.name == "Cached"
+        assert cached.created_at == loaded.created_at
+
+        # Writes through the repository bump the version and evict the entry
+        await repo.update(cached, {"name": "Renamed"})
+
+    async with AsyncSession(bind=db_session.bind, expire_on_commit=False) as third:
+        fresh = await ProjectRepository(third).get_by_id_active(project.id)
+        assert fresh.name == "Renamed"
+
+    stats = entity_cache.stats()["entities"]["project"]
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+    assert stats["invalidations"] == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_can_be_disabled_per_entity(db_session: AsyncSession, monkeypatch):
+    _, project = await _create_owner_and_project(db_session)
+    monkeypatch.setattr(settings, "ENTITY_CACHE_DISABLED", ["project"])
+
+    for _ in range(2):
+        async with AsyncSession(bind=db_session.bind) as session:
+            assert await ProjectRepository(session).get_by_id_active(project.id) is not None
+
+    assert "project" not in entity_cache.stats()["entities"]
+
+
+@pytest.mark.asyncio
+async def test_cache_stats_endpoint_requires_admin(client: AsyncClient, db_session: AsyncSession):
+    admin = User(username="root", email="root@test.com", hashed_password="pw", role=UserRole.ADMIN, is_admin=True)
+    user = User(username="plain", email="plain@test.com", hashed_password="pw", role=UserRole.USER)
+    db_session.add_all([admin, user])
+    await db_session.commit()
+
+    r = await client.get("/api/v1/admin/cache", headers={"Authorization": f"Bearer {create_access_token(user.id)}"})
+    assert r.status_code == 403
+
+    r = await client.get("/api/v1/admin/cache", headers={"Authorization": f"Bearer {create_access_token(admin.id)}"})
+    assert r.status_code == 200
+    assert r.json()["entity_cache"]["enabled"] is True
+
+
+@pytest.mark.asyncio
+async def test_shared_only_entities_are_not_cached_without_redis(db_session: AsyncSession, monkeypatch):
+    owner, project = await _create_owner_and_project(db_session)
+    monkeypatch.setattr(entity_cache, "use_redis", False)
+
+    for _ in range(2):
+        async with AsyncSession(bind=db_session.bind) as session:
+            assert (await UserRepository(session).get_by_id(owner.id)).username == "owner"
+            assert await ProjectRepository(session).get_by_id_active(project.id) is not None
+    assert entity_cache.stats()["entities"] == {}
+
+
+@pytest.mark.asyncio
+async def test_archiving_a_project_invalidates_every_worker(db_session: AsyncSession):
+    _, project = await _create_owner_and_project(db_session)
+    # A second worker's cache: its own local tier, the same Redis.
+    other = EntityCache(maxsize=10, use_redis=settings.ENTITY_CACHE_REDIS)
+    version = await other.version("project", project.id)
+    await other.set("project", project.id, version, {"id": project.id, "is_archived": False})
+
+    async with AsyncSession(bind=db_session.bind) as session:
+        repo = ProjectRepository(session)
+        await repo.update(await repo.get_by_id_active(project.id), {"is_archived": True})
+
+    assert await other.get("project", project.id, await other.version("project", project.id)) is None
+
+
+@pytest.mark.asyncio
+async def test_deactivated_user_is_rejected_even_if_cached(client: AsyncClient, db_session: AsyncSession):
+    owner, _ = await _create_owner_and_project(db_session)
+    headers = {"Authorization": f"Bearer {create_access_token(owner.id)}"}
+
+    async with AsyncSession(bind=db_session.bind) as session:
+        await UserRepository(session).get_by_id(owner.id)
+    cached = await entity_cache.get("user", owner.id, await entity_cache.version("user", owner.id))
+    assert cached["username"] == "owner"
+    assert "hashed_password" not in cached
+
+    # Deactivated behind the cache's back, as a write on another worker would look here.
+    await db_session.execute(update(User).where(User.id == owner.id).values(is_active=False))
+    await db_session.commit()
+    r = await client.get("/api/v1/users/me", headers=headers)
+    assert r.status_code == 401
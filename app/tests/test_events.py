@@ -0,0 +1,82 @@
+import json
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.events import HEARTBEAT_FRAME, RESYNC_FRAME, EventBroker, event_broker
+from app.core.security import create_access_token
+from app.models.project import Project
+from app.models.user import User, UserRole
+
+
+def _decode(frame: bytes):
+    event, data = frame.decode().strip().split("\n")
+    return event.removeprefix("event: "), json.loads(data.removeprefix("data: "))
+
+
+@pytest.mark.asyncio
+async def test_services_publish_changes_to_project_subscribers(client: AsyncClient, db_session: AsyncSession):
+    me = User(username="watcher", email="watcher@test.com", hashed_password="pw", role=UserRole.USER)
+    db_session.add(me)
+    await db_session.commit()
+    watched = Project(name="Watched", key="WATCH", owner_id=me.id)
+    quiet = Project(name="Quiet", key="QUIET", owner_id=me.id)
+    db_session.add_all([watched, quiet])
+    await db_session.commit()
+    headers = {"Authorization": f"Bearer {create_access_token(me.id)}"}
+
+    subscription = event_broker.subscribe([watched.id])
+    try:
+        r = await client.post("/api/v1/issues/", headers=headers, json={"title": "Seen", "description": "d", "project_id": watched.id})
+        issue_id = r.json()["id"]
+        await client.post("/api/v1/issues/", headers=headers, json={"title": "Unseen", "description": "d", "project_id": quiet.id})
+        await client.put(f"/api/v1/issues/{issue_id}", headers=headers, json={"status": "in_progress"})
+        await client.post("/api/v1/comments/", headers=headers, json={"content": "on it", "issue_id": issue_id})
+
+        frames = [_decode(subscription.queue.get_nowait()) for _ in range(subscription.queue.qsize())]
+    finally:
+        event_broker.unsubscribe(subscription)
+
+    assert [name for name, _ in frames] == ["issue.created", "issue.updated", "comment.created"]
+    assert frames[0][1]["project_id"] == watched.id
+    assert frames[1][1]["data"]["status"] == "in_progress"
+    assert frames[2][1]["data"]["content"] == "on it"
+
+
+@pytest.mark.asyncio
+async def test_slow_client_is_detached_with_resync():
+    broker = EventBroker(client_buffer=2)
+    slow = broker.subscribe([1])
+    other = broker.subscribe(None)
+    for n in range(3):
+        await broker.publish("issue.updated", 1, {"id": n})
+        other.queue.get_nowait()
+
+    assert broker.subscribers == 1
+    assert broker.stats["overflows"] == 1
+    frames = [frame async for frame in slow.frames(heartbeat=1)]
+    assert frames == [RESYNC_FRAME]
+    # A client that keeps up is unaffected by one slow reader
+    await broker.publish("issue.updated", 1, {"id": 3})
+    assert other.queue.qsize() == 1
+
+
+@pytest.mark.asyncio
+async def test_idle_stream_sends_heartbeat_and_unsubscribes_on_close():
+    broker = EventBroker(client_buffer=4)
+    stream = broker.stream([7], heartbeat=0.01)
+    assert await stream.__anext__() == HEARTBEAT_FRAME
+    assert broker.subscribers == 1
+    await stream.aclose()
+    assert broker.subscribers == 0
+
+
+@pytest.mark.asyncio
+async def test_stream_rejects_unknown_projects(client: AsyncClient, db_session: AsyncSession):
+    me = User(username="lost", email="lost@test.com", hashed_password="pw", role=UserRole.USER)
+    db_session.add(me)
+    await db_session.commit()
+    headers = {"Authorization": f"Bearer {create_access_token(me.id)}"}
+
+    r = await client.get("/api/v1/events/", headers=headers, params={"project_ids": "4242"})
+    assert r.status_code == 404
@@ -0,0 +1,143 @@
+import asyncio
+
+import pytest
+from httpx import AsyncClient
+import app.core.metrics as metrics
+import app.middlewares.admission as admission
+from app.core.config import settings
+from app.core.health import health_monitor
+from app.core.metrics import RecentPeak, admission_rejections
+from app.middlewares.admission import AdmissionControlMiddleware
+
+
+@pytest.fixture
+def probes(monkeypatch):
+    calls = {"database": 0, "redis": 0}
+    failing = set()
+
+    def probe(name):
+        async def run():
+            calls[name] += 1
+            if name in failing:
+                raise ConnectionError(f"{name} down")
+        return run
+
+    monkeypatch.setattr(health_monitor, "probes", {name: probe(name) for name in calls})
+    monkeypatch.setattr(health_monitor, "status", {})
+    return calls, failing
+
+
+@pytest.mark.asyncio
+async def test_ready_serves_cached_probe_results(client: AsyncClient, probes):
+    calls, failing = probes
+    r = await client.get("/ready")
+    assert r.status_code == 503
+
+    failing.add("redis")
+    await health_monitor.check()
+    r = await client.get("/ready")
+    assert r.status_code == 503
+    assert r.json()["dependencies"]["redis"]["error"] == "ConnectionError: redis down"
+    assert r.json()["dependencies"]["database"]["ok"] is True
+
+    failing.clear()
+    await health_monitor.check()
+    for _ in range(3):
+        r = await client.get("/ready")
+        assert r.status_code == 200
+    # Polling /ready never touches the dependencies.
+    assert calls == {"database": 2, "redis": 2}
+
+    assert (await client.get("/live")).status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_stale_probe_results_are_not_ready(client: AsyncClient, probes, monkeypatch):
+    await health_monitor.check()
+    monkeypatch.setattr(settings, "HEALTH_STALE_SECONDS", -1)
+    assert (await client.get("/ready")).status_code == 503
+
+
+@pytest.mark.asyncio
+async def test_loop_lag_sheds_requests_but_not_probes(client: AsyncClient, monkeypatch):
+    lag = RecentPeak()
+    monkeypatch.setattr(admission, "loop_lag_peak", lag)
+    lag.observe(settings.ADMISSION_MAX_LOOP_LAG_MS / 1000 * 2)
+    before = admission_rejections.value("loop_lag")
+
+    r = await client.get("/api/v1/projects/")
+    assert r.status_code == 503
+    assert r.headers["retry-after"] == str(settings.ADMISSION_RETRY_AFTER_SECONDS)
+    assert admission_rejections.value("loop_lag") == before + 1
+    assert (await client.get("/live")).status_code == 200
+
+    monkeypatch.setattr(admission, "loop_lag_peak", RecentPeak())
+    assert (await client.get("/api/v1/projects/")).status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_in_flight_limit(monkeypatch):
+    monkeypatch.setattr(settings, "ADMISSION_MAX_IN_FLIGHT", 1)
+    release = asyncio.Event()
+
+    async def slow_app(scope, receive, send):
+        await release.wait()
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    middleware = AdmissionControlMiddleware(slow_app)
+    statuses = []
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            statuses.append(message["status"])
+
+    scope = {"type": "http", "method": "GET", "path": "/api/v1/issues/", "headers": []}
+    first = asyncio.create_task(middleware(scope, None, send))
+    await asyncio.sleep(0)
+    await middleware(scope, None, send)
+    release.set()
+    await first
+
+    assert statuses == [503, 200]
+    assert middleware.in_flight == 0
+
+
+def test_recent_peak_ages_out(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(metrics.time, "monotonic", lambda: now[0])
+    peak = RecentPeak(window=5.0)
+    peak.observe(0.5)
+    assert peak.value() == 0.5
+    now[0] += 5
+    assert peak.value() == 0.5
+    now[0] += 5
+    assert peak.value() == 0.0
+
+
+@pytest.mark.asyncio
+async def test_open_streams_do_not_count_as_in_flight(monkeypatch):
+    monkeypatch.setattr(settings, "ADMISSION_MAX_IN_FLIGHT", 1)
+    close_stream = asyncio.Event()
+
+    async def streaming_app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await close_stream.wait()
+        await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+    middleware = AdmissionControlMiddleware(streaming_app)
+    statuses = []
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            statuses.append(message["status"])
+
+    scope = {"type": "http", "method": "GET", "path": "/api/v1/events/", "headers": []}
+    streams = [asyncio.create_task(middleware(scope, None, send)) for _ in range(3)]
+    await asyncio.sleep(0)
+    assert middleware.in_flight == 0
+    close_stream.set()
+    await asyncio.gather(*streams)
+
+    assert statuses == [200, 200, 200]
+    assert middleware.in_flight == 0
@@ -0,0 +1,78 @@
+import asyncio
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.security import create_access_token
+from app.models.issue import Issue
+from app.models.project import Project
+from app.models.user import User, UserRole
+
+
+async def _seed(db_session: AsyncSession):
+    me = User(username="retrier", email="retrier@test.com", hashed_password="pw", role=UserRole.USER)
+    db_session.add(me)
+    await db_session.commit()
+    project = Project(name="Flaky", key="FLAKY", owner_id=me.id)
+    db_session.add(project)
+    await db_session.commit()
+    return me, project
+
+
+async def _issue_count(db_session: AsyncSession) -> int:
+    return (await db_session.execute(select(func.count(Issue.id)))).scalar_one()
+
+
+@pytest.mark.asyncio
+async def test_retried_create_is_replayed(client: AsyncClient, db_session: AsyncSession):
+    me, project = await _seed(db_session)
+    headers = {"Authorization": f"Bearer {create_access_token(me.id)}", "Idempotency-Key": "create-1"}
+    payload = {"title": "Crash on retry", "description": "d", "project_id": project.id}
+
+    first = await client.post("/api/v1/issues/", json=payload, headers=headers)
+    # A fresh token for the same user still maps to the same key.
+    headers["Authorization"] = f"Bearer {create_access_token(me.id)}"
+    second = await client.post("/api/v1/issues/", json=payload, headers=headers)
+
+    assert first.status_code == second.status_code == 200
+    assert second.json() == first.json()
+    assert second.headers["Idempotent-Replayed"] == "true"
+    assert "Idempotent-Replayed" not in first.headers
+    assert await _issue_count(db_session) == 1
+
+    r = await client.post("/api/v1/issues/", json={**payload, "title": "Other"}, headers=headers)
+    assert r.status_code == 422
+    assert await _issue_count(db_session) == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_duplicates_wait_for_first(client: AsyncClient, db_session: AsyncSession):
+    me, project = await _seed(db_session)
+    headers = {"Authorization": f"Bearer {create_access_token(me.id)}", "Idempotency-Key": "burst"}
+    payload = {"title": "Double tap", "description": "d", "project_id": project.id}
+
+    responses = await asyncio.gather(
+        *(client.post("/api/v1/issues/", json=payload, headers=headers) for _ in range(3))
+    )
+
+    assert {r.status_code for r in responses} == {200}
+    assert len({r.json()["id"] for r in responses}) == 1
+    assert sum(r.headers.get("Idempotent-Replayed") == "true" for r in responses) == 2
+    assert await _issue_count(db_session) == 1
+
+
+@pytest.mark.asyncio
+async def test_keys_are_scoped_per_user(client: AsyncClient, db_session: AsyncSession):
+    me, project = await _seed(db_session)
+    other = User(username="other", email="other@test.com", hashed_password="pw", role=UserRole.USER)
+    db_session.add(other)
+    await db_session.commit()
+    payload = {"title": "Same key", "description": "d", "project_id": project.id}
+
+    for user in (me, other):
+        headers = {"Authorization": f"Bearer {create_access_token(user.id)}", "Idempotency-Key": "shared"}
+        r = await client.post("/api/v1/issues/", json=payload, headers=headers)
+        assert r.status_code == 200
+        assert "Idempotent-Replayed" not in r.headers
+    assert await _issue_count(db_session) == 2
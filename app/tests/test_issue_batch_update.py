@@ -0,0 +1,82 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.security import create_access_token
+from app.models.comment import Comment
+from app.models.issue import Issue, IssueStatus
+from app.models.project import Project
+from app.models.user import User, UserRole
+
+
+@pytest.mark.asyncio
+async def test_batch_update_reports_each_operation(client: AsyncClient, db_session: AsyncSession):
+    me = User(username="triage", email="triage@test.com", hashed_password="pw", role=UserRole.USER)
+    other = User(username="other", email="other@test.com", hashed_password="pw", role=UserRole.USER)
+    db_session.add_all([me, other])
+    await db_session.commit()
+    mine = Project(name="Mine", key="MINE", owner_id=me.id)
+    theirs = Project(name="Theirs", key="THEIRS", owner_id=other.id)
+    db_session.add_all([mine, theirs])
+    await db_session.commit()
+
+    def make(title, status, severity="low", project=mine):
+        return Issue(title=title, description="d", project_id=project.id, reporter_id=project.owner_id,
+                     status=status, severity=severity)
+
+    opened = [make(f"Open {i}", IssueStatus.OPEN) for i in range(5)]
+    silent = make("Critical, no comment", IssueStatus.RESOLVED, "critical")
+    discussed = make("Critical, discussed", IssueStatus.RESOLVED, "critical")
+    foreign = make("Not mine", IssueStatus.OPEN, project=theirs)
+    db_session.add_all([*opened, silent, discussed, foreign])
+    await db_session.commit()
+    db_session.add(Comment(content="verified", issue_id=discussed.id, author_id=me.id))
+    await db_session.commit()
+    headers = {"Authorization": f"Bearer {create_access_token(me.id)}"}
+
+    operations = [{"id": issue.id, "status": "in_progress"} for issue in opened] + [
+        {"id": silent.id, "status": "closed"},
+        {"id": discussed.id, "status": "closed"},
+        {"id": foreign.id, "status": "in_progress"},
+        {"id": opened[0].id + 1000, "status": "in_progress"},
+    ]
+
+    statements = []
+    sync_engine = db_session.bind.sync_engine
+    listener = lambda conn, cursor, statement, *args: statements.append(statement)
+    event.listen(sync_engine, "before_cursor_execute", listener)
+    try:
+        r = await client.patch("/api/v1/issues/batch", headers=headers, json={"operations": operations})
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", listener)
+
+    assert r.status_code == 200
+    body = r.json()
+    assert (body["updated"], body["failed"]) == (6, 3)
+    codes = [result["status_code"] for result in body["results"]]
+    assert codes == [200] * 5 + [400, 200, 403, 404]
+    assert body["results"][0]["issue"]["status"] == "in_progress"
+    assert body["results"][5]["detail"] == "Critical issues cannot be closed without a comment"
+    # Lookups are set-based, so the statement count does not grow with the batch.
+    assert len([s for s in statements if s.lstrip().upper().startswith("SELECT")]) <= 5
+
+    rows = await db_session.execute(select(Issue.id, Issue.status).execution_options(populate_existing=True))
+    status_by_id = dict(rows.all())
+    assert status_by_id[discussed.id] == IssueStatus.CLOSED
+    assert status_by_id[silent.id] == IssueStatus.RESOLVED
+    assert status_by_id[foreign.id] == IssueStatus.OPEN
+
+
+@pytest.mark.asyncio
+async def test_batch_update_rejects_duplicate_ids(client: AsyncClient, db_session: AsyncSession):
+    me = User(username="dup", email="dup@test.com", hashed_password="pw", role=UserRole.USER)
+    db_session.add(me)
+    await db_session.commit()
+    headers = {"Authorization": f"Bearer {create_access_token(me.id)}"}
+
+    r = await client.patch(
+        "/api/v1/issues/batch",
+        headers=headers,
+        json={"operations": [{"id": 1, "status": "in_progress"}, {"id": 1, "status": "resolved"}]},
+    )
+    assert r.status_code == 422
@@ -0,0 +1,108 @@
+import json
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.security import create_access_token
+from app.models.issue import Issue
+from app.models.outbox import OutboxEvent
+from app.models.project import Project
+from app.models.user import User, UserRole
+from app.services.import_service import _csv_records
+
+
+async def _setup(db_session: AsyncSession):
+    me = User(username="migrator", email="migrator@test.com", hashed_password="pw", role=UserRole.USER)
+    gone = User(username="gone", email="gone@test.com", hashed_password="pw", role=UserRole.USER, is_active=False)
+    db_session.add_all([me, gone])
+    await db_session.commit()
+    project = Project(name="Target", key="TGT", owner_id=me.id)
+    archived = Project(name="Old", key="OLD", owner_id=me.id, is_archived=True)
+    db_session.add_all([project, archived])
+    await db_session.commit()
+    return me, gone, project, archived
+
+
+@pytest.mark.asyncio
+async def test_ndjson_import_reports_per_row_errors(client: AsyncClient, db_session: AsyncSession):
+    me, gone, project, archived = await _setup(db_session)
+    lines = [json.dumps({"title": f"Imported {i}", "description": "d", "project_id": project.id, "severity": "high"}) for i in range(5)]
+    lines += [
+        json.dumps({"title": "", "description": "d", "project_id": project.id}),
+        "{not json",
+        json.dumps({"title": "Archived", "description": "d", "project_id": archived.id}),
+        json.dumps({"title": "Bad assignee", "description": "d", "project_id": project.id, "assignee_id": gone.id}),
+    ]
+    headers = {"Authorization": f"Bearer {create_access_token(me.id)}"}
+
+    r = await client.post("/api/v1/issues/import", headers=headers, params={"batch_size": 2}, content="\n".join(lines).encode())
+    assert r.status_code == 200
+    report = r.json()
+    assert (report["total"], report["imported"], report["failed"]) == (9, 5, 4)
+    assert [e["line"] for e in sorted(report["errors"], key=lambda e: e["line"])] == [6, 7, 8, 9]
+
+    count = await db_session.scalar(select(func.count()).select_from(Issue).where(Issue.reporter_id == me.id))
+    assert count == 5
+
+    # Bulk inserts still publish issue.created through the outbox.
+    imported = (await db_session.execute(select(Issue.id).where(Issue.reporter_id == me.id).order_by(Issue.id))).scalars().all()
+    events = (await db_session.execute(
+        select(OutboxEvent).where(OutboxEvent.event_type == "issue.created").order_by(OutboxEvent.aggregate_id)
+    )).scalars().all()
+    assert [e.aggregate_id for e in events] == imported
+    assert events[0].payload["title"] == "Imported 0"
+    assert events[0].payload["status"] == "open"
+    assert events[0].payload["created_at"]
+
+
+@pytest.mark.asyncio
+async def test_csv_import_handles_quoted_newlines(client: AsyncClient, db_session: AsyncSession):
+    me, _, project, _ = await _setup(db_session)
+    body = (
+        "title,description,severity,project_id,assignee_id\n"
+        f'"Multi, line","first\nsecond",low,{project.id},\n'
+        f"Plain,desc,critical,{project.id},{me.id}\n"
+    )
+    headers = {"Authorization": f"Bearer {create_access_token(me.id)}"}
+
+    r = await client.post("/api/v1/issues/import", headers=headers, params={"format": "csv"}, content=body.encode())
+    assert r.json()["imported"] == 2
+
+    r = await client.get("/api/v1/issues/", headers=headers, params={"sort": "title"})
+    issues = r.json()
+    assert [i["title"] for i in issues] == ["Multi, line", "Plain"]
+    assert issues[0]["description"] == "first\nsecond"
+    assert issues[1]["assignee_id"] == me.id
+
+
+@pytest.mark.asyncio
+async def test_csv_import_keeps_stray_quotes_and_reports_unterminated_records(client: AsyncClient, db_session: AsyncSession):
+    me, _, project, _ = await _setup(db_session)
+    rows = [f'Screen 5" broken,d,{project.id}'] + [f"Row {i},d,{project.id}" for i in range(5)]
+    body = "title,description,project_id\n" + "\n".join(rows) + f'\nLast,"never closed,{project.id}\nnot,a,row\n'
+    headers = {"Authorization": f"Bearer {create_access_token(me.id)}"}
+
+    r = await client.post("/api/v1/issues/import", headers=headers, params={"format": "csv"}, content=body.encode())
+    report = r.json()
+    assert (report["total"], report["imported"], report["failed"]) == (7, 6, 1)
+    assert report["errors"][0]["line"] == 8
+    assert report["errors"][0]["error"].startswith("Invalid CSV")
+
+    r = await client.get("/api/v1/issues/", headers=headers, params={"sort": "title"})
+    assert 'Screen 5" broken' in [i["title"] for i in r.json()]
+
+
+@pytest.mark.asyncio
+async def test_csv_records_span_chunk_boundaries():
+    body = 'title,description\n"Multi, line","first\nsecond"\nPlain,desc\n'.encode()
+
+    async def one_byte_chunks():
+        for i in range(len(body)):
+            yield body[i:i + 1]
+
+    records = [record async for record in _csv_records(one_byte_chunks())]
+    assert records == [
+        (2, {"title": "Multi, line", "description": "first\nsecond"}),
+        (4, {"title": "Plain", "description": "desc"}),
+    ]
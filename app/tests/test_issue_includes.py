@@ -0,0 +1,63 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.security import create_access_token
+from app.models.comment import Comment
+from app.models.issue import Issue, IssueStatus
+from app.models.project import Project
+from app.models.user import User, UserRole
+
+
+@pytest.mark.asyncio
+async def test_include_batches_one_query_per_relation(client: AsyncClient, db_session: AsyncSession):
+    me = User(username="lead", email="lead@test.com", hashed_password="pw", full_name="Team Lead", role=UserRole.USER)
+    dev = User(username="dev", email="dev@test.com", hashed_password="pw", role=UserRole.USER)
+    db_session.add_all([me, dev])
+    await db_session.commit()
+    project = Project(name="Board", key="BOARD", owner_id=me.id)
+    db_session.add(project)
+    await db_session.commit()
+    issues = [
+        Issue(title=f"Bug {i}", description="d", project_id=project.id, reporter_id=me.id,
+              assignee_id=dev.id if i % 2 else None, status=IssueStatus.OPEN, severity="low")
+        for i in range(6)
+    ]
+    db_session.add_all(issues)
+    await db_session.commit()
+    db_session.add_all([Comment(content=f"note {n}", issue_id=issues[0].id, author_id=dev.id) for n in range(4)])
+    await db_session.commit()
+    headers = {"Authorization": f"Bearer {create_access_token(me.id)}"}
+
+    statements = []
+    sync_engine = db_session.bind.sync_engine
+    listener = lambda conn, cursor, statement, *args: statements.append(statement)
+    event.listen(sync_engine, "before_cursor_execute", listener)
+    try:
+        r = await client.get(
+            "/api/v1/issues/",
+            headers=headers,
+            params={"include": "comments,reporter,assignee,project", "comments_limit": 2, "sort": "title"},
+        )
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", listener)
+
+    assert r.status_code == 200
+    body = r.json()
+    assert len(body) == 6
+    first, second = body[0], body[1]
+    assert [c["content"] for c in first["comments"]] == ["note 3", "note 2"]
+    assert first["reporter"] == {"id": me.id, "username": "lead", "full_name": "Team Lead"}
+    assert first["assignee"] is None
+    assert second["assignee"]["id"] == dev.id
+    assert second["comments"] == []
+    assert first["project"]["key"] == "BOARD"
+    # current user + issues + comments + reporter + assignee + project, independent of page size
+    assert len(statements) == 6
+
+    r = await client.get(f"/api/v1/issues/{issues[0].id}", headers=headers, params={"include": "comments", "fields": "title"})
+    assert r.json() == {"id": issues[0].id, "title": "Bug 0", "comments": r.json()["comments"]}
+    assert len(r.json()["comments"]) == 3
+
+    r = await client.get("/api/v1/issues/", headers=headers, params={"include": "watchers"})
+    assert r.status_code == 400
@@ -0,0 +1,60 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.cache import QueryCache, issue_list_cache
+from app.core.config import settings
+from app.core.security import create_access_token
+from app.models.project import Project
+from app.models.user import User, UserRole
+
+
+@pytest.mark.asyncio
+async def test_issue_list_pages_are_cached_per_project_version(client: AsyncClient, db_session: AsyncSession):
+    me = User(username="viewer", email="viewer@test.com", hashed_password="pw", role=UserRole.USER)
+    db_session.add(me)
+    await db_session.commit()
+    board = Project(name="Board", key="BRD", owner_id=me.id)
+    other = Project(name="Other", key="OTH", owner_id=me.id)
+    db_session.add_all([board, other])
+    await db_session.commit()
+    headers = {"Authorization": f"Bearer {create_access_token(me.id)}"}
+
+    r = await client.post("/api/v1/issues/", headers=headers, json={"title": "First", "description": "d", "project_id": board.id})
+    assert r.status_code == 200
+    issue_id = r.json()["id"]
+
+    params = {"project_id": board.id, "sort": "-created_at"}
+    first = await client.get("/api/v1/issues/", headers=headers, params=params)
+    second = await client.get("/api/v1/issues/", headers=headers, params=params)
+    assert first.json() == second.json()
+    assert issue_list_cache.stats()["hits"] == 1
+
+    # A write in another project leaves this board's pages untouched
+    await client.post("/api/v1/issues/", headers=headers, json={"title": "Elsewhere", "description": "d", "project_id": other.id})
+    await client.get("/api/v1/issues/", headers=headers, params=params)
+    assert issue_list_cache.stats()["hits"] == 2
+
+    # An update in the project bumps its version, so the next read is fresh
+    r = await client.put(f"/api/v1/issues/{issue_id}", headers=headers, json={"status": "in_progress"})
+    assert r.status_code == 200
+    r = await client.get("/api/v1/issues/", headers=headers, params=params)
+    assert [issue["status"] for issue in r.json()] == ["in_progress"]
+    assert issue_list_cache.stats()["hits"] == 2
+
+    # Unscoped lists are invalidated by writes in any project
+    r = await client.get("/api/v1/issues/", headers=headers)
+    assert len(r.json()) == 2
+
+
+@pytest.mark.asyncio
+async def test_writes_invalidate_other_replicas_by_default():
+    # Two processes' caches sharing Redis, as behind a load balancer.
+    first = QueryCache("issues", maxsize=10, use_redis=settings.QUERY_CACHE_REDIS)
+    second = QueryCache("issues", maxsize=10, use_redis=settings.QUERY_CACHE_REDIS)
+    params = ("open",)
+
+    await first.set("project:1", await first.version("project:1"), params, [{"id": 1}])
+    assert await second.get("project:1", await second.version("project:1"), params) == [{"id": 1}]
+
+    await second.bump("project:1")
+    assert await first.get("project:1", await first.version("project:1"), params) is None
@@ -0,0 +1,119 @@
+import io
+import json
+import logging
+import queue
+import sys
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.core.logging import NonBlockingQueueHandler, log_stats, logger, setup_logging, stop_logging
+from app.core.security import create_access_token
+from app.models.user import User, UserRole
+
+
+class RecordingHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+@pytest.fixture
+def recorded():
+    handler = RecordingHandler()
+    root = logging.getLogger()
+    root.addHandler(handler)
+    yield handler.records
+    root.removeHandler(handler)
+
+
+def _access_events(records):
+    return [r.msg for r in records if isinstance(r.msg, dict) and r.msg.get("event") == "access"]
+
+
+def test_full_queue_drops_instead_of_blocking():
+    handler = NonBlockingQueueHandler(queue.Queue(maxsize=1))
+    dropped = log_stats["dropped"]
+    for _ in range(3):
+        handler.handle(logging.makeLogRecord({"msg": "x", "levelno": logging.INFO}))
+    assert log_stats["dropped"] == dropped + 2
+
+
+def test_events_are_enqueued_unrendered(recorded):
+    logger.info("unrendered", answer=42)
+    (record,) = [r for r in recorded if isinstance(r.msg, dict) and r.msg.get("event") == "unrendered"]
+    # Rendering is left to the listener thread.
+    assert record.msg["answer"] == 42 and record.msg["level"] == "info"
+
+
+def test_logging_can_be_stopped_and_set_up_again(monkeypatch):
+    def queue_handlers():
+        return [h for h in logging.getLogger().handlers if isinstance(h, NonBlockingQueueHandler)]
+
+    stop_logging()
+    try:
+        assert queue_handlers() == []
+        out = io.StringIO()
+        monkeypatch.setattr(sys, "stdout", out)
+        setup_logging()
+        assert len(queue_handlers()) == 1
+        logging.getLogger("restart").warning("after restart")
+        stop_logging()
+        assert queue_handlers() == []
+        assert json.loads(out.getvalue())["event"] == "after restart"
+    finally:
+        monkeypatch.undo()
+        setup_logging()
+
+
+@pytest.mark.asyncio
+async def test_access_log_carries_request_context(client: AsyncClient, db_session: AsyncSession, recorded, monkeypatch):
+    monkeypatch.setattr(settings, "ACCESS_LOG_SAMPLE_RATE", 1.0)
+    me = User(username="logged", email="logged@test.com", hashed_password="pw", role=UserRole.USER)
+    db_session.add(me)
+    await db_session.commit()
+
+    r = await client.get(
+        "/api/v1/projects/",
+        headers={"Authorization": f"Bearer {create_access_token(me.id)}", "X-Request-ID": "req-123"},
+    )
+    assert r.headers["x-request-id"] == "req-123"
+    (event,) = _access_events(recorded)
+    assert event["request_id"] == "req-123"
+    assert event["user_id"] == me.id
+    assert event["route"] == "/api/v1/projects/"
+    assert event["status"] == 200
+
+    r = await client.get("/api/v1/projects/", headers={"X-Request-ID": "bad id\t"})
+    assert r.headers["x-request-id"] != "bad id\t"
+
+
+@pytest.mark.asyncio
+async def test_successful_access_logs_are_sampled(client: AsyncClient, recorded, monkeypatch):
+    monkeypatch.setattr(settings, "ACCESS_LOG_SAMPLE_RATE", 0.0)
+    await client.get("/health")
+    r = await client.get("/api/v1/projects/")
+    assert r.status_code == 401
+
+    events = _access_events(recorded)
+    assert [event["status"] for event in events] == [401]
+    assert events[0]["level"] == "warning"
+
+
+@pytest.mark.asyncio
+async def test_slow_request_log_names_the_slowest_query(client: AsyncClient, db_session: AsyncSession, recorded, monkeypatch):
+    monkeypatch.setattr(settings, "ACCESS_LOG_SLOW_MS", 0)
+    me = User(username="slow", email="slow@test.com", hashed_password="pw", role=UserRole.USER)
+    db_session.add(me)
+    await db_session.commit()
+
+    await client.get("/api/v1/projects/", headers={"Authorization": f"Bearer {create_access_token(me.id)}"})
+    (event,) = _access_events(recorded)
+    assert event["level"] == "warning"
+    assert event["db_queries"] >= 1
+    assert event["slowest_query"].startswith("SELECT")
+    assert 0 < event["slowest_query_ms"] <= event["db_ms"]
@@ -0,0 +1,66 @@
+import asyncio
+
+import pytest
+from httpx import AsyncClient
+from app.core.metrics import Histogram, event_loop_lag, monitor_event_loop_lag, password_hash_queue, rate_limit_rejections
+from app.core.security import create_access_token
+from app.models.user import User, UserRole
+
+
+def test_histogram_renders_cumulative_buckets():
+    histogram = Histogram("demo_seconds", "demo", ("route",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        histogram.observe(value, "/a")
+
+    lines = list(histogram.samples())
+    assert lines == [
+        'demo_seconds_bucket{route="/a",le="0.1"} 2',
+        'demo_seconds_bucket{route="/a",le="1"} 3',
+        'demo_seconds_bucket{route="/a",le="+Inf"} 4',
+        'demo_seconds_sum{route="/a"} 3.65',
+        'demo_seconds_count{route="/a"} 4',
+    ]
+
+
+@pytest.mark.asyncio
+async def test_requests_are_labelled_by_route_template(client: AsyncClient, db_session):
+    me = User(username="observer", email="observer@test.com", hashed_password="pw", role=UserRole.USER)
+    db_session.add(me)
+    await db_session.commit()
+    headers = {"Authorization": f"Bearer {create_access_token(me.id)}"}
+
+    for issue_id in (101, 102):
+        r = await client.get(f"/api/v1/issues/{issue_id}", headers=headers)
+        assert r.status_code == 404
+
+    r = await client.get("/metrics")
+    assert r.status_code == 200
+    assert r.headers["content-type"].startswith("text/plain; version=0.0.4")
+    body = r.text
+    assert 'http_request_duration_seconds_count{method="GET",route="/api/v1/issues/{issue_id}",status="404"}' in body
+    assert "/api/v1/issues/101" not in body
+    assert "# TYPE http_requests_in_flight gauge" in body
+
+
+@pytest.mark.asyncio
+async def test_auth_records_hash_queue_time_and_rejections(client: AsyncClient):
+    await client.post("/api/v1/auth/register", json={"email": "metrics@example.com", "password": "password123"})
+    assert password_hash_queue.count("hash") >= 1
+
+    rejected = rate_limit_rejections.value("login")
+    statuses = []
+    for _ in range(6):
+        r = await client.post("/api/v1/auth/login", data={"username": "metrics@example.com", "password": "wrong"})
+        statuses.append(r.status_code)
+    assert statuses[-1] == 429
+    assert rate_limit_rejections.value("login") == rejected + statuses.count(429)
+    assert password_hash_queue.count("verify") >= statuses.count(401)
+
+
+@pytest.mark.asyncio
+async def test_event_loop_lag_monitor_records_samples():
+    before = event_loop_lag.count()
+    monitor = asyncio.create_task(monitor_event_loop_lag(interval=0.01))
+    await asyncio.sleep(0.05)
+    monitor.cancel()
+    assert event_loop_lag.count() > before
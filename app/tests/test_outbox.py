@@ -0,0 +1,170 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from app.core.outbox import OutboxHandlers
+from app.core.security import create_access_token
+from app.models.issue import Issue, IssueStatus
+from app.models.outbox import OutboxEvent
+from app.models.project import Project
+from app.models.user import User, UserRole
+from app.workers.outbox import OutboxWorker
+
+
+async def _seed(db_session: AsyncSession):
+    me = User(username="author", email="author@test.com", hashed_password="pw", role=UserRole.USER)
+    db_session.add(me)
+    await db_session.commit()
+    project = Project(name="Board", key="BOARD", owner_id=me.id)
+    db_session.add(project)
+    await db_session.commit()
+    return me, project
+
+
+async def _outbox(db_session: AsyncSession):
+    result = await db_session.execute(
+        select(OutboxEvent).order_by(OutboxEvent.id).execution_options(populate_existing=True)
+    )
+    return result.scalars().all()
+
+
+@pytest.mark.asyncio
+async def test_changes_are_written_to_outbox_in_same_transaction(client: AsyncClient, db_session: AsyncSession):
+    me, project = await _seed(db_session)
+    headers = {"Authorization": f"Bearer {create_access_token(me.id)}"}
+
+    r = await client.post("/api/v1/issues/", headers=headers, json={"title": "Queued", "description": "d", "project_id": project.id})
+    issue_id = r.json()["id"]
+    await client.put(f"/api/v1/issues/{issue_id}", headers=headers, json={"status": "in_progress"})
+    await client.post("/api/v1/comments/", headers=headers, json={"content": "noted", "issue_id": issue_id})
+
+    # A rolled-back change leaves nothing behind
+    db_session.add(Issue(title="Never", description="d", project_id=project.id, reporter_id=me.id,
+                         status=IssueStatus.OPEN, severity="low"))
+    await db_session.flush()
+    await db_session.rollback()
+
+    events = [(e.event_type, e.aggregate_id) for e in await _outbox(db_session)]
+    assert events[-3:] == [("issue.created", issue_id), ("issue.updated", issue_id), ("comment.created", events[-1][1])]
+    assert not any(e[0] == "issue.created" and e[1] != issue_id for e in events)
+    assert (await _outbox(db_session))[-2].payload["status"] == "in_progress"
+
+
+@pytest.mark.asyncio
+async def test_worker_retries_with_backoff_then_marks_dead(db_session: AsyncSession):
+    me, project = await _seed(db_session)
+    db_session.add_all([
+        Issue(title=title, description="d", project_id=project.id, reporter_id=me.id,
+              status=IssueStatus.OPEN, severity="low")
+        for title in ("ok", "flaky", "broken")
+    ])
+    await db_session.commit()
+
+    handlers = OutboxHandlers()
+    seen = []
+    flaky_failures = iter([True])
+
+    @handlers.register("issue.created")
+    async def deliver(event):
+        title = event.payload["title"]
+        if title == "broken" or (title == "flaky" and next(flaky_failures, False)):
+            raise RuntimeError(f"{title} failed")
+        seen.append(title)
+
+    factory = async_sessionmaker(bind=db_session.bind, expire_on_commit=False)
+    worker = OutboxWorker(factory, handlers=handlers, batch_size=10, max_attempts=2)
+    assert await worker.run_once() == 3
+    assert seen == ["ok"]
+
+    by_title = {e.payload["title"]: e for e in await _outbox(db_session) if e.event_type == "issue.created"}
+    assert by_title["ok"].status == "done"
+    assert by_title["flaky"].status == "pending"
+    assert by_title["flaky"].available_at.replace(tzinfo=None) > datetime.utcnow()
+
+    # Nothing is due until the backoff passes
+    assert await worker.run_once() == 0
+    for title in ("flaky", "broken"):
+        by_title[title].available_at = datetime.utcnow() - timedelta(seconds=1)
+    await db_session.commit()
+
+    assert await worker.run_once() == 2
+    assert seen == ["ok", "flaky"]
+    by_title = {e.payload["title"]: e for e in await _outbox(db_session) if e.event_type == "issue.created"}
+    assert by_title["flaky"].status == "done"
+    assert by_title["broken"].status == "dead"
+    assert by_title["broken"].attempts == 2
+    assert by_title["broken"].last_error == "RuntimeError: broken failed"
+
+
+@pytest.mark.asyncio
+async def test_claimed_rows_are_leased(db_session: AsyncSession):
+    me, project = await _seed(db_session)
+    db_session.add(Issue(title="leased", description="d", project_id=project.id, reporter_id=me.id,
+                         status=IssueStatus.OPEN, severity="low"))
+    await db_session.commit()
+
+    factory = async_sessionmaker(bind=db_session.bind, expire_on_commit=False)
+    first = OutboxWorker(factory, handlers=OutboxHandlers())
+    second = OutboxWorker(factory, handlers=OutboxHandlers())
+    async with factory() as db:
+        claimed = await first.claim(db)
+    assert len(claimed) == 1
+    async with factory() as db:
+        assert await second.claim(db) == []
+
+
+@pytest.mark.asyncio
+async def test_slow_handlers_time_out_before_the_lease(db_session: AsyncSession):
+    me, project = await _seed(db_session)
+    db_session.add(Issue(title="stuck", description="d", project_id=project.id, reporter_id=me.id,
+                         status=IssueStatus.OPEN, severity="low"))
+    await db_session.commit()
+
+    handlers = OutboxHandlers()
+
+    @handlers.register("issue.created")
+    async def hang(event):
+        await asyncio.sleep(30)
+
+    factory = async_sessionmaker(bind=db_session.bind, expire_on_commit=False)
+    with pytest.raises(ValueError):
+        OutboxWorker(factory, handlers=handlers, lease_seconds=10, handler_timeout=10)
+    worker = OutboxWorker(factory, handlers=handlers, lease_seconds=10, handler_timeout=0.05)
+    assert await worker.run_once() == 1
+
+    stuck = (await _outbox(db_session))[-1]
+    assert stuck.status == "pending"
+    assert stuck.locked_until is None
+    assert stuck.last_error.startswith("TimeoutError")
+
+
+@pytest.mark.asyncio
+async def test_outcome_is_dropped_when_the_lease_was_lost(db_session: AsyncSession):
+    me, project = await _seed(db_session)
+    db_session.add(Issue(title="contended", description="d", project_id=project.id, reporter_id=me.id,
+                         status=IssueStatus.OPEN, severity="low"))
+    await db_session.commit()
+
+    factory = async_sessionmaker(bind=db_session.bind, expire_on_commit=False)
+    handlers = OutboxHandlers()
+
+    @handlers.register("issue.created")
+    async def overrun(event):
+        # Meanwhile the lease expired and another worker claimed the row.
+        async with factory() as db:
+            await db.execute(
+                update(OutboxEvent).where(OutboxEvent.id == event.id)
+                .values(locked_until=datetime.now(timezone.utc) + timedelta(minutes=5), attempts=OutboxEvent.attempts + 1)
+            )
+            await db.commit()
+
+    worker = OutboxWorker(factory, handlers=handlers)
+    assert await worker.run_once() == 1
+
+    contended = (await _outbox(db_session))[-1]
+    assert contended.status == "pending"
+    assert contended.locked_until is not None
+    assert contended.attempts == 2
@@ -0,0 +1,83 @@
+import time
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.profiler import PROFILE_ID_HEADER, issue_profile_token, load_profile, verify_profile_token
+from app.core.security import create_access_token
+from app.middlewares.profiling import ProfilingMiddleware
+from app.models.user import User, UserRole
+
+
+def busy_endpoint_work(seconds: float) -> None:
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+async def _admin_headers(db_session: AsyncSession) -> dict:
+    admin = User(username="root", email="root@test.com", hashed_password="pw", role=UserRole.ADMIN)
+    db_session.add(admin)
+    await db_session.commit()
+    return {"Authorization": f"Bearer {create_access_token(admin.id)}"}
+
+
+def test_profile_tokens_are_signed_and_expire():
+    token, _ = issue_profile_token()
+    assert verify_profile_token(token)
+    expires, _, signature = token.partition(".")
+    assert not verify_profile_token(f"{int(expires) + 60}.{signature}")
+    expired, _ = issue_profile_token(ttl=-1)
+    assert not verify_profile_token(expired)
+
+
+@pytest.mark.asyncio
+async def test_token_profiles_only_that_request():
+    async def app(scope, receive, send):
+        busy_endpoint_work(0.1)
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    token, _ = issue_profile_token()
+    scope = {"type": "http", "method": "GET", "path": "/slow", "headers": [(b"x-profile-token", token.encode())]}
+    await ProfilingMiddleware(app)(scope, None, send)
+
+    profile_id = dict(sent[0]["headers"])[PROFILE_ID_HEADER.lower().encode()].decode()
+    meta, collapsed = await load_profile(profile_id)
+    assert meta["label"] == "GET /slow"
+    assert meta["samples"] > 0
+    assert "busy_endpoint_work" in collapsed
+
+
+@pytest.mark.asyncio
+async def test_admin_window_profile_and_retrieval(client: AsyncClient, db_session: AsyncSession):
+    headers = await _admin_headers(db_session)
+    user = User(username="plain", email="plain@test.com", hashed_password="pw", role=UserRole.USER)
+    db_session.add(user)
+    await db_session.commit()
+
+    r = await client.post("/api/v1/admin/profiles/token",
+                          headers={"Authorization": f"Bearer {create_access_token(user.id)}"})
+    assert r.status_code == 403
+
+    r = await client.post("/api/v1/admin/profiles", headers=headers, params={"seconds": 0.1, "interval_ms": 2})
+    assert r.status_code == 200
+    profile = r.json()
+    assert profile["samples"] > 0
+
+    r = await client.get(f"/api/v1/admin/profiles/{profile['id']}", headers=headers)
+    assert r.status_code == 200
+    assert r.text.splitlines()[0].rsplit(" ", 1)[1].isdigit()
+
+    r = await client.get(f"/api/v1/admin/profiles/{profile['id']}", headers=headers, params={"format": "speedscope"})
+    document = r.json()
+    assert document["profiles"][0]["type"] == "sampled"
+    assert len(document["profiles"][0]["samples"]) == len(document["profiles"][0]["weights"])
+
+    r = await client.get(f"/api/v1/admin/profiles/{'0' * 32}", headers=headers)
+    assert r.status_code == 404
@@ -0,0 +1,90 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+import app.core.request_timing as request_timing
+import app.middlewares.request_timing as timing_middleware
+from app.core.config import settings
+from app.core.security import create_access_token
+from app.middlewares.request_timing import RequestTimingMiddleware
+from app.models.user import User, UserRole
+
+
+class RecordingLogger:
+    def __init__(self):
+        self.events = []
+
+    def warning(self, event, **fields):
+        self.events.append((event, fields))
+
+
+def _server_timing(header: str) -> dict:
+    entries = {}
+    for entry in header.split(", "):
+        name, *params = entry.split(";")
+        entries[name] = dict(param.split("=", 1) for param in params)
+    return entries
+
+
+def test_statement_shape_folds_placeholders():
+    shape = request_timing.statement_shape
+    assert shape("SELECT * FROM t WHERE id IN (?, ?, ?)") == shape("SELECT * FROM t WHERE id IN (?)")
+    assert shape("SELECT * FROM t WHERE id = $1") == "SELECT * FROM t WHERE id = ?"
+
+
+@pytest.mark.asyncio
+async def test_server_timing_reports_queries_and_auth(client: AsyncClient, db_session: AsyncSession):
+    me = User(username="timed", email="timed@test.com", hashed_password="pw", role=UserRole.USER)
+    db_session.add(me)
+    await db_session.commit()
+
+    r = await client.get("/api/v1/projects/", headers={"Authorization": f"Bearer {create_access_token(me.id)}"})
+
+    assert r.status_code == 200
+    timings = _server_timing(r.headers["server-timing"])
+    assert set(timings) == {"db", "redis", "auth", "serialize", "total"}
+    assert int(timings["db"]["desc"].strip('"').split()[0]) >= 1
+    assert float(timings["auth"]["dur"]) > 0
+    assert float(timings["total"]["dur"]) >= float(timings["db"]["dur"])
+
+
+@pytest.mark.asyncio
+async def test_repeated_statements_are_flagged(db_session: AsyncSession, monkeypatch):
+    recorder = RecordingLogger()
+    monkeypatch.setattr(timing_middleware, "logger", recorder)
+    monkeypatch.setattr(settings, "N_PLUS_ONE_DETECTION", True)
+    monkeypatch.setattr(settings, "N_PLUS_ONE_THRESHOLD", 3)
+
+    async def n_plus_one(scope, receive, send):
+        for issue_id in range(4):
+            await db_session.execute(text("SELECT :id AS id"), {"id": issue_id})
+        await db_session.execute(text("SELECT 1"))
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {"type": "http", "method": "GET", "path": "/loop", "headers": []}
+    await RequestTimingMiddleware(n_plus_one)(scope, None, send)
+
+    assert [event for event, _ in recorder.events] == ["n_plus_one_detected"]
+    fields = recorder.events[0][1]
+    assert fields["count"] == 4 and fields["queries"] == 5 and fields["path"] == "/loop"
+    assert sent[0]["headers"][0][0] == b"server-timing"
+
+
+@pytest.mark.asyncio
+async def test_slow_queries_are_logged(db_session: AsyncSession, monkeypatch):
+    recorder = RecordingLogger()
+    monkeypatch.setattr(request_timing, "logger", recorder)
+    monkeypatch.setattr(settings, "SLOW_QUERY_MS", 0)
+
+    await db_session.execute(text("SELECT   1"))
+
+    event, fields = recorder.events[-1]
+    assert event == "slow_query"
+    assert fields["statement"] == "SELECT 1"
+    assert fields["path"] is None
@@ -0,0 +1,45 @@
+import threading
+
+import bleach
+import pytest
+from app.core import sanitizer
+from app.core.config import settings
+
+SAMPLES = [
+    "Plain text comment, nothing to clean.",
+    "Multi-line\n\tindented log output\nwith unicode: déjà vu ✓ 🙂",
+    "<script>alert(1)</script> and <b>bold</b>",
+    "a & b, &amp; and &nbsp; entities",
+    "5 < 6 > 4",
+    "windows line\r\nendings",
+    "nul\x00 and bell\x07 controls",
+    '<a href="javascript:alert(1)" onclick="x()">link</a>',
+    "",
+]
+
+
+@pytest.mark.parametrize("text", SAMPLES)
+def test_sanitize_matches_bleach(text):
+    assert sanitizer.sanitize(text) == bleach.clean(text, strip=True)
+
+
+@pytest.mark.asyncio
+async def test_large_markup_is_cleaned_off_the_event_loop(monkeypatch):
+    monkeypatch.setattr(settings, "SANITIZE_OFFLOAD_THRESHOLD", 64)
+    threads = []
+    real_cleaner = sanitizer._cleaner
+
+    def tracking_cleaner():
+        threads.append(threading.get_ident())
+        return real_cleaner()
+
+    monkeypatch.setattr(sanitizer, "_cleaner", tracking_cleaner)
+    small = "<i>short</i>"
+    large = "<b>stack</b> trace line &\n" * 20
+
+    assert await sanitizer.sanitize_async(small) == bleach.clean(small, strip=True)
+    assert await sanitizer.sanitize_async(large) == bleach.clean(large, strip=True)
+    assert await sanitizer.sanitize_async("no markup " * 20) == "no markup " * 20
+    assert threads[0] == threading.get_ident()
+    assert threads[1] != threading.get_ident()
+    assert len(threads) == 2
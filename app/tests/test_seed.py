@@ -0,0 +1,64 @@
+from collections import Counter
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.cli.seed import ASSIGNED_STATUSES, seed
+from app.core.security import create_access_token
+from app.db.base_class import Base
+from app.models.comment import Comment
+from app.models.issue import Issue, IssueStatus
+from app.models.user import User
+
+
+async def _dump(db_session: AsyncSession):
+    issues = (await db_session.execute(select(Issue.id, Issue.status, Issue.severity, Issue.project_id,
+                                              Issue.assignee_id, Issue.created_at, Issue.updated_at))).all()
+    comments = (await db_session.execute(select(Comment.id, Comment.issue_id, Comment.author_id, Comment.created_at))).all()
+    return issues, comments
+
+
+@pytest.mark.asyncio
+async def test_seed_generates_consistent_skewed_data(db_session: AsyncSession):
+    engine = db_session.bind
+    stats = await seed(engine, users=50, projects=20, issues=2000, comments=3000, seed=7, batch_size=300)
+    assert (stats["users"], stats["projects"], stats["issues"], stats["comments"]) == (50, 20, 2000, 3000)
+
+    issues, comments = await _dump(db_session)
+    assert len(issues) == 2000 and len(comments) == 3000
+    # Zipf: the most popular project gets several times its uniform share.
+    assert Counter(i.project_id for i in issues).most_common(1)[0][1] > 3 * 2000 / 20
+    assert {i.status for i in issues} == set(IssueStatus)
+    assert all(i.assignee_id is not None for i in issues if i.status in ASSIGNED_STATUSES)
+    assert all(i.updated_at >= i.created_at for i in issues)
+
+    commented = {c.issue_id for c in comments}
+    closed_critical = {i.id for i in issues if i.status is IssueStatus.CLOSED and i.severity == "critical"}
+    assert closed_critical and closed_critical <= commented
+    created = {i.id: i.created_at for i in issues}
+    assert all(c.created_at >= created[c.issue_id] for c in comments)
+
+
+@pytest.mark.asyncio
+async def test_seed_is_deterministic(db_session: AsyncSession):
+    engine = db_session.bind
+    await seed(engine, users=20, projects=5, issues=300, comments=500, seed=3)
+    first = await _dump(db_session)
+    for table in reversed(Base.metadata.sorted_tables):
+        await db_session.execute(table.delete())
+    await db_session.commit()
+
+    await seed(engine, users=20, projects=5, issues=300, comments=500, seed=3)
+    assert await _dump(db_session) == first
+
+
+@pytest.mark.asyncio
+async def test_seeded_users_can_use_the_api(client: AsyncClient, db_session: AsyncSession):
+    await seed(db_session.bind, users=5, projects=2, issues=40, comments=40, seed=1, password="seed-password")
+    r = await client.post("/api/v1/auth/login", data={"username": "user3@example.com", "password": "seed-password"})
+    assert r.status_code == 200
+
+    me = await db_session.scalar(select(User).where(User.username == "user1"))
+    r = await client.get("/api/v1/issues/", headers={"Authorization": f"Bearer {create_access_token(me.id)}"})
+    assert r.status_code == 200
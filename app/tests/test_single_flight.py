@@ -0,0 +1,102 @@
+import asyncio
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.singleflight import SingleFlight, issue_list_flight, project_flight
+from app.models.issue import Issue, IssueStatus
+from app.models.project import Project
+from app.models.user import User, UserRole
+from app.services.issue_service import IssueService
+from app.services.project_service import ProjectService
+
+
+async def _seed(db_session: AsyncSession):
+    me = User(username="herd", email="herd@test.com", hashed_password="pw", role=UserRole.USER)
+    db_session.add(me)
+    await db_session.commit()
+    project = Project(name="Hot board", key="HOT", owner_id=me.id)
+    db_session.add(project)
+    await db_session.commit()
+    db_session.add_all([
+        Issue(title=f"Bug {i}", description="d", project_id=project.id, reporter_id=me.id,
+              status=IssueStatus.OPEN, severity="low")
+        for i in range(3)
+    ])
+    await db_session.commit()
+    return project
+
+
+def _count_selects(table: str):
+    statements = []
+    def listener(conn, cursor, statement, *args):
+        if statement.lstrip().upper().startswith("SELECT") and f"FROM {table}" in statement:
+            statements.append(statement)
+    return statements, listener
+
+
+@pytest.mark.asyncio
+async def test_concurrent_issue_lists_share_one_query(db_session: AsyncSession):
+    project = await _seed(db_session)
+    service = IssueService(db_session)
+    statements, listener = _count_selects("issues")
+    sync_engine = db_session.bind.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", listener)
+    try:
+        pages = await asyncio.gather(*(
+            service.get_issues(project_id=project.id, status=None, severity=None, assignee_id=None, search=None)
+            for _ in range(5)
+        ))
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", listener)
+
+    assert len(statements) == 1
+    assert all([issue.title for issue in page] == ["Bug 0", "Bug 1", "Bug 2"] for page in pages)
+    assert issue_list_flight.stats()["executions"] == 1
+    assert issue_list_flight.stats()["collapsed"] == 4
+
+
+@pytest.mark.asyncio
+async def test_concurrent_project_reads_share_one_query(db_session: AsyncSession):
+    project = await _seed(db_session)
+    db_session.expunge_all()
+    service = ProjectService(db_session)
+    statements, listener = _count_selects("projects")
+    sync_engine = db_session.bind.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", listener)
+    try:
+        loaded = await asyncio.gather(*(service.get_project(project.id) for _ in range(4)))
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", listener)
+
+    assert len(statements) == 1
+    assert {p.name for p in loaded} == {"Hot board"}
+    assert project_flight.stats()["collapsed"] == 3
+
+
+@pytest.mark.asyncio
+async def test_errors_reach_every_waiter_and_cancelled_leader_hands_over():
+    flight = SingleFlight("test")
+    calls = 0
+
+    async def failing():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    results = await asyncio.gather(*(flight.do("k", failing) for _ in range(3)), return_exceptions=True)
+    assert calls == 1
+    assert all(isinstance(result, ValueError) for result in results)
+
+    async def slow():
+        await asyncio.sleep(0.05)
+        return "done"
+
+    leader = asyncio.create_task(flight.do("k", slow))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(flight.do("k", slow))
+    await asyncio.sleep(0)
+    leader.cancel()
+    assert await follower == ("done", True)
+    assert flight.stats()["in_flight"] == 0
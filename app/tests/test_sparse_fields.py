@@ -0,0 +1,43 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.security import create_access_token
+from app.models.issue import Issue, IssueStatus
+from app.models.project import Project
+from app.models.user import User, UserRole
+
+
+@pytest.mark.asyncio
+async def test_fields_prune_query_and_payload(client: AsyncClient, db_session: AsyncSession):
+    me = User(username="mobile", email="mobile@test.com", hashed_password="pw", role=UserRole.USER)
+    db_session.add(me)
+    await db_session.commit()
+    project = Project(name="Mobile", key="MOB", owner_id=me.id)
+    db_session.add(project)
+    await db_session.commit()
+    issue = Issue(title="Crash", description="x" * 5000, project_id=project.id, reporter_id=me.id, status=IssueStatus.OPEN, severity="high")
+    db_session.add(issue)
+    await db_session.commit()
+    db_session.expunge_all()
+    headers = {"Authorization": f"Bearer {create_access_token(me.id)}"}
+
+    statements = []
+    sync_engine = db_session.bind.sync_engine
+    listener = lambda conn, cursor, statement, *args: statements.append(statement)
+    event.listen(sync_engine, "before_cursor_execute", listener)
+    try:
+        r = await client.get("/api/v1/issues/", headers=headers, params={"fields": "title,status,severity"})
+        detail = await client.get(f"/api/v1/issues/{issue.id}", headers=headers, params={"fields": "title"})
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", listener)
+
+    assert r.status_code == 200
+    assert r.json() == [{"id": issue.id, "title": "Crash", "status": "open", "severity": "high"}]
+    assert detail.json() == {"id": issue.id, "title": "Crash"}
+    issue_selects = [s for s in statements if "FROM issues" in s]
+    assert issue_selects
+    assert all("issues.description" not in s for s in issue_selects)
+
+    r = await client.get("/api/v1/issues/", headers=headers, params={"fields": "title,hashed_password"})
+    assert r.status_code == 400
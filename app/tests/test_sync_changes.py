@@ -0,0 +1,103 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import func, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.security import create_access_token
+from app.models.comment import Comment
+from app.models.issue import Issue, IssueStatus
+from app.models.project import Project
+from app.models.user import User, UserRole
+
+
+async def _age(db_session: AsyncSession, model, ids, minutes_ago: int, **values):
+    # Server-side timestamps, in the same format the database writes itself.
+    await db_session.execute(
+        update(model)
+        .where(model.id.in_(ids))
+        .values(updated_at=func.datetime("now", f"-{minutes_ago} minutes"), **values)
+    )
+    await db_session.commit()
+
+
+@pytest.mark.asyncio
+async def test_issue_changes_page_through_cursor_and_tombstones(client: AsyncClient, db_session: AsyncSession):
+    me = User(username="desktop", email="desktop@test.com", hashed_password="pw", role=UserRole.USER)
+    db_session.add(me)
+    await db_session.commit()
+    kept = Project(name="Kept", key="KEPT", owner_id=me.id)
+    dropped = Project(name="Dropped", key="DROP", owner_id=me.id)
+    db_session.add_all([kept, dropped])
+    await db_session.commit()
+    issues = [
+        Issue(title=f"Bug {i}", description="d", project_id=kept.id if i < 4 else dropped.id,
+              reporter_id=me.id, status=IssueStatus.OPEN, severity="low")
+        for i in range(5)
+    ]
+    db_session.add_all(issues)
+    await db_session.commit()
+    ids = [issue.id for issue in issues]
+    # Two issues share a timestamp so the id tie-break is exercised across pages.
+    await _age(db_session, Issue, ids[:3], 50)
+    await _age(db_session, Issue, ids[3:], 40)
+    await _age(db_session, Project, [kept.id, dropped.id], 60)
+    headers = {"Authorization": f"Bearer {create_access_token(me.id)}"}
+
+    async def changes(cursor=None, limit=100):
+        params = {"limit": limit}
+        if cursor:
+            params["since"] = cursor
+        r = await client.get("/api/v1/issues/changes", headers=headers, params=params)
+        assert r.status_code == 200
+        return r.json()
+
+    first = await changes(limit=2)
+    assert [item["id"] for item in first["items"]] == ids[:2]
+    assert first["has_more"] is True
+    rest = await changes(first["cursor"], limit=2)
+    assert [item["id"] for item in rest["items"]] == ids[2:4]
+    tail = await changes(rest["cursor"], limit=2)
+    assert [item["id"] for item in tail["items"]] == ids[4:]
+    assert tail["has_more"] is False
+    idle = await changes(tail["cursor"])
+    assert idle["items"] == [] and idle["tombstones"] == []
+    assert idle["cursor"] == tail["cursor"]
+
+    # An edit moves the issue past the cursor; archiving emits a tombstone
+    # and hides that project's issues from the feed.
+    await _age(db_session, Issue, [ids[1]], 20, title="Renamed")
+    await _age(db_session, Issue, [ids[4]], 20)
+    await _age(db_session, Project, [dropped.id], 10, is_archived=True)
+    delta = await changes(idle["cursor"])
+    assert [(item["id"], item["title"]) for item in delta["items"]] == [(ids[1], "Renamed")]
+    assert [t["project_id"] for t in delta["tombstones"]] == [dropped.id]
+    assert (await changes(delta["cursor"]))["tombstones"] == []
+
+    r = await client.get("/api/v1/issues/changes", headers=headers, params={"since": "not-a-cursor"})
+    assert r.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_comment_changes_follow_edits(client: AsyncClient, db_session: AsyncSession):
+    me = User(username="writer", email="writer@test.com", hashed_password="pw", role=UserRole.USER)
+    db_session.add(me)
+    await db_session.commit()
+    project = Project(name="Board", key="BOARD", owner_id=me.id)
+    db_session.add(project)
+    await db_session.commit()
+    issue = Issue(title="Bug", description="d", project_id=project.id, reporter_id=me.id,
+                  status=IssueStatus.OPEN, severity="low")
+    db_session.add(issue)
+    await db_session.commit()
+    comments = [Comment(content=f"c{n}", issue_id=issue.id, author_id=me.id) for n in range(3)]
+    db_session.add_all(comments)
+    await db_session.commit()
+    await _age(db_session, Comment, [c.id for c in comments], 30)
+    headers = {"Authorization": f"Bearer {create_access_token(me.id)}"}
+
+    r = await client.get("/api/v1/comments/changes", headers=headers)
+    body = r.json()
+    assert [item["content"] for item in body["items"]] == ["c0", "c1", "c2"]
+
+    await _age(db_session, Comment, [comments[0].id], 5, content="c0 edited")
+    r = await client.get("/api/v1/comments/changes", headers=headers, params={"since": body["cursor"]})
+    assert [item["content"] for item in r.json()["items"]] == ["c0 edited"]
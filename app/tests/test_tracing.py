@@ -0,0 +1,70 @@
+import json
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.core.security import create_access_token
+from app.core.tracing import parse_traceparent, tracer
+from app.models.user import User, UserRole
+
+TRACE_ID = "4bf92f3577b34da6a3ce929d0e0e4736"
+PARENT_ID = "00f067aa0ba902b7"
+
+
+async def _user_headers(db_session: AsyncSession) -> dict:
+    me = User(username="traced", email="traced@test.com", hashed_password="pw", role=UserRole.USER)
+    db_session.add(me)
+    await db_session.commit()
+    return {"Authorization": f"Bearer {create_access_token(me.id)}"}
+
+
+def test_parse_traceparent():
+    assert parse_traceparent(f"00-{TRACE_ID}-{PARENT_ID}-01") == (TRACE_ID, PARENT_ID, True)
+    assert parse_traceparent(f"00-{TRACE_ID}-{PARENT_ID}-00") == (TRACE_ID, PARENT_ID, False)
+    assert parse_traceparent(f"00-{'0' * 32}-{PARENT_ID}-01") is None
+    assert parse_traceparent("garbage") is None
+
+
+@pytest.mark.asyncio
+async def test_sampled_request_exports_spans_per_layer(client: AsyncClient, db_session: AsyncSession, tmp_path, monkeypatch):
+    spans_file = tmp_path / "spans.jsonl"
+    monkeypatch.setattr(settings, "TRACING_EXPORTER", "file")
+    monkeypatch.setattr(settings, "TRACING_FILE", str(spans_file))
+    headers = await _user_headers(db_session)
+    await tracer.flush()
+
+    r = await client.get("/api/v1/projects/", headers={**headers, "traceparent": f"00-{TRACE_ID}-{PARENT_ID}-01"})
+    assert r.status_code == 200
+    await tracer.flush()
+
+    spans = [json.loads(line) for line in spans_file.read_text().splitlines()]
+    assert {span["traceId"] for span in spans} == {TRACE_ID}
+    layers = {attr["value"]["stringValue"] for span in spans for attr in span["attributes"] if attr["key"] == "layer"}
+    assert {"http", "service", "repository", "db"} <= layers
+
+    by_id = {span["spanId"]: span for span in spans}
+    (root,) = [span for span in spans if span.get("parentSpanId") == PARENT_ID]
+    assert root["name"] == "GET /api/v1/projects/"
+    assert root["kind"] == 2
+    # Every other span hangs off the request's root span.
+    for span in spans:
+        if span is not root:
+            parent = by_id[span["parentSpanId"]]
+            while parent is not root:
+                parent = by_id[parent["parentSpanId"]]
+
+
+@pytest.mark.asyncio
+async def test_unsampled_request_records_nothing(client: AsyncClient, db_session: AsyncSession, monkeypatch):
+    monkeypatch.setattr(settings, "TRACING_EXPORTER", "file")
+    monkeypatch.setattr(settings, "TRACING_SAMPLE_RATE", 0.0)
+    headers = await _user_headers(db_session)
+    recorded = tracer.stats["recorded"]
+
+    r = await client.get("/api/v1/projects/", headers=headers)
+    assert r.status_code == 200
+    r = await client.get("/api/v1/projects/", headers={**headers, "traceparent": f"00-{TRACE_ID}-{PARENT_ID}-00"})
+    assert r.status_code == 200
+
+    assert tracer.stats["recorded"] == recorded
@@ -0,0 +1,277 @@
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from app.core.config import settings
+from app.core.outbox import OutboxHandlers
+from app.core.security import create_access_token
+from app.core.webhooks import (
+    SIGNATURE_HEADER, TIMESTAMP_HEADER, UnsafeWebhookTarget, WebhookDispatcher, WebhookDeliveryError, check_target, sign,
+)
+from app.models.issue import Issue, IssueStatus
+from app.models.outbox import OutboxEvent
+from app.models.project import Project
+from app.models.user import User, UserRole
+from app.models.webhook import WebhookDelivery, WebhookSubscription
+from app.services.webhook_service import WebhookOutboxHandler
+from app.workers.outbox import OutboxWorker
+
+
+class Receiver:
+    """Stand-in webhook endpoint: records requests, can fail or stall on demand."""
+
+    def __init__(self):
+        self.requests = []
+        self.fail_next = 0
+        self.delay = 0.0
+        receiver = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers["Content-Length"]))
+                time.sleep(receiver.delay)
+                if receiver.fail_next:
+                    receiver.fail_next -= 1
+                    status = 503
+                else:
+                    receiver.requests.append((dict(self.headers), body))
+                    status = 204
+                self.send_response(status)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_port}/hook"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def events(self):
+        return [event for _, body in self.requests for event in json.loads(body)["events"]]
+
+
+@pytest_asyncio.fixture
+async def receiver(monkeypatch):
+    # Loopback is refused unless allowlisted.
+    monkeypatch.setattr(settings, "WEBHOOK_ALLOWED_HOSTS", ["127.0.0.1"])
+    server = Receiver()
+    yield server
+    server.server.shutdown()
+    server.server.server_close()
+
+
+@pytest.mark.asyncio
+async def test_deliveries_are_signed_and_retried(receiver):
+    dispatcher = WebhookDispatcher(retry_base=0.01)
+    receiver.fail_next = 2
+    try:
+        await dispatcher.deliver(receiver.url, "s3cret-s3cret-s3cret", {"id": 1, "type": "issue.updated"})
+    finally:
+        await dispatcher.aclose()
+
+    assert dispatcher.stats["retries"] == 2
+    headers, body = receiver.requests[0]
+    assert headers[SIGNATURE_HEADER] == sign("s3cret-s3cret-s3cret", headers[TIMESTAMP_HEADER], body)
+    assert receiver.events() == [{"id": 1, "type": "issue.updated"}]
+
+
+@pytest.mark.asyncio
+async def test_slow_endpoint_gets_batched_deliveries(receiver):
+    receiver.delay = 0.1
+    dispatcher = WebhookDispatcher(max_concurrency=1)
+    try:
+        await asyncio.gather(*(dispatcher.deliver(receiver.url, "k" * 16, {"id": n}) for n in range(6)))
+    finally:
+        await dispatcher.aclose()
+
+    # The first event goes out alone; the rest queue up behind it and share one request.
+    assert [len(json.loads(body)["events"]) for _, body in receiver.requests] == [1, 5]
+    assert sorted(event["id"] for event in receiver.events()) == list(range(6))
+
+
+@pytest.mark.asyncio
+async def test_exhausted_retries_raise(receiver):
+    receiver.fail_next = 10
+    dispatcher = WebhookDispatcher(max_attempts=2, retry_base=0.01)
+    try:
+        with pytest.raises(WebhookDeliveryError):
+            await dispatcher.deliver(receiver.url, "k" * 16, {"id": 1})
+    finally:
+        await dispatcher.aclose()
+    assert dispatcher.stats["failures"] == 1
+
+
+@pytest.mark.asyncio
+async def test_outbox_handler_routes_to_matching_subscriptions(client: AsyncClient, db_session: AsyncSession, receiver):
+    owner = User(username="integrator", email="integrator@test.com", hashed_password="pw", role=UserRole.USER)
+    outsider = User(username="outsider", email="outsider@test.com", hashed_password="pw", role=UserRole.USER)
+    db_session.add_all([owner, outsider])
+    await db_session.commit()
+    project = Project(name="Hooked", key="HOOK", owner_id=owner.id)
+    db_session.add(project)
+    await db_session.commit()
+
+    r = await client.post(
+        f"/api/v1/projects/{project.id}/webhooks",
+        headers={"Authorization": f"Bearer {create_access_token(outsider.id)}"},
+        json={"url": receiver.url},
+    )
+    assert r.status_code == 403
+    headers = {"Authorization": f"Bearer {create_access_token(owner.id)}"}
+    r = await client.post(f"/api/v1/projects/{project.id}/webhooks", headers=headers,
+                          json={"url": receiver.url, "event_types": ["issue.updated"]})
+    assert r.status_code == 200
+    secret = r.json()["secret"]
+    r = await client.get(f"/api/v1/projects/{project.id}/webhooks", headers=headers)
+    assert "secret" not in r.json()[0]
+
+    issue = Issue(title="Hooked bug", description="d", project_id=project.id, reporter_id=owner.id,
+                  status=IssueStatus.OPEN, severity="low")
+    db_session.add(issue)
+    await db_session.commit()
+
+    dispatcher = WebhookDispatcher()
+    handler = WebhookOutboxHandler(async_sessionmaker(bind=db_session.bind, expire_on_commit=False), dispatcher)
+    payload = {"id": issue.id, "project_id": project.id, "status": "in_progress"}
+    try:
+        await handler(OutboxEvent(id=1, event_type="issue.created", aggregate_id=issue.id, payload=payload))
+        await handler(OutboxEvent(id=2, event_type="issue.updated", aggregate_id=issue.id, payload=payload))
+    finally:
+        await dispatcher.aclose()
+
+    assert [event["id"] for event in receiver.events()] == [2]
+    sent_headers, body = receiver.requests[0]
+    assert sent_headers[SIGNATURE_HEADER] == sign(secret, sent_headers[TIMESTAMP_HEADER], body)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("url", [
+    "http://127.0.0.1:6379/",
+    "http://localhost/hook",
+    "http://169.254.169.254/latest/meta-data/",
+    "http://10.0.0.5/hook",
+    "http://[::1]/hook",
+    "http://[::ffff:192.168.1.1]/hook",
+    "http://0.0.0.0/hook",
+])
+async def test_internal_targets_are_refused(url):
+    with pytest.raises(UnsafeWebhookTarget):
+        await check_target(url)
+
+
+@pytest.mark.asyncio
+async def test_allowlist_admits_internal_hosts(monkeypatch):
+    monkeypatch.setattr(settings, "WEBHOOK_ALLOWED_HOSTS", ["10.20.0.0/16", "localhost"])
+    await check_target("http://10.20.3.4/hook")
+    await check_target("http://localhost:8080/hook")
+    with pytest.raises(UnsafeWebhookTarget):
+        await check_target("http://10.21.0.1/hook")
+
+
+@pytest.mark.asyncio
+async def test_subscribing_and_delivering_to_internal_hosts_fails(client: AsyncClient, db_session: AsyncSession):
+    owner = User(username="prober", email="prober@test.com", hashed_password="pw", role=UserRole.USER)
+    db_session.add(owner)
+    await db_session.commit()
+    project = Project(name="Probe", key="PRB", owner_id=owner.id)
+    db_session.add(project)
+    await db_session.commit()
+
+    r = await client.post(
+        f"/api/v1/projects/{project.id}/webhooks",
+        headers={"Authorization": f"Bearer {create_access_token(owner.id)}"},
+        json={"url": "http://169.254.169.254/latest/meta-data/"},
+    )
+    assert r.status_code == 400
+
+    # A subscription that became unsafe after it was created is refused at delivery.
+    dispatcher = WebhookDispatcher(retry_base=0.01)
+    try:
+        with pytest.raises(UnsafeWebhookTarget):
+            await dispatcher.deliver("http://127.0.0.1:1/hook", "k" * 16, {"id": 1})
+    finally:
+        await dispatcher.aclose()
+    assert dispatcher.stats["requests"] == 0
+
+
+@pytest.mark.asyncio
+async def test_retries_only_resend_to_subscriptions_that_failed(db_session: AsyncSession, receiver):
+    owner = User(username="fanout", email="fanout@test.com", hashed_password="pw", role=UserRole.USER)
+    db_session.add(owner)
+    await db_session.commit()
+    project = Project(name="Fanout", key="FAN", owner_id=owner.id)
+    db_session.add(project)
+    await db_session.commit()
+    flaky = Receiver()
+    try:
+        db_session.add_all([
+            WebhookSubscription(url=url, secret="k" * 16, event_types=["*"], project_id=project.id, created_by_id=owner.id)
+            for url in (receiver.url, flaky.url)
+        ])
+        await db_session.commit()
+
+        flaky.fail_next = 1
+        dispatcher = WebhookDispatcher(max_attempts=1)
+        handler = WebhookOutboxHandler(async_sessionmaker(bind=db_session.bind, expire_on_commit=False), dispatcher)
+        event = OutboxEvent(id=7, event_type="issue.created", aggregate_id=1, payload={"id": 1, "project_id": project.id})
+        try:
+            with pytest.raises(WebhookDeliveryError):
+                await handler(event)
+            await handler(event)  # the outbox retry
+        finally:
+            await dispatcher.aclose()
+    finally:
+        flaky.server.shutdown()
+        flaky.server.server_close()
+
+    assert [e["id"] for e in receiver.events()] == [7]
+    assert [e["id"] for e in flaky.events()] == [7]
+
+
+@pytest.mark.asyncio
+async def test_slow_endpoint_is_abandoned_at_the_handler_deadline(db_session: AsyncSession, receiver):
+    owner = User(username="slowpoke", email="slowpoke@test.com", hashed_password="pw", role=UserRole.USER)
+    db_session.add(owner)
+    await db_session.commit()
+    project = Project(name="Slow", key="SLOW", owner_id=owner.id)
+    db_session.add(project)
+    await db_session.commit()
+    db_session.add_all([
+        WebhookSubscription(url=receiver.url, secret="k" * 16, event_types=["*"], project_id=project.id,
+                            created_by_id=owner.id),
+        OutboxEvent(event_type="issue.created", aggregate_id=1, payload={"id": 1, "project_id": project.id}),
+    ])
+    await db_session.commit()
+
+    factory = async_sessionmaker(bind=db_session.bind, expire_on_commit=False)
+    dispatcher = WebhookDispatcher(retry_base=0.01)
+    handlers = OutboxHandlers()
+    handlers.register("*")(WebhookOutboxHandler(factory, dispatcher))
+    worker = OutboxWorker(factory, handlers=handlers, handler_timeout=0.2)
+    receiver.delay = 0.5
+    try:
+        started = time.monotonic()
+        assert await worker.run_once() == 1
+        await asyncio.sleep(0)
+        # The in-flight request was cancelled with the handler, not left to
+        # retry (and maybe succeed) after the outbox gave up on the event.
+        assert time.monotonic() - started < 0.4
+        assert not dispatcher._tasks
+        assert dispatcher.stats["failures"] == 1
+    finally:
+        await dispatcher.aclose()
+
+    event = (await db_session.execute(select(OutboxEvent))).scalar_one()
+    await db_session.refresh(event)
+    assert event.status == "pending" and event.last_error.startswith("TimeoutError")
+    assert await db_session.scalar(select(func.count()).select_from(WebhookDelivery)) == 0
@@ -0,0 +1,209 @@
+"""
+Outbox delivery worker. Claims pending outbox rows in batches and hands each
+one to the handlers registered for its event type.
+
+    python -m app.workers.outbox [--once]
+"""
+
+import argparse
+import asyncio
+import random
+import signal
+import time
+from datetime import datetime, timedelta, timezone
+from typing import List
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.core.logging import logger, setup_logging
+from app.core.outbox import OutboxHandlers, handler_deadline, outbox_handlers
+from app.core.webhooks import WebhookDispatcher
+from app.models.outbox import OutboxEvent
+from app.models.webhook import WebhookDelivery
+from app.services.webhook_service import WebhookOutboxHandler
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class OutboxWorker:
+    """
+    Rows are claimed with ``FOR UPDATE SKIP LOCKED`` and leased for
+    ``lease_seconds`` in a short transaction of their own, so any number of
+    workers can run side by side and a crashed worker's rows become claimable
+    again once the lease runs out. Failed events are retried with jittered
+    exponential backoff and marked ``dead`` after ``max_attempts``.
+
+    Handlers are cancelled after ``handler_timeout`` seconds, which stays below
+    the lease, and each event's outcome is written on its own as soon as it is
+    known, guarded by the lease: if another worker has re-claimed the row in
+    the meantime (``locked_until`` changed), the stale outcome is dropped.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker,
+        handlers: OutboxHandlers = outbox_handlers,
+        batch_size: int = settings.OUTBOX_BATCH_SIZE,
+        lease_seconds: int = settings.OUTBOX_LEASE_SECONDS,
+        max_attempts: int = settings.OUTBOX_MAX_ATTEMPTS,
+        handler_timeout: float = settings.OUTBOX_HANDLER_TIMEOUT_SECONDS,
+    ):
+        if handler_timeout >= lease_seconds:
+            raise ValueError("handler_timeout must be shorter than the lease")
+        self.session_factory = session_factory
+        self.handlers = handlers
+        self.batch_size = batch_size
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.handler_timeout = handler_timeout
+        # Outcomes are written one at a time, so settling a batch holds one
+        # pooled connection rather than one per event.
+        self._settle_lock = asyncio.Lock()
+        self._stopping = asyncio.Event()
+
+    async def claim(self, db: AsyncSession) -> List[OutboxEvent]:
+        now = _utcnow()
+        claimable = (
+            select(OutboxEvent.id)
+            .where(
+                OutboxEvent.status == "pending",
+                OutboxEvent.available_at <= now,
+                (OutboxEvent.locked_until == None) | (OutboxEvent.locked_until <= now),
+            )
+            .order_by(OutboxEvent.available_at, OutboxEvent.id)
+            .limit(self.batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        ids = (await db.execute(claimable)).scalars().all()
+        if not ids:
+            await db.rollback()
+            return []
+        result = await db.execute(
+            update(OutboxEvent)
+            .where(OutboxEvent.id.in_(ids))
+            .values(locked_until=now + timedelta(seconds=self.lease_seconds), attempts=OutboxEvent.attempts + 1)
+            .returning(OutboxEvent)
+            .execution_options(synchronize_session=False)
+        )
+        events = sorted(result.scalars().all(), key=lambda e: (e.available_at, e.id))
+        await db.commit()
+        return events
+
+    async def run_once(self) -> int:
+        """Claim and deliver one batch. Returns the number of events claimed."""
+        async with self.session_factory() as db:
+            events = await self.claim(db)
+        if events:
+            deadline = asyncio.get_running_loop().time() + self.handler_timeout
+            # Events in a batch are handled concurrently, so slow handlers
+            # (webhooks) overlap instead of queueing behind one another.
+            await asyncio.gather(*(self._deliver(event, deadline) for event in events))
+        return len(events)
+
+    async def _deliver(self, event: OutboxEvent, deadline: float) -> None:
+        lease = event.locked_until
+        # Each event runs in its own gathered task, so this stays per event.
+        handler_deadline.set(deadline)
+        try:
+            async with asyncio.timeout_at(deadline):
+                for handler in self.handlers.for_event(event.event_type):
+                    await handler(event)
+        except Exception as exc:
+            if isinstance(exc, TimeoutError):
+                exc = TimeoutError(f"handlers did not finish within {self.handler_timeout:g}s")
+            error = f"{type(exc).__name__}: {exc}"[:2000]
+            if event.attempts >= self.max_attempts:
+                values = {"status": "dead"}
+                logger.error("outbox_event_dead", event_id=event.id, event_type=event.event_type, error=error)
+            else:
+                values = {"available_at": _utcnow() + timedelta(seconds=self.backoff(event.attempts))}
+                logger.warning("outbox_event_retry", event_id=event.id, attempt=event.attempts, error=error)
+            values["last_error"] = error
+        else:
+            values = {"status": "done", "processed_at": _utcnow()}
+        await self._settle(event, lease, {**values, "locked_until": None})
+
+    async def _settle(self, event: OutboxEvent, lease: datetime, values: dict) -> None:
+        async with self._settle_lock, self.session_factory() as db:
+            result = await db.execute(
+                update(OutboxEvent)
+                .where(OutboxEvent.id == event.id, OutboxEvent.locked_until == lease)
+                .values(**values)
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+        if result.rowcount == 0:
+            logger.warning("outbox_lease_lost", event_id=event.id, event_type=event.event_type)
+
+    @staticmethod
+    def backoff(attempts: int) -> float:
+        # Jitter spreads out retries of events that failed in the same outage.
+        ceiling = min(settings.OUTBOX_RETRY_BASE_SECONDS * 2 ** (attempts - 1), settings.OUTBOX_RETRY_MAX_SECONDS)
+        return random.uniform(ceiling / 2, ceiling)
+
+    async def purge(self, older_than: timedelta) -> int:
+        purgeable = select(OutboxEvent.id).where(
+            OutboxEvent.status == "done", OutboxEvent.processed_at < _utcnow() - older_than
+        )
+        async with self.session_factory() as db:
+            await db.execute(delete(WebhookDelivery).where(WebhookDelivery.event_id.in_(purgeable)))
+            result = await db.execute(delete(OutboxEvent).where(OutboxEvent.id.in_(purgeable)))
+            await db.commit()
+            return result.rowcount
+
+    async def run_forever(self, poll_interval: float = settings.OUTBOX_POLL_INTERVAL) -> None:
+        retention = timedelta(hours=settings.OUTBOX_RETENTION_HOURS)
+        last_purge = 0.0
+        while not self._stopping.is_set():
+            try:
+                claimed = await self.run_once()
+                if time.monotonic() - last_purge > 60:
+                    await self.purge(retention)
+                    last_purge = time.monotonic()
+            except Exception as exc:
+                logger.error("outbox_worker_error", error=str(exc))
+                claimed = 0
+            # A full batch means more is probably waiting; otherwise sleep.
+            if claimed < self.batch_size:
+                try:
+                    await asyncio.wait_for(self._stopping.wait(), poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+
+    def stop(self) -> None:
+        self._stopping.set()
+
+
+@outbox_handlers.register("*")
+async def log_event(event: OutboxEvent) -> None:
+    logger.info("outbox_event", event_id=event.id, event_type=event.event_type, aggregate_id=event.aggregate_id)
+
+
+async def main(once: bool = False) -> None:
+    from app.db.session import AsyncSessionLocal
+
+    dispatcher = WebhookDispatcher()
+    outbox_handlers.register("*")(WebhookOutboxHandler(AsyncSessionLocal, dispatcher))
+    worker = OutboxWorker(AsyncSessionLocal)
+    try:
+        if once:
+            await worker.run_once()
+            return
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, worker.stop)
+        await worker.run_forever()
+    finally:
+        await dispatcher.aclose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Deliver pending outbox events")
+    parser.add_argument("--once", action="store_true", help="deliver one batch and exit")
+    args = parser.parse_args()
+    setup_logging()
+    asyncio.run(main(once=args.once))
@@ -0,0 +1,76 @@
+"""Minimal timing helpers shared by the benchmark scripts."""
+
+import os
+import platform
+import statistics
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+
+def autorange(fn: Callable[[], Any], min_round_s: float = 0.2) -> int:
+    """Smallest power-of-ten call count whose round takes at least ``min_round_s`` of CPU."""
+    number = 1
+    while True:
+        start = time.process_time()
+        for _ in range(number):
+            fn()
+        if time.process_time() - start >= min_round_s or number >= 10**6:
+            return number
+        number *= 10
+
+
+def measure(fn: Callable[[], Any], number: Optional[int] = 200, repeat: int = 5, warmup: int = 1) -> Dict[str, float]:
+    """
+    Run ``fn`` ``number`` times per round for ``repeat`` rounds and report the
+    CPU time per call in microseconds. CPU time (process_time) is used rather
+    than wall time so that scheduler noise does not dominate small payloads.
+    ``number=None`` picks the count with ``autorange``. The median is the
+    figure to compare; ``stdev_us`` across rounds shows how noisy it was.
+    """
+    for _ in range(warmup):
+        fn()  # warm caches and lazily-built serializers
+    if number is None:
+        number = autorange(fn)
+    rounds: List[float] = []
+    for _ in range(repeat):
+        start = time.process_time()
+        for _ in range(number):
+            fn()
+        rounds.append((time.process_time() - start) / number * 1e6)
+    return {
+        "median_us": statistics.median(rounds),
+        "min_us": min(rounds),
+        "max_us": max(rounds),
+        "stdev_us": statistics.stdev(rounds) if len(rounds) > 1 else 0.0,
+        "number": number,
+        "repeat": repeat,
+    }
+
+
+def pin_cpu(cpu: int) -> bool:
+    """Pin this process to one CPU (Linux only); returns whether it worked."""
+    if not hasattr(os, "sched_setaffinity"):
+        return False
+    os.sched_setaffinity(0, {cpu})
+    return True
+
+
+def environment() -> Dict[str, Any]:
+    """What a result depends on besides the code, recorded with --json output."""
+    affinity = sorted(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else None
+    return {
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "cpu_affinity": affinity,
+    }
+
+
+def print_table(title: str, results: Dict[str, Dict[str, float]]) -> None:
+    print(title)
+    width = max(len(name) for name in results)
+    for name, stats in results.items():
+        print(f"  {name:<{width}}  median {stats['median_us']:9.1f} us   min {stats['min_us']:9.1f} us")
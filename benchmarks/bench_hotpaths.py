@@ -0,0 +1,117 @@
+"""
+CPU cost per call of the request hot paths: token signing and validation,
+password verification, comment sanitizing, request-body validation and
+response serialization.
+
+Each case is warmed up, then timed for ``--repeat`` rounds of a call count
+picked so a round takes at least 0.2 s of CPU. The median is the figure to
+compare. Results are only comparable on the same machine; for numbers
+stable to a few percent:
+
+- pin the process to one core with ``--cpu N`` (or ``taskset -c N``), ideally
+  a core isolated from the scheduler (``isolcpus``);
+- disable turbo boost and fix the frequency governor (``cpupower frequency-set
+  -g performance``, or ``python -m pyperf system tune``);
+- keep the machine otherwise idle, and compare the ``stdev_us`` of both runs.
+
+Run it before and after a performance change and put both in the PR:
+
+    python -m benchmarks.bench_hotpaths [--cpu 2] [--only auth] [--json] [--output before.json]
+"""
+
+import os
+
+# Signing keys and the Redis used by decode_and_validate are resolved when
+# app modules are imported.
+os.environ.setdefault("ALLOW_INSECURE_TEST_KEYS", "1")
+os.environ.setdefault("ALLOW_INMEMORY_RATE_LIMIT", "1")
+
+import argparse  # noqa: E402
+import asyncio  # noqa: E402
+import json  # noqa: E402
+from datetime import timedelta  # noqa: E402
+from typing import List  # noqa: E402
+
+import bleach  # noqa: E402
+from pydantic import TypeAdapter  # noqa: E402
+
+from app.core import token_service  # noqa: E402
+from app.core.sanitizer import sanitize  # noqa: E402
+from app.core.security import create_access_token, get_password_hash, verify_password  # noqa: E402
+from app.schemas.issue import IssueCreate, IssueResponse  # noqa: E402
+from app.schemas.user import UserCreate  # noqa: E402
+from benchmarks._harness import environment, measure, pin_cpu, print_table  # noqa: E402
+from benchmarks.bench_serialization import default_path, fast_path, make_rows  # noqa: E402
+
+COMMENT = "Fixed in <b>v2.3</b>, see <a href=\"https://example.com\">the PR</a>. Reproduced on staging first."
+ISSUE_BODY = {
+    "title": "Login page returns 500",
+    "description": "Steps to reproduce: open the login page and submit. " * 4,
+    "severity": "high",
+    "project_id": 3,
+    "assignee_id": 7,
+}
+USER_BODY = {"username": "johndoe", "email": "john.doe@example.com", "full_name": "John Doe", "password": "strongpassword"}
+
+
+def cases():
+    """name -> zero-argument callable, grouped by prefix."""
+    loop = asyncio.new_event_loop()
+    access_token = loop.run_until_complete(token_service.generate_token_pair(1))["access_token"]
+    hashed = get_password_hash("strongpassword")
+    issues, _ = make_rows(100)["issues"]
+    adapter = TypeAdapter(List[IssueResponse])
+
+    return {
+        "auth/create_access_token": lambda: create_access_token(1),
+        "auth/encode_token": lambda: token_service._encode_token(
+            {"sub": "1", "type": "access", "jti": "bench", "ver": 0}, timedelta(minutes=15)
+        ),
+        # Includes one event-loop round trip and two in-memory Redis lookups.
+        "auth/decode_and_validate": lambda: loop.run_until_complete(
+            token_service.decode_and_validate(access_token, "access")
+        ),
+        "auth/verify_password": lambda: verify_password("strongpassword", hashed),
+        "sanitize/bleach_clean": lambda: bleach.clean(COMMENT, strip=True),
+        "sanitize/sanitizer": lambda: sanitize(COMMENT),
+        "validate/IssueCreate": lambda: IssueCreate.model_validate(ISSUE_BODY),
+        "validate/UserCreate": lambda: UserCreate.model_validate(USER_BODY),
+        "serialize/IssueResponse_100/default": lambda: default_path(adapter, issues),
+        "serialize/IssueResponse_100/fast": lambda: fast_path(IssueResponse, issues),
+    }
+
+
+def run(only: List[str], repeat: int):
+    return {
+        name: measure(fn, number=None, repeat=repeat, warmup=3)
+        for name, fn in cases().items()
+        if not only or name.split("/")[0] in only
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--only", default="", type=lambda v: [g for g in v.split(",") if g],
+                        help="comma-separated groups: auth,sanitize,validate,serialize")
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--cpu", type=int, help="pin to this CPU before measuring (Linux)")
+    parser.add_argument("--output", help="write machine-readable results to this file")
+    parser.add_argument("--json", action="store_true", help="emit machine-readable results")
+    args = parser.parse_args()
+
+    if args.cpu is not None and not pin_cpu(args.cpu):
+        parser.error("--cpu needs os.sched_setaffinity (Linux)")
+
+    results = run(args.only, args.repeat)
+    report = {"environment": environment(), "results": results}
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+    print_table("CPU per call", results)
+
+
+if __name__ == "__main__":
+    main()
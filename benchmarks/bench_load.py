@@ -0,0 +1,443 @@
+"""
+HTTP load test of the main user flows: throughput, latency percentiles and
+SQL queries per request, with optional regression gating against a baseline.
+
+By default the app runs in-process behind ``httpx.ASGITransport`` on a freshly
+seeded SQLite file (or the Postgres given by ``--database-url``, which must
+have no tables unless ``--reset`` is passed to drop them), with rate
+limits lifted and an in-memory Redis stand-in. ``--base-url`` targets a
+running server instead: it registers its own users there and works on the
+projects and issues that already exist, so that server's rate limits apply.
+Queries per request are read from the Server-Timing header.
+
+    python -m benchmarks.bench_load [--concurrency 20] [--duration 10] [--json]
+    python -m benchmarks.bench_load --output load.json --save-baseline benchmarks/baselines/load.json
+    python -m benchmarks.bench_load --baseline benchmarks/baselines/load.json [--tolerance 0.2]
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import re
+import statistics
+import sys
+import time
+from typing import Any, Awaitable, Callable, Dict, List
+
+import httpx
+
+API = "/api/v1"
+DEFAULT_DATABASE_URL = "sqlite+aiosqlite:///./bench_load.db"
+PASSWORD = "bench-password"
+SEARCH_TERMS = ("login", "crash", "timeout", "export", "payment", "upload")
+SCENARIOS = (
+    "login", "refresh", "list_issues", "search_issues", "issue_detail", "create_issue", "transition", "create_comment",
+)
+# Walks the state machine without closing, so an issue can be transitioned forever.
+NEXT_STATUS = {"open": "in_progress", "in_progress": "resolved", "resolved": "reopened", "reopened": "in_progress"}
+
+_QUERIES = re.compile(r'db;[^,]*desc="(\d+) queries"')
+
+
+# -------------------------------------------------------------------
+# Setup
+# -------------------------------------------------------------------
+def prepare_in_process_env(database_url: str) -> None:
+    # Settings, the engine and the rate limiters are built at import time, so
+    # this has to run before anything under ``app`` is imported.
+    os.environ["SQLALCHEMY_DATABASE_URI"] = database_url
+    for name, value in (
+        ("ALLOW_INSECURE_TEST_KEYS", "1"),
+        ("ALLOW_INMEMORY_RATE_LIMIT", "1"),
+        ("GLOBAL_RATE_LIMIT_PER_MINUTE", "1000000000"),
+        ("LOGIN_RATE_LIMIT_PER_MINUTE", "1000000000"),
+        ("REFRESH_RATE_LIMIT_PER_MINUTE", "1000000000"),
+        ("ADMISSION_CONTROL_ENABLED", "false"),
+        ("ACCESS_LOG_ENABLED", "false"),
+    ):
+        os.environ.setdefault(name, value)
+
+
+async def seed_database(users: int, projects: int, issues: int, comments: int, seed: int, reset: bool) -> List[str]:
+    """
+    Create the schema and bulk-insert a dataset; returns the users' emails.
+    An existing schema is only dropped with ``reset``, so pointing
+    ``--database-url`` at a real database by mistake cannot wipe it.
+    """
+    from sqlalchemy import inspect, insert
+
+    from app.core.security import get_password_hash
+    from app.db import base  # noqa: F401
+    from app.db.base_class import Base
+    from app.db.session import AsyncSessionLocal, engine
+    from app.models.comment import Comment
+    from app.models.issue import Issue, IssueStatus
+    from app.models.project import Project
+    from app.models.user import User, UserRole
+
+    rng = random.Random(seed)
+    async with engine.begin() as conn:
+        existing = await conn.run_sync(lambda sync_conn: inspect(sync_conn).get_table_names())
+        if existing and not reset:
+            raise SystemExit(
+                f"{engine.url.render_as_string(hide_password=True)} already has tables ({', '.join(sorted(existing)[:5])}); "
+                "pass --reset to drop and recreate the schema"
+            )
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+    hashed = get_password_hash(PASSWORD)
+    emails = [f"bench{i}@example.com" for i in range(users)]
+    statuses = list(IssueStatus)
+    async with AsyncSessionLocal() as session:
+        await session.execute(insert(User), [
+            {"username": f"bench{i}", "email": email, "hashed_password": hashed, "role": UserRole.USER}
+            for i, email in enumerate(emails)
+        ])
+        await session.execute(insert(Project), [
+            {"name": f"Project {i}", "key": f"BENCH{i}", "description": "Load test project", "owner_id": 1 + i % users}
+            for i in range(projects)
+        ])
+        await session.execute(insert(Issue), [
+            {
+                "title": f"{rng.choice(SEARCH_TERMS)} fails on step {i}",
+                "description": "Steps to reproduce: open the page and submit the form. " * 3,
+                "status": rng.choice(statuses),
+                "severity": rng.choice(("low", "medium", "high", "critical")),
+                "project_id": 1 + rng.randrange(projects),
+                "reporter_id": 1 + rng.randrange(users),
+                "assignee_id": 1 + rng.randrange(users) if rng.random() < 0.6 else None,
+            }
+            for i in range(issues)
+        ])
+        if comments:
+            await session.execute(insert(Comment), [
+                {"content": "Reproduced on staging.", "issue_id": 1 + rng.randrange(issues), "author_id": 1 + rng.randrange(users)}
+                for _ in range(comments)
+            ])
+        await session.commit()
+    return emails
+
+
+async def register_users(client: httpx.AsyncClient, count: int) -> List[str]:
+    """Live mode: create fresh accounts on the target server."""
+    run_id = f"{int(time.time())}{random.randrange(1000):03d}"
+    emails = []
+    for i in range(count):
+        email = f"bench{run_id}x{i}@example.com"
+        r = await client.post(f"{API}/auth/register", json={"email": email, "username": f"b{run_id}x{i}", "password": PASSWORD})
+        r.raise_for_status()
+        emails.append(email)
+    return emails
+
+
+class Workload:
+    """Ids the scenarios pick from, discovered through the API."""
+
+    def __init__(self, project_ids: List[int], issue_ids: List[int]):
+        self.project_ids = project_ids
+        self.issue_ids = issue_ids
+
+    @classmethod
+    async def discover(cls, vu: "VirtualUser") -> "Workload":
+        r = await vu.get(f"{API}/projects/", params={"limit": 100})
+        r.raise_for_status()
+        project_ids = [project["id"] for project in r.json()]
+        issue_ids: List[int] = []
+        for page in range(1, 11):
+            r = await vu.get(f"{API}/issues/", params={"limit": 100, "page": page, "fields": "id"})
+            r.raise_for_status()
+            issue_ids.extend(issue["id"] for issue in r.json())
+            if len(r.json()) < 100:
+                break
+        if not project_ids or not issue_ids:
+            raise SystemExit("No projects or issues to work on; seed the database first.")
+        return cls(project_ids, issue_ids)
+
+
+class VirtualUser:
+    def __init__(self, client: httpx.AsyncClient, email: str, rng: random.Random):
+        self.client = client
+        self.email = email
+        self.rng = rng
+        self.access_token = ""
+        self.refresh_token = ""
+        # Issues this user reported, with their current status.
+        self.own_issues: Dict[int, str] = {}
+
+    def get(self, url: str, **kwargs) -> Awaitable[httpx.Response]:
+        return self.client.get(url, headers={"Authorization": f"Bearer {self.access_token}"}, **kwargs)
+
+    def send(self, method: str, url: str, **kwargs) -> Awaitable[httpx.Response]:
+        return self.client.request(method, url, headers={"Authorization": f"Bearer {self.access_token}"}, **kwargs)
+
+    async def login(self) -> httpx.Response:
+        r = await self.client.post(f"{API}/auth/login", data={"username": self.email, "password": PASSWORD})
+        if r.status_code == 200:
+            self.store_tokens(r.json())
+        return r
+
+    def store_tokens(self, tokens: Dict[str, str]) -> None:
+        self.access_token = tokens["access_token"]
+        self.refresh_token = tokens["refresh_token"]
+
+
+# -------------------------------------------------------------------
+# Scenarios
+# -------------------------------------------------------------------
+async def login(vu: VirtualUser, work: Workload) -> httpx.Response:
+    return await vu.login()
+
+
+async def refresh(vu: VirtualUser, work: Workload) -> httpx.Response:
+    r = await vu.client.post(f"{API}/auth/refresh", json={"refresh_token": vu.refresh_token})
+    if r.status_code == 200:
+        vu.store_tokens(r.json())
+    return r
+
+
+async def list_issues(vu: VirtualUser, work: Workload) -> httpx.Response:
+    params = {"project_id": vu.rng.choice(work.project_ids), "sort": "-created_at", "limit": 20}
+    if vu.rng.random() < 0.5:
+        params["status"] = vu.rng.choice(("open", "in_progress", "resolved"))
+    return await vu.get(f"{API}/issues/", params=params)
+
+
+async def search_issues(vu: VirtualUser, work: Workload) -> httpx.Response:
+    return await vu.get(f"{API}/issues/", params={"search": vu.rng.choice(SEARCH_TERMS), "limit": 20})
+
+
+async def issue_detail(vu: VirtualUser, work: Workload) -> httpx.Response:
+    return await vu.get(f"{API}/issues/{vu.rng.choice(work.issue_ids)}")
+
+
+async def create_issue(vu: VirtualUser, work: Workload) -> httpx.Response:
+    r = await vu.send("POST", f"{API}/issues/", json={
+        "title": f"{vu.rng.choice(SEARCH_TERMS)} regression",
+        "description": "Found during load testing.",
+        "severity": vu.rng.choice(("low", "medium", "high")),
+        "project_id": vu.rng.choice(work.project_ids),
+    })
+    if r.status_code == 200:
+        vu.own_issues[r.json()["id"]] = r.json()["status"]
+    return r
+
+
+async def transition(vu: VirtualUser, work: Workload) -> httpx.Response:
+    issue_id = vu.rng.choice(list(vu.own_issues))
+    target = NEXT_STATUS[vu.own_issues[issue_id]]
+    r = await vu.send("PUT", f"{API}/issues/{issue_id}", json={"status": target})
+    if r.status_code == 200:
+        vu.own_issues[issue_id] = target
+    return r
+
+
+async def create_comment(vu: VirtualUser, work: Workload) -> httpx.Response:
+    return await vu.send("POST", f"{API}/comments/", json={
+        "issue_id": vu.rng.choice(work.issue_ids),
+        "content": "Seeing this too, <b>steps</b> attached.",
+    })
+
+
+SCENARIO_FNS: Dict[str, Callable[[VirtualUser, Workload], Awaitable[httpx.Response]]] = {
+    "login": login,
+    "refresh": refresh,
+    "list_issues": list_issues,
+    "search_issues": search_issues,
+    "issue_detail": issue_detail,
+    "create_issue": create_issue,
+    "transition": transition,
+    "create_comment": create_comment,
+}
+
+
+# -------------------------------------------------------------------
+# Runner
+# -------------------------------------------------------------------
+def _percentile_ms(cuts: List[float], p: int) -> float:
+    return round(cuts[p - 1], 3)
+
+
+def summarize(latencies: List[float], queries: List[int], errors: int, elapsed: float) -> Dict[str, Any]:
+    ms = [latency * 1000 for latency in latencies]
+    cuts = statistics.quantiles(ms, n=100, method="inclusive") if len(ms) > 1 else ms * 99
+    return {
+        "requests": len(ms),
+        "errors": errors,
+        "throughput_rps": round(len(ms) / elapsed, 2),
+        "p50_ms": _percentile_ms(cuts, 50),
+        "p95_ms": _percentile_ms(cuts, 95),
+        "p99_ms": _percentile_ms(cuts, 99),
+        "queries_per_request": round(statistics.fmean(queries), 2) if queries else None,
+    }
+
+
+async def run_scenario(name: str, vus: List[VirtualUser], work: Workload, duration: float) -> Dict[str, Any]:
+    fn = SCENARIO_FNS[name]
+    latencies: List[float] = []
+    queries: List[int] = []
+    errors = 0
+    deadline = time.perf_counter() + duration
+
+    async def loop(vu: VirtualUser) -> None:
+        nonlocal errors
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            r = await fn(vu, work)
+            latencies.append(time.perf_counter() - started)
+            if r.status_code >= 400:
+                errors += 1
+            match = _QUERIES.search(r.headers.get("server-timing", ""))
+            if match:
+                queries.append(int(match.group(1)))
+
+    started = time.perf_counter()
+    await asyncio.gather(*(loop(vu) for vu in vus))
+    return summarize(latencies, queries, errors, time.perf_counter() - started)
+
+
+async def run(args) -> Dict[str, Any]:
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    if args.base_url:
+        client = httpx.AsyncClient(
+            base_url=args.base_url, timeout=30.0, limits=httpx.Limits(max_connections=args.concurrency),
+        )
+        emails = await register_users(client, args.concurrency)
+    else:
+        from app.main import app
+
+        # App and httpx logs would interleave with (and, with --json, corrupt) the report.
+        logging.getLogger().setLevel(logging.ERROR)
+        # The default scratch file belongs to this script and is always recreated.
+        reset = args.reset or args.database_url == DEFAULT_DATABASE_URL
+        emails = await seed_database(args.users, args.projects, args.issues, args.comments, args.seed, reset)
+        client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test", timeout=30.0)
+
+    try:
+        vus = [VirtualUser(client, emails[i % len(emails)], random.Random(args.seed + i)) for i in range(args.concurrency)]
+        for vu in vus:
+            (await vu.login()).raise_for_status()
+        work = await Workload.discover(vus[0])
+        for vu in vus:
+            (await create_issue(vu, work)).raise_for_status()
+
+        scenarios = {}
+        for name in args.scenarios:
+            if args.warmup:
+                await run_scenario(name, vus, work, args.warmup)
+            scenarios[name] = await run_scenario(name, vus, work, args.duration)
+    finally:
+        await client.aclose()
+
+    return {
+        "config": {
+            "target": args.base_url or args.database_url,
+            "concurrency": args.concurrency,
+            "duration_s": args.duration,
+            "issues": None if args.base_url else args.issues,
+            "seed": args.seed,
+        },
+        "scenarios": scenarios,
+    }
+
+
+# -------------------------------------------------------------------
+# Baseline gating
+# -------------------------------------------------------------------
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """
+    Regressions against ``baseline``: throughput down or p95/p99 up by more
+    than ``tolerance`` (a fraction), more queries per request, or a higher
+    error rate. Query counts do not depend on the machine, so they get no
+    tolerance beyond rounding.
+    """
+    failures = []
+    for name, base in baseline["scenarios"].items():
+        current = results["scenarios"].get(name)
+        if current is None:
+            continue
+        if current["throughput_rps"] < base["throughput_rps"] * (1 - tolerance):
+            failures.append(f"{name}: throughput {current['throughput_rps']} rps < baseline {base['throughput_rps']} rps")
+        for key in ("p95_ms", "p99_ms"):
+            if current[key] > base[key] * (1 + tolerance):
+                failures.append(f"{name}: {key} {current[key]} > baseline {base[key]}")
+        if base["queries_per_request"] is not None and current["queries_per_request"] is not None:
+            if current["queries_per_request"] > base["queries_per_request"] + 0.05:
+                failures.append(
+                    f"{name}: {current['queries_per_request']} queries/request > baseline {base['queries_per_request']}"
+                )
+        base_rate = base["errors"] / max(base["requests"], 1)
+        rate = current["errors"] / max(current["requests"], 1)
+        if rate > base_rate + 0.01:
+            failures.append(f"{name}: error rate {rate:.2%} > baseline {base_rate:.2%}")
+    return failures
+
+
+def print_results(results: Dict[str, Any]) -> None:
+    config = results["config"]
+    print(f"{config['target']}  concurrency {config['concurrency']}  {config['duration_s']}s per scenario")
+    for name, stats in results["scenarios"].items():
+        queries = "-" if stats["queries_per_request"] is None else f"{stats['queries_per_request']:.1f}"
+        print(
+            f"  {name:<15} {stats['throughput_rps']:8.1f} req/s   p50 {stats['p50_ms']:7.1f} ms"
+            f"   p95 {stats['p95_ms']:7.1f} ms   p99 {stats['p99_ms']:7.1f} ms"
+            f"   {queries:>5} queries/req   {stats['errors']} errors"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--base-url", help="target a running server instead of the in-process app")
+    parser.add_argument("--database-url", default=DEFAULT_DATABASE_URL, help="in-process only")
+    parser.add_argument("--reset", action="store_true",
+                        help="drop and recreate the schema of --database-url (the default scratch file is always reset)")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS), type=lambda v: v.split(","))
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds per scenario")
+    parser.add_argument("--warmup", type=float, default=1.0, help="unrecorded seconds before each scenario")
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--projects", type=int, default=20)
+    parser.add_argument("--issues", type=int, default=5000)
+    parser.add_argument("--comments", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument("--baseline", help="fail (exit 1) on regressions against this results file")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed relative throughput/latency drift")
+    parser.add_argument("--save-baseline", help="write results to this file as the new baseline")
+    parser.add_argument("--json", action="store_true", help="emit machine-readable results")
+    args = parser.parse_args()
+
+    unknown = set(args.scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+    if not args.base_url:
+        prepare_in_process_env(args.database_url)
+
+    results = asyncio.run(run(args))
+    for path in filter(None, (args.output, args.save_baseline)):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print_results(results)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if baseline["config"] != results["config"]:
+            print(f"warning: baseline was recorded with {baseline['config']}", file=sys.stderr)
+        failures = compare(results, baseline, args.tolerance)
+        for failure in failures:
+            print(f"REGRESSION {failure}", file=sys.stderr)
+        if failures:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
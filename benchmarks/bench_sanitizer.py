@@ -0,0 +1,61 @@
+"""
+CPU cost of sanitizing comment bodies, ``bleach.clean`` per call vs
+``app.core.sanitizer.sanitize`` (reused Cleaner, markup-free fast path).
+
+Bodies cover the typical case (a sentence or two of plain text), a short
+comment with inline markup, and the worst case the schema allows: a 2000-char
+pasted log full of ``<``, ``>`` and ``&``.
+
+    python -m benchmarks.bench_sanitizer [--json]
+"""
+
+import argparse
+import json
+
+import bleach
+
+from app.core.sanitizer import sanitize
+from benchmarks._harness import measure, print_table
+
+LOG_LINE = "2026-01-01 12:00:00 ERROR <module> failed: a < b && c > d\n"
+
+BODIES = {
+    "plain-short": "Reproduced on staging, happens after the session expires.",
+    "plain-2000": ("Reproduced on staging after the session expires. " * 41)[:2000],
+    "markup-short": "Fixed in <b>v2.3</b>, see <a href=\"https://example.com\">the PR</a>.",
+    "log-2000": (LOG_LINE * 40)[:2000],
+}
+
+
+def run(number: int, repeat: int):
+    results = {}
+    for name, body in BODIES.items():
+        assert sanitize(body) == bleach.clean(body, strip=True)
+        before = measure(lambda: bleach.clean(body, strip=True), number, repeat)
+        after = measure(lambda: sanitize(body), number, repeat)
+        results[f"{name}/bleach"] = before
+        results[f"{name}/sanitizer"] = after
+        results[f"{name}/speedup"] = {"x": before["median_us"] / after["median_us"]}
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--number", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--json", action="store_true", help="emit machine-readable results")
+    args = parser.parse_args()
+
+    results = run(args.number, args.repeat)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    timings = {k: v for k, v in results.items() if not k.endswith("/speedup")}
+    print_table("CPU per comment body", timings)
+    for key, value in results.items():
+        if key.endswith("/speedup"):
+            print(f"  {key:<22}  {value['x']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+CPU cost of serializing a 100-row list page, default path vs fast path.
+
+The default path mirrors what FastAPI does for ``response_model=List[X]``:
+validate every ORM row against the response model (from_attributes), dump it
+to JSON-compatible python and encode with the stdlib ``json`` module. The fast
+path is ``app.core.serialization.fast_json_response``.
+
+    python -m benchmarks.bench_serialization [--rows 100] [--json]
+"""
+
+import argparse
+import json
+from datetime import datetime, timedelta, timezone
+from typing import List
+
+from pydantic import TypeAdapter
+
+from app.core.serialization import fast_json_response
+from app.models.comment import Comment
+from app.models.issue import Issue, IssueStatus
+from app.models.project import Project
+from app.schemas.comment import CommentResponse
+from app.schemas.issue import IssueResponse
+from app.schemas.project import ProjectResponse
+from benchmarks._harness import measure, print_table
+
+
+def _timestamps(i: int):
+    created = datetime(2026, 1, 1, tzinfo=timezone.utc) + timedelta(minutes=i)
+    return {"created_at": created, "updated_at": created + timedelta(hours=1)}
+
+
+def make_rows(n: int):
+    statuses = list(IssueStatus)
+    severities = ["low", "medium", "high", "critical"]
+    issues = [
+        Issue(
+            id=i + 1,
+            title=f"Issue {i}: login page returns 500",
+            description="Steps to reproduce: open the login page and submit. " * 4,
+            status=statuses[i % len(statuses)],
+            severity=severities[i % len(severities)],
+            project_id=1 + i % 7,
+            reporter_id=1 + i % 13,
+            assignee_id=None if i % 3 else 1 + i % 5,
+            **_timestamps(i),
+        )
+        for i in range(n)
+    ]
+    projects = [
+        Project(
+            id=i + 1,
+            name=f"Project {i}",
+            key=f"PRJ{i}",
+            description="Backend services and API gateway",
+            is_archived=False,
+            owner_id=1 + i % 11,
+            **_timestamps(i),
+        )
+        for i in range(n)
+    ]
+    comments = [
+        Comment(
+            id=i + 1,
+            content=("Reproduced on staging, stack trace attached below. " * 3).strip(),
+            issue_id=1 + i % 17,
+            author_id=1 + i % 13,
+            **_timestamps(i),
+        )
+        for i in range(n)
+    ]
+    return {"issues": (issues, IssueResponse), "projects": (projects, ProjectResponse), "comments": (comments, CommentResponse)}
+
+
+def default_path(adapter: TypeAdapter, rows: List) -> bytes:
+    validated = adapter.validate_python(rows, from_attributes=True)
+    content = adapter.dump_python(validated, mode="json")
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+
+def fast_path(schema, rows: List) -> bytes:
+    return fast_json_response(rows, schema).body
+
+
+def run(rows: int, number: int, repeat: int):
+    results = {}
+    for name, (objs, schema) in make_rows(rows).items():
+        adapter = TypeAdapter(List[schema])
+        assert json.loads(default_path(adapter, objs)) == json.loads(fast_path(schema, objs))
+        before = measure(lambda: default_path(adapter, objs), number, repeat)
+        after = measure(lambda: fast_path(schema, objs), number, repeat)
+        results[f"{name}/default"] = before
+        results[f"{name}/fast"] = after
+        results[f"{name}/speedup"] = {"x": before["median_us"] / after["median_us"]}
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--number", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--json", action="store_true", help="emit machine-readable results")
+    args = parser.parse_args()
+
+    results = run(args.rows, args.number, args.repeat)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    timings = {k: v for k, v in results.items() if not k.endswith("/speedup")}
+    print_table(f"CPU per {args.rows}-row page", timings)
+    for key, value in results.items():
+        if key.endswith("/speedup"):
+            print(f"  {key:<18}  {value['x']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Webhook deliveries per second against a local stand-in receiver.
+
+Compares a fresh httpx client per delivery (new TCP connection every time),
+the dispatcher with batching off (pooled keep-alive client only), and
+``app.core.webhooks.WebhookDispatcher`` as shipped (pooled client plus
+batching while the endpoint is busy). The slow
+scenario adds a per-request delay on the receiver to show batching.
+
+    python -m benchmarks.bench_webhooks [--events 2000] [--delay-ms 20] [--json]
+"""
+
+import argparse
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+
+from app.core.config import settings
+from app.core.webhooks import WebhookDispatcher, sign
+
+SECRET = "benchmark-secret-key"
+# The stand-in receiver is on loopback, which deliveries refuse by default.
+settings.WEBHOOK_ALLOWED_HOSTS = ["127.0.0.1"]
+
+
+def start_receiver(delay: float):
+    stats = {"requests": 0}
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            self.rfile.read(int(self.headers["Content-Length"]))
+            if delay:
+                time.sleep(delay)
+            stats["requests"] += 1
+            self.send_response(204)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_port}/hook", stats
+
+
+def _event(n: int):
+    return {"id": n, "type": "issue.updated", "project_id": 1, "data": {"id": n, "status": "in_progress"}}
+
+
+async def unpooled(url: str, events: int, concurrency: int) -> None:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def send(n: int):
+        body = json.dumps({"events": [_event(n)]}).encode()
+        timestamp = str(int(time.time()))
+        async with semaphore:
+            async with httpx.AsyncClient() as client:
+                await client.post(url, content=body, headers={"X-Webhook-Signature": sign(SECRET, timestamp, body)})
+
+    await asyncio.gather(*(send(n) for n in range(events)))
+
+
+async def pooled(url: str, events: int, concurrency: int, max_batch: int = 50) -> None:
+    dispatcher = WebhookDispatcher(max_concurrency=concurrency, max_batch=max_batch)
+    try:
+        await asyncio.gather(*(dispatcher.deliver(url, SECRET, _event(n)) for n in range(events)))
+    finally:
+        await dispatcher.aclose()
+
+
+def run(events: int, concurrency: int, delay_ms: float):
+    results = {}
+    for scenario, delay in (("fast", 0.0), ("slow", delay_ms / 1000)):
+        server, url, stats = start_receiver(delay)
+        try:
+            modes = (
+                ("unpooled", unpooled),
+                ("keepalive", lambda *a: pooled(*a, max_batch=1)),
+                ("dispatcher", pooled),
+            )
+            for name, fn in modes:
+                stats["requests"] = 0
+                start = time.perf_counter()
+                asyncio.run(fn(url, events, concurrency))
+                elapsed = time.perf_counter() - start
+                results[f"{scenario}/{name}"] = {
+                    "deliveries_per_s": events / elapsed,
+                    "requests": stats["requests"],
+                    "elapsed_s": elapsed,
+                }
+        finally:
+            server.shutdown()
+            server.server_close()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--events", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=4, help="requests in flight per endpoint")
+    parser.add_argument("--delay-ms", type=float, default=20, help="receiver latency in the slow scenario")
+    parser.add_argument("--json", action="store_true", help="emit machine-readable results")
+    args = parser.parse_args()
+
+    results = run(args.events, args.concurrency, args.delay_ms)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print(f"{args.events} events, {args.concurrency} in flight per endpoint")
+    for name, stats in results.items():
+        print(f"  {name:<20}  {stats['deliveries_per_s']:9.0f} deliveries/s   {stats['requests']:6d} requests")
+
+
+if __name__ == "__main__":
+    main()